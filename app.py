@@ -1,6 +1,8 @@
 from dash import Dash
 import dash_bootstrap_components as dbc
 
+from src.cache.background_jobs import create_background_callback_manager
+from src.cache.invalidation import start_invalidation_listener
 from src.layout.layout import create_layout
 from src.config.helpers import create_config_dic
 
@@ -14,6 +16,8 @@ from src.callbacks.pages.goals import register_goals_callbacks
 from src.callbacks.pages.daily_reflection import register_daily_reflection_callbacks
 from src.callbacks.pages.patterns_trends import register_trends_callbacks
 from src.callbacks.pages.settings import register_settings_callbacks
+from src.callbacks.pages.task_history import register_task_history_callbacks
+from src.callbacks.pages.task_search import register_task_search_callbacks
 from src.callbacks.overlays import register_overlays_callbacks
 from src.callbacks.navigation import register_navigation_callbacks
 
@@ -27,10 +31,13 @@ app = Dash(
         "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.css",
     ],
     suppress_callback_exceptions=True,
+    # Slow analytics (e.g. all-time trends) run as background jobs, off the request workers
+    background_callback_manager=create_background_callback_manager(),
 )
 
 app.title = "Productivity System"
-app.layout = create_layout()
+# Served per page load, so importing the app runs no queries
+app.layout = create_layout
 
 # Register callbacks
 register_layout_callbacks(app)
@@ -43,8 +50,13 @@ register_daily_reflection_callbacks(app)
 register_goals_callbacks(app)
 register_trends_callbacks(app)
 register_settings_callbacks(app)
+register_task_history_callbacks(app)
+register_task_search_callbacks(app)
 register_overlays_callbacks(app)
 register_navigation_callbacks(app)
 
+# Evict this worker's local cache when another worker writes
+start_invalidation_listener()
+
 if __name__ == "__main__":
     app.run_server(debug=True)
@@ -0,0 +1,85 @@
+// Daily metrics inputs: parse and re-format each entry in the browser, driven
+// by the daily-metrics-specs store, so typing costs no requests. Mirrors
+// hmm_to_minutes / _normalize_metric_value (src/callbacks/pages/daily_metrics.py)
+// and minutes_to_hmm; the server normalizes again on save.
+
+(function () {
+    const HMM_RE = /^\s*(\d+):([0-5]\d)\s*$/;  // h:mm with mm = 00–59
+    const NUM_RE = /^\s*\d+(\.\d+)?\s*$/;      // integer or float
+    // float(str): decimal literal with optional underscores and exponent, or inf/nan
+    const FLOAT_RE = /^[+-]?(\d+(_\d+)*\.?(\d+(_\d+)*)?|\.\d+(_\d+)*)([eE][+-]?\d+(_\d+)*)?$/;
+    const SPECIAL_FLOAT_RE = /^[+-]?(inf|infinity|nan)$/i;
+
+    function isBlank(value) {
+        return value === null || value === undefined || value === "";
+    }
+
+    function hmmToMinutes(value) {
+        if (value === null || value === undefined) return null;
+        if (typeof value === "number") return value;
+
+        const s = String(value).trim();
+        if (s === "") return null;
+
+        const match = HMM_RE.exec(s);
+        if (match) return Number(match[1]) * 60 + Number(match[2]);
+        if (NUM_RE.test(s)) return Number(s);
+        return null;
+    }
+
+    // Python float(): number, or null if it would raise
+    function toFloat(value) {
+        if (typeof value === "number") return value;
+        if (typeof value !== "string") return null;
+        const s = value.trim();
+        if (SPECIAL_FLOAT_RE.test(s)) return NaN;
+        return FLOAT_RE.test(s) ? Number(s.replace(/_/g, "")) : null;
+    }
+
+    function normalizeMetricValue(raw, spec) {
+        if (isBlank(raw)) return null;
+
+        if (spec.is_duration) {
+            const minutes = hmmToMinutes(raw);
+            return minutes !== null && minutes > 0 ? minutes : null;
+        }
+
+        const value = toFloat(raw);
+        if (value === null || !Number.isFinite(value) || value < 0) return null;
+        if ((spec.value_type || "double") === "int") return Number.isInteger(value) ? value : null;
+        return value;
+    }
+
+    // round() with ties to even, as Python does
+    function roundHalfEven(value) {
+        const rounded = Math.round(value);
+        return Math.abs(value % 1) === 0.5 ? 2 * Math.round(value / 2) : rounded;
+    }
+
+    function minutesToHmm(minutes) {
+        const total = roundHalfEven(minutes);
+        return `${Math.floor(total / 60)}:${String(total % 60).padStart(2, "0")}`;
+    }
+
+    function formatMetricValue(raw, spec) {
+        const value = normalizeMetricValue(raw, spec);
+        if (value === null) return null;
+        return spec.is_duration ? minutesToHmm(value) : value;
+    }
+
+    function normalize(values, metricSpecs) {
+        const inputs = window.dash_clientside.callback_context.inputs_list[0];
+        let changed = false;
+        const formatted = inputs.map((input, i) => {
+            const spec = (metricSpecs || {})[input.id.name] || {};
+            const value = formatMetricValue(values[i], spec);
+            if (value !== (values[i] ?? null)) changed = true;
+            return value;
+        });
+        return changed ? formatted : window.dash_clientside.no_update;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        daily_metrics: {normalize: normalize},
+    });
+})();
@@ -0,0 +1,54 @@
+// Prev/next buttons of date_cycler_row: shift the page's date input in the
+// browser so the page's data callback starts without a round-trip first.
+// Same semantics as the server callbacks they replace: step from the current
+// value, or from the default date if it is empty or not an ISO date. The step
+// and default date come from register_date_cycler; the direction from which
+// button fired (the first input is the previous button).
+
+(function () {
+    function parseIsoDate(value) {
+        if (typeof value !== "string") return null;
+        const match = /^(\d{4})-(\d{2})-(\d{2})$/.exec(value);
+        if (!match) return null;
+        const [year, month, day] = [Number(match[1]), Number(match[2]), Number(match[3])];
+        const parsed = new Date(Date.UTC(year, month - 1, day));
+        if (parsed.getUTCMonth() !== month - 1 || parsed.getUTCDate() !== day) return null;
+        return parsed;
+    }
+
+    function today() {
+        const now = new Date();
+        return new Date(Date.UTC(now.getFullYear(), now.getMonth(), now.getDate()));
+    }
+
+    function addDays(day, n) {
+        return new Date(day.getTime() + n * 86400000);
+    }
+
+    function direction() {
+        const context = window.dash_clientside.callback_context || {};
+        const triggered = context.triggered || [];
+        if (!triggered.length || !context.inputs_list) return 0;
+        const propId = triggered[0].prop_id || "";
+        const prevId = context.inputs_list[0].id;
+        let triggeredId;
+        try {
+            triggeredId = JSON.parse(propId.slice(0, propId.lastIndexOf(".")));
+        } catch (e) {
+            return 0;
+        }
+        return triggeredId.name === prevId.name ? -1 : 1;
+    }
+
+    function cycle(selectedDate, stepDays, defaultOffsetDays) {
+        const sign = direction();
+        if (!sign) return window.dash_clientside.no_update;
+
+        const base = parseIsoDate(selectedDate) || addDays(today(), defaultOffsetDays);
+        return addDays(base, sign * stepDays).toISOString().slice(0, 10);
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        date_cycler: {cycle: cycle},
+    });
+})();
@@ -0,0 +1,137 @@
+// Task form (log time + edit modal): field validation, duration placeholders
+// and the 2-hour warning, computed in the browser so typing costs no requests.
+// Mirrors TaskTimeFields (src/helpers/task_times.py); the server re-validates
+// on save.
+
+(function () {
+    const TWO_HOURS_MIN = 120;
+    const WARNING_TEXT = "Warning: entry exceeds 2 hours.";
+
+    function isBlank(value) {
+        return value === null || value === undefined || value === "";
+    }
+
+    // strptime("%Y-%m-%d") -> days since epoch, or null
+    function parseDate(value) {
+        if (typeof value !== "string") return null;
+        const match = /^(\d{4})-(\d{1,2})-(\d{1,2})$/.exec(value);
+        if (!match) return null;
+        const [year, month, day] = [Number(match[1]), Number(match[2]), Number(match[3])];
+        const ms = Date.UTC(year, month - 1, day);
+        const parsed = new Date(ms);
+        if (parsed.getUTCFullYear() !== year || parsed.getUTCMonth() !== month - 1 || parsed.getUTCDate() !== day) {
+            return null;
+        }
+        return ms / 86400000;
+    }
+
+    // strptime("%H:%M") -> minutes after midnight, or null
+    function parseTime(value) {
+        if (typeof value !== "string") return null;
+        const match = /^(\d{1,2}):(\d{1,2})$/.exec(value);
+        if (!match) return null;
+        const [hour, minute] = [Number(match[1]), Number(match[2])];
+        if (hour > 23 || minute > 59) return null;
+        return hour * 60 + minute;
+    }
+
+    // int(value) -> integer, or null if Python's int() would raise
+    function parseInt_(value) {
+        if (typeof value === "number") return Number.isFinite(value) ? Math.trunc(value) : null;
+        if (typeof value !== "string") return null;
+        const match = /^\s*([+-]?\d+(?:_\d+)*)\s*$/.exec(value);
+        return match ? Number(match[1].replace(/_/g, "")) : null;
+    }
+
+    // Minutes since epoch (naive, no DST), or null unless both parts are valid
+    function combine(date, time) {
+        const day = parseDate(date);
+        const minute = parseTime(time);
+        return day === null || minute === null ? null : day * 1440 + minute;
+    }
+
+    function validateTaskFields(startDate, startTime, endDate, endTime, hours, minutes) {
+        // --- per-field validation (only non-empty values can be invalid) ---
+        let invStartDate = !isBlank(startDate) && parseDate(startDate) === null;
+        let invEndDate = !isBlank(endDate) && parseDate(endDate) === null;
+        let invStartTime = !isBlank(startTime) && parseTime(startTime) === null;
+        let invEndTime = !isBlank(endTime) && parseTime(endTime) === null;
+
+        const hVal = isBlank(hours) ? null : parseInt_(hours);
+        const mVal = isBlank(minutes) ? null : parseInt_(minutes);
+        let invHours = !isBlank(hours) && (hVal === null || hVal < 0);
+        let invMinutes = !isBlank(minutes) && (mVal === null || mVal < 0 || mVal > 59);
+
+        // --- cross-field checks ---
+        const start = combine(startDate, startTime);
+        const end = combine(endDate, endTime);
+        const span = start !== null && end !== null ? end - start : null;
+
+        if (span !== null && span <= 0) {
+            invStartDate = invStartTime = invEndDate = invEndTime = true;
+        }
+        if (span !== null && span > 0 && (!isBlank(hours) || !isBlank(minutes)) && !invHours && !invMinutes) {
+            if (hVal !== null && hVal !== Math.floor(span / 60)) invHours = true;
+            if (mVal !== null && mVal !== span % 60) invMinutes = true;
+        }
+
+        // --- duration for the warning: entered if any, else start -> end ---
+        let durationMin = null;
+        if (hVal !== null || mVal !== null) {
+            const total = (hVal || 0) * 60 + (mVal || 0);
+            if (total > 0) durationMin = total;
+        } else if (span !== null && span > 0) {
+            durationMin = span;
+        }
+
+        const anyInvalid = invStartDate || invStartTime || invEndDate || invEndTime || invHours || invMinutes;
+        const warn = durationMin !== null && durationMin > TWO_HOURS_MIN && !anyInvalid;
+        const warnClass = warn ? "warning" : "";
+
+        let placeholderHours = "";
+        let placeholderMinutes = "";
+        if (span !== null && span > 0) {
+            placeholderHours = String(Math.floor(span / 60));
+            placeholderMinutes = String(span % 60).padStart(2, "0");
+        }
+
+        return [
+            invStartDate, invStartTime, invEndDate, invEndTime, invHours, invMinutes,
+            warnClass, warnClass, warn ? WARNING_TEXT : "", placeholderHours, placeholderMinutes,
+        ];
+    }
+
+    // Start date changed: move the end date with it, one day later when the
+    // times wrap past midnight
+    function syncEndDate(startDate, startTime, endTime) {
+        const day = parseDate(startDate);
+        if (day === null) return window.dash_clientside.no_update;
+        if (startTime && endTime && startTime > endTime) {
+            return new Date((day + 1) * 86400000).toISOString().slice(0, 10);
+        }
+        return startDate;
+    }
+
+    // Subcategory/activity typed so far, once typing pauses; superseded calls
+    // resolve to no_update so only the latest text reaches the server
+    const SUGGEST_DEBOUNCE_MS = 250;
+    const suggestionSeq = {};
+
+    function suggestionQuery(subcategory, activity) {
+        const key = JSON.stringify(window.dash_clientside.callback_context.outputs_list.id);
+        const seq = (suggestionSeq[key] || 0) + 1;
+        suggestionSeq[key] = seq;
+        const query = {subcategory: subcategory || "", activity: activity || ""};
+        return new Promise((resolve) => setTimeout(() => {
+            resolve(suggestionSeq[key] === seq ? query : window.dash_clientside.no_update);
+        }, SUGGEST_DEBOUNCE_MS));
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        task_form: {
+            validate: validateTaskFields,
+            sync_end_date: syncEndDate,
+            suggestion_query: suggestionQuery,
+        },
+    });
+})();
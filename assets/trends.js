@@ -0,0 +1,124 @@
+// Patterns & Trends category bars: range buttons, their highlight and the
+// bar figure, all assembled in the browser from the task summary store so
+// switching range or category costs no requests.
+//
+// Store contract (see _compute_task_summary_data):
+//   summary[String(days)] = {
+//       horizon_days, days_present,
+//       by_category_hours: {<category_id>: <total_hours>},
+//       by_subcategory_hours: {<category_id>: {<subcategory>: <total_hours>}},
+//   }
+// Average weekly time is total_hours / days_present * 7. Range button ids map
+// to their horizon through trends-range-days-store (BUTTON_TO_DAYS in Python).
+
+(function () {
+    const RANGE_BUTTONS = ["btn-1", "btn-7", "btn-14", "btn-28", "btn-365", "btn-inf"];
+    const OTHER_LABEL = "Other (grouped)";
+
+    function triggeredId() {
+        const triggered = (window.dash_clientside.callback_context || {}).triggered || [];
+        if (!triggered.length) return null;
+        const propId = triggered[0].prop_id || "";
+        return propId.slice(0, propId.lastIndexOf("."));
+    }
+
+    function messageFigure(baseLayout, message) {
+        return {data: [], layout: {template: baseLayout.template, title: {text: message}}};
+    }
+
+    // [name, hours] pairs, largest first; categories sharing a name are summed
+    function categoryTotals(horizon, categoryNames) {
+        const totals = new Map();
+        for (const [categoryId, hours] of Object.entries(horizon.by_category_hours || {})) {
+            const name = categoryNames[categoryId];
+            if (name !== undefined && name !== null) totals.set(name, (totals.get(name) || 0) + Number(hours));
+        }
+        return Array.from(totals).sort((a, b) => b[1] - a[1]);
+    }
+
+    // Top subcategories largest first, then the grouped remainder. Sorted here
+    // because object keys that look like integers lose their stored order.
+    function subcategoryTotals(horizon, categoryId) {
+        const totals = ((horizon.by_subcategory_hours || {})[categoryId]) || {};
+        return Object.entries(totals).sort(
+            (a, b) => (a[0] === OTHER_LABEL) - (b[0] === OTHER_LABEL) || b[1] - a[1]
+        );
+    }
+
+    function yRange(values) {
+        const max = Math.max(...values);
+        return max > 0 ? {range: [0, max * 1.1]} : {};
+    }
+
+    function renderCategoryBars(rangeId, categoryId, summary, categoryNames, baseLayout, buttonToDays) {
+        if (!summary || !baseLayout || !buttonToDays) return window.dash_clientside.no_update;
+
+        const horizon = summary[String(buttonToDays[rangeId])];
+        if (!horizon) return messageFigure(baseLayout, "No data available for the selected time window.");
+
+        const daysPresent = Math.trunc(Number(horizon.days_present) || 0);
+        if (daysPresent <= 0) return messageFigure(baseLayout, "No data available in the selected time window.");
+
+        let totals, titleLeft, titleRight;
+        if (!categoryId || categoryId === "all") {
+            totals = categoryTotals(horizon, categoryNames || {});
+            titleLeft = "Total time by category";
+            titleRight = `Average time per week by category (over ${daysPresent} days)`;
+        } else {
+            totals = subcategoryTotals(horizon, categoryId);
+            const name = (categoryNames || {})[categoryId];
+            const suffix = typeof name === "string" && name.trim() ? ` (${name.trim()})` : "";
+            titleLeft = `Total time by subcategory${suffix}`;
+            titleRight = `Average time per week by subcategory${suffix} (over ${daysPresent} days)`;
+        }
+
+        if (!totals.length) return messageFigure(baseLayout, "No data available for the selected selection.");
+
+        const x = totals.map((kv) => kv[0]);
+        const yTotal = totals.map((kv) => Number(kv[1]));
+        const yAvg = yTotal.map((hours) => hours / daysPresent * 7);
+        const [leftAnnotation, rightAnnotation] = baseLayout.annotations;
+
+        return {
+            data: [
+                {
+                    type: "bar", x: x, y: yTotal,
+                    texttemplate: "%{y:.1f}", textposition: "outside",
+                    name: "Total Time", marker: {color: "skyblue"},
+                    xaxis: "x", yaxis: "y",
+                },
+                {
+                    type: "bar", x: x, y: yAvg,
+                    texttemplate: "%{y:.2f}", textposition: "outside",
+                    name: "Average Time", marker: {color: "lightgreen"},
+                    xaxis: "x2", yaxis: "y2",
+                },
+            ],
+            layout: Object.assign({}, baseLayout, {
+                yaxis: Object.assign({}, baseLayout.yaxis, yRange(yTotal)),
+                yaxis2: Object.assign({}, baseLayout.yaxis2, yRange(yAvg)),
+                annotations: [
+                    Object.assign({}, leftAnnotation, {text: titleLeft}),
+                    Object.assign({}, rightAnnotation, {text: titleRight}),
+                ],
+            }),
+        };
+    }
+
+    function updateRange() {
+        const rangeId = triggeredId();
+        return RANGE_BUTTONS.includes(rangeId) ? rangeId : window.dash_clientside.no_update;
+    }
+
+    function highlightButtons(activeId) {
+        return RANGE_BUTTONS.map((buttonId) => activeId !== buttonId);
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        trends: {
+            render_category_bars: renderCategoryBars,
+            update_range: updateRange,
+            highlight_buttons: highlightButtons,
+        },
+    });
+})();
@@ -0,0 +1,27 @@
+import os
+from pathlib import Path
+
+from dash import DiskcacheManager
+import diskcache
+
+# Job manager for Dash background callbacks.
+# A background callback runs in a child process instead of the request worker;
+# the browser polls for its result, so a slow computation (all-time trends,
+# full-history series) no longer holds a worker that other users need.
+# Job state and results pass through a diskcache directory shared by all
+# workers on the host (BACKGROUND_CACHE_PATH).
+#
+# The manager's own input-keyed memoization is not used: it cannot see the
+# user's data version. Results are cached in the shared result cache instead
+# (see cached_result), which the jobs read and write like any worker.
+
+DEFAULT_BACKGROUND_CACHE_PATH = Path("data") / "cache" / "background"
+
+# How often the browser polls a running job (ms)
+BACKGROUND_POLL_INTERVAL_MS = 250
+
+
+def create_background_callback_manager() -> DiskcacheManager:
+    path = Path(os.getenv("BACKGROUND_CACHE_PATH", DEFAULT_BACKGROUND_CACHE_PATH))
+    path.mkdir(parents=True, exist_ok=True)
+    return DiskcacheManager(diskcache.Cache(str(path)))
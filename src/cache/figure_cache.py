@@ -0,0 +1,53 @@
+from collections.abc import Callable, Hashable
+import json
+import logging
+import os
+from typing import Any
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.cache.result_cache import MemoryLRUBackend, result_cache_key
+from src.helpers.figure_encoding import figure_size_report
+
+# Memoized figures, keyed by (user, view, view parameters, data version).
+# Figures are stored as their serialized plotly JSON (parsed once into a plain
+# dict) in a per-process LRU, so a repeat interaction is a dict lookup: no
+# Plotly object construction, validation or re-serialization on the hot path.
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_figures = MemoryLRUBackend(
+    max_bytes=int(os.getenv("FIGURE_CACHE_MAX_BYTES", DEFAULT_FIGURE_CACHE_MAX_BYTES))
+)
+
+
+def cached_figure(
+    user_id: str,
+    view: str,
+    build: Callable[[], go.Figure | dict[str, Any]],
+    *,
+    params: Hashable = (),
+) -> dict[str, Any]:
+    """
+    Return the figure for (user, view, params) at the user's current data version,
+    building it on a miss. The returned dict is shared; treat it as read-only.
+    """
+    key = result_cache_key(user_id, f"fig:{view}", params)
+    figure = _figures.get(key)
+    if figure is not None:
+        return figure
+
+    figure_json = pio.to_json(build(), validate=False)
+    figure = json.loads(figure_json)
+    _figures.set(key, figure, size=len(figure_json))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        report = figure_size_report(figure)
+        logger.debug(
+            "Figure %s: %d bytes (layout %d, traces %s)",
+            view, report["total"], report["layout"], report["traces"],
+        )
+    return figure
@@ -0,0 +1,106 @@
+import json
+import logging
+import select
+import threading
+import time
+from typing import Any
+
+from src.cache.local_cache import clear_local_cache, evict_local_cache
+from src.data_access.db import load_sql_engine
+
+# Cross-worker invalidation.
+# change_log inserts fire NOTIFY on CHANGE_CHANNEL (see create_change_log_table),
+# so a write in any worker reaches every worker's listener. Each listener evicts
+# the matching entries from its own process-local cache.
+
+CHANGE_CHANNEL = "data_changes"
+
+_POLL_TIMEOUT_SECONDS = 30.0
+_BACKOFF_INITIAL_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 60.0
+
+logger = logging.getLogger(__name__)
+
+_listener_lock = threading.Lock()
+_listener_thread: threading.Thread | None = None
+
+
+def handle_change_notification(payload: str) -> int:
+    """Evict local cache entries for one NOTIFY payload. Returns entries removed."""
+    try:
+        change: dict[str, Any] = json.loads(payload)
+    except (TypeError, ValueError):
+        # Unknown payload: be safe and drop everything
+        clear_local_cache()
+        return 0
+
+    return evict_local_cache(
+        user_id=change.get("user_id"),
+        entity=change.get("entity"),
+        date=change.get("date"),
+    )
+
+
+def _listen_until_error() -> None:
+    conn = load_sql_engine().raw_connection()
+    conn.detach()  # long-lived; keep it out of the request pool
+    try:
+        dbapi_conn = conn.driver_connection
+        dbapi_conn.autocommit = True
+        with dbapi_conn.cursor() as cur:
+            cur.execute(f"LISTEN {CHANGE_CHANNEL};")
+
+        # Notifications sent while we were disconnected are lost
+        clear_local_cache()
+        logger.info("Listening for cache invalidations on '%s'", CHANGE_CHANNEL)
+
+        while True:
+            ready, _, _ = select.select([dbapi_conn], [], [], _POLL_TIMEOUT_SECONDS)
+            if not ready:
+                # Heartbeat so a dead connection surfaces as an error
+                with dbapi_conn.cursor() as cur:
+                    cur.execute("SELECT 1;")
+                continue
+
+            dbapi_conn.poll()
+            while dbapi_conn.notifies:
+                notify = dbapi_conn.notifies.pop(0)
+                handle_change_notification(notify.payload)
+    finally:
+        conn.close()
+
+
+def _listen_forever() -> None:
+    backoff = _BACKOFF_INITIAL_SECONDS
+    while True:
+        started = time.monotonic()
+        try:
+            _listen_until_error()
+        except Exception:
+            logger.warning("Cache invalidation listener disconnected; retrying in %.0fs", backoff, exc_info=True)
+
+        # Reset backoff after a connection that stayed up for a while
+        if time.monotonic() - started > _BACKOFF_MAX_SECONDS:
+            backoff = _BACKOFF_INITIAL_SECONDS
+
+        time.sleep(backoff)
+        backoff = min(backoff * 2, _BACKOFF_MAX_SECONDS)
+
+
+def start_invalidation_listener() -> threading.Thread:
+    """
+    Start the per-process listener thread (idempotent).
+
+    Call this in each worker process after forking (e.g., not under gunicorn --preload).
+    While disconnected, the local cache TTL bounds staleness.
+    """
+    global _listener_thread
+    with _listener_lock:
+        if _listener_thread is None or not _listener_thread.is_alive():
+            _listener_thread = threading.Thread(
+                target=_listen_forever,
+                name="cache-invalidation-listener",
+                daemon=True,
+            )
+            _listener_thread.start()
+        return _listener_thread
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from datetime import date as Date
+import threading
+import time
+from typing import Any
+
+# Process-local result cache.
+# Entries are scoped by user and tagged with the entities (and optionally the
+# dates) they were derived from, so a change notification can evict only what
+# it affects. The TTL bounds staleness if change notifications are missed;
+# the entry cap bounds memory (least recently used entries go first).
+
+LOCAL_CACHE_TTL_SECONDS = 300.0
+LOCAL_CACHE_MAX_ENTRIES = 2048
+
+# Entities whose writes change analytics results (see change_log.entity)
+ANALYTICS_ENTITIES = frozenset({"task", "daily_metrics", "metric_definitions", "user_categories"})
+
+_lock = threading.Lock()
+_entries: OrderedDict[tuple[str, str, Hashable], dict[str, Any]] = OrderedDict()
+
+# Bumped by every eviction; a value computed across an eviction may predate
+# the write that caused it, so it is returned but not stored
+_generation = 0
+
+
+def _date_str(value: Date | str | None) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, Date):
+        return value.isoformat()
+    return str(value)
+
+
+def local_cached(
+    user_id: str,
+    name: str,
+    compute: Callable[[], Any],
+    *,
+    params: Hashable = (),
+    entities: Iterable[str] = ANALYTICS_ENTITIES,
+    dates: Iterable[Date | str] | None = None,
+    ttl_seconds: float = LOCAL_CACHE_TTL_SECONDS,
+) -> Any:
+    """
+    Return the cached value for (user_id, name, params), computing it on a miss.
+
+    entities: change_log entities the value depends on.
+    dates:    if given, only changes on these dates evict the entry;
+              None means any date of the listed entities does.
+
+    Cached values are shared between callers; treat them as read-only.
+    """
+    key = (str(user_id), name, params)
+    now = time.monotonic()
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry["expires_at"] > now:
+            _entries.move_to_end(key)
+            return entry["value"]
+        generation = _generation
+
+    value = compute()
+
+    with _lock:
+        if _generation != generation:
+            return value
+        _entries[key] = {
+            "value": value,
+            "entities": frozenset(entities),
+            "dates": None if dates is None else frozenset(_date_str(d) for d in dates),
+            "expires_at": now + ttl_seconds,
+        }
+        _entries.move_to_end(key)
+        while len(_entries) > LOCAL_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return value
+
+
+def evict_local_cache(
+    user_id: str | None = None,
+    entity: str | None = None,
+    date: Date | str | None = None,
+) -> int:
+    """
+    Evict entries matching a change. None acts as a wildcard for each argument.
+    Returns the number of entries removed.
+    """
+    global _generation
+    user_key = None if user_id is None else str(user_id)
+    date_key = _date_str(date)
+    now = time.monotonic()
+
+    with _lock:
+        _generation += 1
+        stale = [
+            key
+            for key, entry in _entries.items()
+            if entry["expires_at"] <= now
+            or (
+                (user_key is None or key[0] == user_key)
+                and (entity is None or entity in entry["entities"])
+                and (date_key is None or entry["dates"] is None or date_key in entry["dates"])
+            )
+        ]
+        for key in stale:
+            del _entries[key]
+    return len(stale)
+
+
+def clear_local_cache() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
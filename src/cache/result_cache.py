@@ -0,0 +1,285 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+import hashlib
+import logging
+import os
+from pathlib import Path
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.cache.local_cache import local_cached
+from src.data_access.db import get_latest_change_seq
+
+# Shared result cache for analytics results (trend stores, weekly pivots, figures).
+#
+# Backend is chosen by RESULT_CACHE_BACKEND:
+#   - "memory": per-process LRU (fast, but duplicated per worker and cold after restart)
+#   - "disk":   SQLite file shared by all workers on the host; survives restarts (default)
+#   - "redis":  any Redis-protocol server at RESULT_CACHE_REDIS_URL (falls back to disk
+#               if the redis package is not installed); size eviction is left to the
+#               server's maxmemory policy
+#
+# Keys are scoped by user and data version (the user's latest change_log seq_id), so a
+# write makes old entries unreachable in every worker; they then age out under the
+# byte budget instead of needing explicit invalidation.
+
+DEFAULT_CACHE_PATH = Path("data") / "cache" / "results.sqlite"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ITEM_BYTES = 16 * 1024 * 1024
+
+# SQLite backend: a hit refreshes its LRU timestamp at most this often, and the
+# byte budget is checked every few sets (or after enough bytes), so reads and
+# most writes don't take the file's write lock / scan the table
+_TOUCH_INTERVAL_SECONDS = 60.0
+_BUDGET_CHECK_EVERY_SETS = 32
+_BUDGET_CHECK_BYTES_FRACTION = 16
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryLRUBackend:
+    """
+    In-process LRU bounded by total value size in bytes.
+    Values are normally bytes; other objects can be stored by passing their size explicitly.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: Any, size: int | None = None) -> None:
+        size = len(value) if size is None else size
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._items[key] = (value, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._items:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._items if k.startswith(prefix)]:
+                self._total_bytes -= self._items.pop(key)[1]
+
+
+class SQLiteBackend:
+    """SQLite-file LRU shared by all processes on the host, bounded by total bytes."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._budget_lock = threading.Lock()
+        self._sets_since_check = 0
+        self._bytes_since_check = 0
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS result_cache (
+                    key         TEXT PRIMARY KEY,
+                    value       BLOB NOT NULL,
+                    size        INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_result_cache_accessed ON result_cache (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> bytes | None:
+        conn = self._connect()
+        row = conn.execute("SELECT value, accessed_at FROM result_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > _TOUCH_INTERVAL_SECONDS:
+            conn.execute("UPDATE result_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        conn = self._connect()
+        conn.execute(
+            """
+            INSERT INTO result_cache (key, value, size, accessed_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE
+            SET value = excluded.value, size = excluded.size, accessed_at = excluded.accessed_at
+            """,
+            (key, value, len(value), time.time()),
+        )
+        with self._budget_lock:
+            self._sets_since_check += 1
+            self._bytes_since_check += len(value)
+            due = (
+                self._sets_since_check >= _BUDGET_CHECK_EVERY_SETS
+                or self._bytes_since_check >= self.max_bytes // _BUDGET_CHECK_BYTES_FRACTION
+            )
+            if due:
+                self._sets_since_check = self._bytes_since_check = 0
+        if due:
+            self._enforce_budget(conn)
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM result_cache").fetchone()[0]
+        while total > self.max_bytes:
+            # Drop least recently used rows in small batches until under budget
+            rows = conn.execute(
+                "SELECT key, size FROM result_cache ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                return
+            for key, size in rows:
+                conn.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                total -= size
+                if total <= self.max_bytes:
+                    return
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        self._connect().execute(
+            "DELETE FROM result_cache WHERE key LIKE ? ESCAPE '\\'",
+            (escaped + "%",),
+        )
+
+
+class RedisBackend:
+    """Redis-protocol backend; memory bounds come from the server's maxmemory policy."""
+
+    def __init__(self, url: str, ttl_seconds: int | None = None) -> None:
+        import redis  # optional dependency; only needed when configured
+
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._client.set(key, value, ex=self.ttl_seconds)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self._client.scan_iter(match=f"{prefix}*", count=500))
+        if keys:
+            self._client.delete(*keys)
+
+
+CacheBackend = MemoryLRUBackend | SQLiteBackend | RedisBackend
+
+
+def result_cache_backend_kind() -> str:
+    """Configured backend name (RESULT_CACHE_BACKEND), without opening it."""
+    return os.getenv("RESULT_CACHE_BACKEND", "disk").strip().lower()
+
+
+@lru_cache(maxsize=1)
+def get_result_cache_backend() -> CacheBackend:
+    # Cached load of the configured backend from the environment
+    kind = result_cache_backend_kind()
+    max_bytes = int(os.getenv("RESULT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+    if kind == "redis":
+        url = os.getenv("RESULT_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        try:
+            return RedisBackend(url)
+        except ImportError:
+            logger.warning("RESULT_CACHE_BACKEND=redis but the redis package is not installed; using disk")
+            kind = "disk"
+
+    if kind == "memory":
+        return MemoryLRUBackend(max_bytes=max_bytes)
+
+    return SQLiteBackend(os.getenv("RESULT_CACHE_PATH", DEFAULT_CACHE_PATH), max_bytes=max_bytes)
+
+
+# Backends a forked child inherited from its parent; kept referenced so their
+# connections are never closed (or garbage collected) from the child
+_inherited_backends: list[CacheBackend] = []
+
+
+def _reset_after_fork() -> None:
+    # A forked child (background callback job, warm_caches worker) must open its
+    # own cache connection instead of sharing the parent's SQLite handle
+    if get_result_cache_backend.cache_info().currsize:
+        _inherited_backends.append(get_result_cache_backend())
+        get_result_cache_backend.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_data_version(user_id: str) -> int:
+    """
+    Current data version for a user (latest change_log seq_id).
+    Memoized in the local cache, which the invalidation listener evicts on writes.
+    """
+    return local_cached(user_id, "data_version", lambda: get_latest_change_seq(user_id))
+
+
+def result_cache_key(user_id: str, name: str, params: Hashable = (), version: int | None = None) -> str:
+    version = get_data_version(user_id) if version is None else version
+    digest = hashlib.sha1(repr(params).encode("utf-8")).hexdigest()[:16]
+    return f"{name}:{user_id}:v{version}:{digest}"
+
+
+def cached_result(
+    user_id: str,
+    name: str,
+    compute: Callable[[], Any],
+    *,
+    params: Hashable = (),
+) -> Any:
+    """
+    Return the shared cached result for (user, data version, name, params),
+    computing and storing it on a miss. Values must be picklable; treat them as read-only.
+    Cache backend failures degrade to computing the result directly.
+    """
+    backend = get_result_cache_backend()
+    key = result_cache_key(user_id, name, params)
+
+    try:
+        blob = backend.get(key)
+    except Exception:
+        logger.warning("Result cache read failed for %s", key, exc_info=True)
+        blob = None
+    if blob is not None:
+        return pickle.loads(blob)
+
+    value = compute()
+
+    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    max_item_bytes = int(os.getenv("RESULT_CACHE_MAX_ITEM_BYTES", DEFAULT_MAX_ITEM_BYTES))
+    if len(blob) <= max_item_bytes:
+        try:
+            backend.set(key, blob)
+        except Exception:
+            logger.warning("Result cache write failed for %s", key, exc_info=True)
+    return value
+
@@ -0,0 +1,178 @@
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from datetime import datetime
+import heapq
+import threading
+import time
+from typing import Any
+
+import pandas as pd
+
+from src.data_access.db import load_suggestion_scores
+
+# Process-local autocomplete index.
+# Per user, per (category, field): the distinct values they have logged,
+# ranked by frecency (uses weighted by recency). Built from task_data with one
+# query, then kept current by record_task_suggestions() after each new task, so
+# lookups (top values for the prefix typed so far) never touch the database.
+# An edit drops the user's index instead, since the old values' weight can't be
+# taken back exactly; the TTL picks up writes made by other workers (and deletions).
+
+SUGGESTION_FIELDS = ("subcategory", "activity")
+SUGGESTION_HALF_LIFE_DAYS = 30.0
+SUGGESTION_INDEX_TTL_SECONDS = 600.0
+SUGGESTION_LIMIT = 50
+
+_lock = threading.Lock()
+_indexes: dict[str, "SuggestionIndex"] = {}
+
+
+class _PrefixIndex:
+    """Distinct values kept sorted by casefolded text for prefix range scans."""
+
+    __slots__ = ("keys", "entries")
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.entries: dict[str, list[Any]] = {}  # folded -> [display value, score]
+
+    def add(self, value: str, weight: float) -> None:
+        folded = value.casefold()
+        entry = self.entries.get(folded)
+        if entry is None:
+            self.entries[folded] = [value, weight]
+            insort(self.keys, folded)
+        else:
+            # Latest spelling wins, as in load_suggestion_scores
+            entry[0] = value
+            entry[1] += weight
+
+    def top(self, prefix: str, limit: int) -> list[str]:
+        if not prefix:
+            candidates = self.entries.values()
+        else:
+            folded = prefix.casefold()
+            i = bisect_left(self.keys, folded)
+            candidates = []
+            while i < len(self.keys) and self.keys[i].startswith(folded):
+                candidates.append(self.entries[self.keys[i]])
+                i += 1
+        return [entry[0] for entry in heapq.nlargest(limit, candidates, key=lambda e: e[1])]
+
+
+class SuggestionIndex:
+    """
+    Frecency-ranked values for one user.
+
+    Scores are stored relative to `epoch` (see load_suggestion_scores), so a
+    new use just adds its weight; nothing is re-decayed as time passes.
+    """
+
+    __slots__ = ("epoch", "expires_at", "fields")
+
+    def __init__(self, epoch: datetime, expires_at: float) -> None:
+        self.epoch = epoch
+        self.expires_at = expires_at
+        self.fields: dict[tuple[int, str], _PrefixIndex] = {}
+
+    @classmethod
+    def build(cls, user_id: str) -> "SuggestionIndex":
+        index = cls(datetime.now(), time.monotonic() + SUGGESTION_INDEX_TTL_SECONDS)
+        scores = load_suggestion_scores(user_id, index.epoch, SUGGESTION_HALF_LIFE_DAYS)
+        for category_id, field, value, score in scores[["category_id", "field", "value", "score"]].itertuples(
+            index=False
+        ):
+            index._field(int(category_id), field).add(value, float(score))
+        return index
+
+    def _field(self, category_id: int, field: str) -> _PrefixIndex:
+        key = (category_id, field)
+        prefix_index = self.fields.get(key)
+        if prefix_index is None:
+            prefix_index = self.fields[key] = _PrefixIndex()
+        return prefix_index
+
+    def weight(self, used_at: datetime) -> float:
+        age = (used_at - self.epoch).total_seconds() / (SUGGESTION_HALF_LIFE_DAYS * 86400.0)
+        return 2.0 ** max(age, -1000.0)
+
+    def record(self, category_id: int, values: Mapping[str, Any], used_at: datetime) -> None:
+        weight = self.weight(used_at)
+        for field in SUGGESTION_FIELDS:
+            value = values.get(field)
+            if isinstance(value, str) and value.strip():
+                self._field(category_id, field).add(value.strip(), weight)
+
+    def suggest(self, category_id: int, field: str, prefix: str = "", limit: int = SUGGESTION_LIMIT) -> list[str]:
+        prefix_index = self.fields.get((category_id, field))
+        if prefix_index is None:
+            return []
+        return prefix_index.top(prefix.strip(), limit)
+
+
+def get_suggestion_index(user_id: str) -> SuggestionIndex:
+    key = str(user_id)
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None and index.expires_at > time.monotonic():
+            return index
+
+    index = SuggestionIndex.build(key)
+    with _lock:
+        _indexes[key] = index
+    return index
+
+
+def suggest(
+    user_id: str,
+    category_id: int | str | None,
+    field: str,
+    prefix: str = "",
+    limit: int = SUGGESTION_LIMIT,
+) -> list[str]:
+    """Most frecent values of `field` in the category starting with `prefix` (case-insensitive)."""
+    try:
+        category_id = int(category_id)
+    except (TypeError, ValueError):
+        return []
+    index = get_suggestion_index(user_id)
+    with _lock:
+        return index.suggest(category_id, field, prefix, limit)
+
+
+def _used_at(row: Mapping[str, Any]) -> datetime:
+    for key in ("start_at", "date"):
+        value = row.get(key)
+        if value is None or value == "":
+            continue
+        ts = pd.to_datetime(value, errors="coerce")
+        if not pd.isna(ts):
+            return ts.to_pydatetime().replace(tzinfo=None)
+    return datetime.now()
+
+
+def record_task_suggestions(user_id: str, row: Mapping[str, Any]) -> None:
+    """
+    Fold a saved task (insert_task/update_task row dict) into the user's index.
+    No-op if the index isn't built yet; the next build reads the task anyway.
+    """
+    try:
+        category_id = int(row.get("category_id"))
+    except (TypeError, ValueError):
+        return
+    used_at = _used_at(row)
+    with _lock:
+        index = _indexes.get(str(user_id))
+        if index is not None:
+            index.record(category_id, row, used_at)
+
+
+def invalidate_suggestion_index(user_id: str) -> None:
+    """Drop the user's index; the next lookup rebuilds it from task_data."""
+    with _lock:
+        _indexes.pop(str(user_id), None)
+
+
+def clear_suggestion_indexes() -> None:
+    with _lock:
+        _indexes.clear()
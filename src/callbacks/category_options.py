@@ -0,0 +1,22 @@
+from typing import Any
+
+from dash import Dash, Input, Output
+
+from src.helpers.general import get_category_layout
+
+
+def register_category_options(app: Dash, component_id: dict[str, Any], *, include_all_option: bool = False) -> None:
+    """
+    Fill a category dropdown/select once its page has rendered, so building the
+    page layout runs no query. The layout gives the component the static
+    options only (none, or "All Categories").
+    """
+
+    @app.callback(
+        Output(component_id, "options"),
+        Input("user-id", "data"),
+    )
+    def load_category_options(user_id):
+        if not user_id:
+            return [{"label": "All Categories", "value": "all"}] if include_all_option else []
+        return get_category_layout(user_id, include_all_option=include_all_option)
@@ -0,0 +1,29 @@
+from dash import Dash, Input, Output, State
+
+
+def register_date_cycler(
+    app: Dash,
+    page: str,
+    *,
+    prev_name: str,
+    next_name: str,
+    step_days: int,
+    default_offset_days: int = 0,
+) -> None:
+    """
+    Prev/next buttons of date_cycler_row(page, ...) shift the page's date input
+    by step_days clientside (assets/date_cycler.js), so the page's data callback
+    reacts to the new date without a round-trip first. An empty or invalid date
+    steps from today + default_offset_days (the page's default date).
+    """
+    app.clientside_callback(
+        # Binds this page's step; the stepping itself lives in the asset
+        f"""function (prevClicks, nextClicks, selectedDate) {{
+            return window.dash_clientside.date_cycler.cycle(selectedDate, {int(step_days)}, {int(default_offset_days)});
+        }}""",
+        Output({"page": page, "name": "date", "type": "date-input"}, "value"),
+        Input({"page": page, "name": prev_name, "type": "button"}, "n_clicks"),
+        Input({"page": page, "name": next_name, "type": "button"}, "n_clicks"),
+        State({"page": page, "name": "date", "type": "date-input"}, "value"),
+        prevent_initial_call=True,
+    )
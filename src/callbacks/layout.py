@@ -11,6 +11,8 @@ from src.layout.pages.goals import create_goals
 from src.layout.pages.log_time import create_task_form
 from src.layout.pages.patterns_trends import create_trends_page
 from src.layout.pages.settings import create_settings_page
+from src.layout.pages.task_history import create_task_history_page
+from src.layout.pages.task_search import create_task_search_page
 from src.layout.pages.weekly_summary import create_weekly_summary_page
 
 
@@ -26,6 +28,10 @@ def register_layout_callbacks(app: Dash) -> None:
             return create_task_form(user_id)
         if pathname in ("/daily_task_log", "/daily_tasks"):
             return create_daily_task_log_page(user_id)
+        if pathname == "/task_history":
+            return create_task_history_page(user_id)
+        if pathname == "/task_search":
+            return create_task_search_page(user_id)
         if pathname == "/daily_metrics":
             return html.Div(create_daily_metrics(user_id))  # pass user_id if needed
         if pathname == "/daily_reflection":
@@ -1,20 +1,48 @@
 # callbacks/today_summary.py
+import time
 from typing import Any
 
 from dash import ALL, Dash, Input, Output, State, ctx, html, no_update
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 
-from src.callbacks.overlays import populate_edit_task_modal
+from src.cache.suggestion_index import invalidate_suggestion_index
+from src.callbacks.overlays import build_edit_task_inputs, populate_edit_task_modal
 from src.data_access.db import delete_task_sql, load_task_db, update_task
+from src.helpers.formatting import format_clock
 from src.helpers.task_adapters import task_row_to_form_initial
 from src.helpers.update_events import build_update_event
-from src.layout.navigation import render_today_summary_table
+from src.layout.navigation import get_dcc_options, render_today_summary_table
 from src.layout.toasts import hide_toast, toast, update_toast
 from src.logic.navigation import get_recent_tasks, get_today_summary_payload
 
 
+# Edit form component name -> build_edit_task_inputs key
+_EDIT_FORM_FIELDS = {
+    "start-date": "start_date",
+    "start-time": "start_time",
+    "end-date": "end_date",
+    "end-time": "end_time",
+    "duration-hours": "hours",
+    "duration-minutes": "minutes",
+    "task-category": "category_id",
+    "task-subcategory": "subcategory",
+    "task-activity": "activity",
+    "task-notes": "notes",
+}
+
+
+def _edit_form_values(states: list[dict[str, Any]]) -> dict[str, Any]:
+    """Map the edit form's ALL-pattern State entries to form values by field name."""
+    return {
+        _EDIT_FORM_FIELDS[item["id"]["name"]]: item.get("value")
+        for item in states
+        if item["id"].get("name") in _EDIT_FORM_FIELDS
+    }
+
+
 def _triggered_all_value(input_index: int, triggered_id: dict) -> int:
     """
     Returns the value of the ALL Input corresponding to triggered_id.
@@ -32,8 +60,17 @@ def render_recent_task(df_recent: pd.DataFrame | None) -> Any:
     if df_recent is None or df_recent.empty:
         return html.Div(html.Small("No tasks to display.", className="text-muted"))
 
+    # Format each column once, then assemble items
+    time_labels = np.strings.add(
+        np.strings.add(format_clock(df_recent["start_at"], zero_pad_hour=True), " – "),
+        format_clock(df_recent["end_at"], zero_pad_hour=True),
+    ).tolist()
+    category_labels = (df_recent["category"].astype(str) + " / " + df_recent["subcategory"].astype(str)).tolist()
+
     items = []
-    for _, row in df_recent.iterrows():
+    for time_label, category_label, activity, task_id in zip(
+        time_labels, category_labels, df_recent["activity"].tolist(), df_recent["task_id"].tolist()
+    ):
         items.append(
             dbc.ListGroupItem(
                 html.Div(
@@ -42,15 +79,15 @@ def render_recent_task(df_recent: pd.DataFrame | None) -> Any:
                         html.Div(
                             [
                                 html.Div(
-                                    f"{row['start_at'].strftime('%I:%M %p')} – {row['end_at'].strftime('%I:%M %p')}",
+                                    time_label,
                                     className="small text-muted",
                                 ),
                                 html.Div(
-                                    f"{row['category']} / {row['subcategory']}",
+                                    category_label,
                                     className="fw-semibold small",
                                 ),
                                 html.Div(
-                                    row["activity"],
+                                    activity,
                                     className="small",
                                 ),
                             ],
@@ -62,13 +99,13 @@ def render_recent_task(df_recent: pd.DataFrame | None) -> Any:
                             [
                                 dbc.Button(
                                     html.I(className="bi bi-pencil"),
-                                    id={"page":"nav","type": "edit-task", "task_id": row["task_id"]},
+                                    id={"page":"nav","type": "edit-task", "task_id": task_id},
                                     className="icon-action-btn row-action",
                                     title="Edit",
                                 ),
                                 dbc.Button(
                                     html.I(className="bi bi-trash"),
-                                    id={"page":"nav","type": "delete-task", "task_id": row["task_id"]},
+                                    id={"page":"nav","type": "delete-task", "task_id": task_id},
                                     className="icon-action-btn row-action",
                                     title="Delete",
                                 ),
@@ -110,6 +147,24 @@ def register_navigation_callbacks(app: Dash) -> None:
         return summary, recent_tasks_layout, {"display": "block"}, {"display": "block"}
 
 
+    @app.callback(
+        Output("task-grid-action", "data"),
+        Output({"page": ALL, "name": "task-grid", "type": "task-grid"}, "active_cell"),
+        Input({"page": ALL, "name": "task-grid", "type": "task-grid"}, "active_cell"),
+        prevent_initial_call=True,
+    )
+    def dispatch_task_grid_action(active_cells):
+        # Grid action glyphs are cells, not buttons: turn a click into an action
+        # for the edit/delete flows below, then clear the cell so it can be clicked again
+        cell = ctx.triggered[0]["value"] if ctx.triggered else None
+        cleared = [None] * len(active_cells)
+        if not cell or cell.get("column_id") not in ("edit", "delete") or cell.get("row_id") is None:
+            return no_update, cleared
+
+        action = {"action": cell["column_id"], "task_id": int(cell["row_id"]), "ts": time.time()}
+        return action, cleared
+
+
     @app.callback(
         Output({"page": "edit-modal", "name": "edit-task", "type": "toast"}, "is_open"),
         Output({"page": "edit-modal", "name": "edit-task", "type": "toast"}, "children"),
@@ -122,26 +177,34 @@ def register_navigation_callbacks(app: Dash) -> None:
             Input({"page": ALL, "type": "edit-task", "task_id": ALL}, "n_clicks"),
             Input({"page": "edit-modal", "name": "cancel", "type": "button"}, "n_clicks"),
             Input({"page": "edit-modal", "name": "save-task", "type": "button"}, "n_clicks"),
+            Input("task-grid-action", "data"),
         ],
         [
-            State("edit-task-inputs", "data"),  # your {ready_to_save, entries}
+            # Edit form fields; ALL so the callback still fires before the form exists
+            State({"page": "edit-modal", "group": "task-input", "name": ALL, "type": ALL}, "value"),
             State("edit-task-id", "data"),
             State("user-id", "data"),
         ],
         prevent_initial_call=True,
     )
-    def handle_edit_task(n_clicks, n_cancel, n_save, edit_task_inputs, edit_task_id, user_id):
+    def handle_edit_task(n_clicks, n_cancel, n_save, grid_action, _form_values, edit_task_id, user_id):
         triggered_id = ctx.triggered_id
         if triggered_id is None:
             raise PreventUpdate
 
-        # Open edit modal from row button
+        # Open edit modal from row button or task grid
+        task_id = None
         if isinstance(triggered_id, dict) and triggered_id.get("type") == "edit-task":
             this_clicks = _triggered_all_value(0, triggered_id)
             if this_clicks <= 0:
                 raise PreventUpdate
-
             task_id = triggered_id["task_id"]
+        elif triggered_id == "task-grid-action":
+            if not grid_action or grid_action.get("action") != "edit":
+                raise PreventUpdate
+            task_id = grid_action["task_id"]
+
+        if task_id is not None:
             task_db = load_task_db(task_id)
             initial = task_row_to_form_initial(task_db)
             edit_task_layout = populate_edit_task_modal(user_id,initial)
@@ -154,13 +217,16 @@ def register_navigation_callbacks(app: Dash) -> None:
 
         # Save
         if isinstance(triggered_id, dict) and triggered_id.get("name") == "save-task":
-            if not edit_task_inputs:
-                # draft/validation store missing; keep modal open
+            form_values = _edit_form_values(ctx.states_list[0])
+            if not form_values:
+                # form missing; keep modal open
                 validation_error_t = toast("VALIDATION_ERROR")
                 return *update_toast(validation_error_t), no_update, no_update, no_update, no_update
 
+            edit_task_inputs = build_edit_task_inputs(user_id, form_values)
             if edit_task_inputs.get("ready_to_save") and edit_task_id is not None:
                 update_task(edit_task_id, edit_task_inputs.get("entries"), user_id)
+                invalidate_suggestion_index(user_id)  # the old values lose their use
                 updated_t = toast("TIME_UPDATED")
                 update_event = build_update_event(
                     event_type="update",
@@ -188,15 +254,22 @@ def register_navigation_callbacks(app: Dash) -> None:
             Input({"page": ALL, "type": "delete-task", "task_id": ALL}, "n_clicks"),
             Input("confirm-delete", "n_clicks"),
             Input("cancel-delete", "n_clicks"),
+            Input("task-grid-action", "data"),
         ],
         State("pending-delete-task-id", "data"),
         prevent_initial_call=True,
     )
-    def delete_modal_controller(delete_clicks, confirm_clicks, cancel_clicks, pending_task_id):
+    def delete_modal_controller(delete_clicks, confirm_clicks, cancel_clicks, grid_action, pending_task_id):
         triggered = ctx.triggered_id
         if triggered is None:
             raise PreventUpdate
 
+        # Trash glyph in a task grid -> same as the icon button
+        if triggered == "task-grid-action":
+            if not grid_action or grid_action.get("action") != "delete":
+                raise PreventUpdate
+            return *hide_toast(), True, grid_action["task_id"], no_update
+
         # 1) Trash icon clicked -> open modal and store task_id
         if isinstance(triggered, dict) and triggered.get("type") == "delete-task":
             this_clicks = _triggered_all_value(0, triggered)
@@ -226,6 +299,24 @@ def register_navigation_callbacks(app: Dash) -> None:
         raise PreventUpdate
 
 
+    @app.callback(
+        Output({"page": "nav", "name": "users", "type": "dropdown"}, "options"),
+        Output({"page": "nav", "name": "users", "type": "dropdown"}, "value"),
+        Input("url", "pathname"),
+        State({"page": "nav", "name": "users", "type": "dropdown"}, "options"),
+        State({"page": "nav", "name": "users", "type": "dropdown"}, "value"),
+    )
+    def load_users(_pathname, current_options, current_value):
+        # Fires with the first pathname after the (query-free) layout is served;
+        # later navigations keep the loaded list and the chosen user.
+        # Selects the first user, which feeds the user-id store below.
+        if current_options:
+            raise PreventUpdate
+        options = get_dcc_options()
+        values = [option["value"] for option in options]
+        value = current_value if current_value in values else (values[0] if values else None)
+        return options, value
+
     @app.callback(
         Output("user-id", "data"),
         Input({"page": "nav", "name": "users", "type": "dropdown"},"value")
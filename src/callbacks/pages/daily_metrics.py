@@ -1,7 +1,8 @@
+import math
 import re
 from typing import Any
 
-from dash import ALL, Dash, Input, Output, State, ctx
+from dash import ALL, ClientsideFunction, Dash, Input, Output, State, ctx
 from dash.exceptions import PreventUpdate
 from src.data_access.db import (
     get_daily_metrics_definitions,
@@ -11,6 +12,7 @@ from src.data_access.db import (
 )
 from src.helpers.general import minutes_to_hmm
 from src.helpers.update_events import build_update_event
+from src.layout.pages.daily_metrics import render_daily_metric_rows
 from src.layout.toasts import toast, update_toast
 from src.logic.pages.daily_metric import metric_specs_by_key
 
@@ -75,7 +77,7 @@ def _normalize_metric_value(raw: Any, spec: dict[str, Any]) -> float | int | Non
         v = float(raw)
     except (TypeError, ValueError):
         return None
-    if v < 0:
+    if not math.isfinite(v) or v < 0:
         return None
 
     value_type = str(spec.get("value_type") or "double")
@@ -86,72 +88,40 @@ def _normalize_metric_value(raw: Any, spec: dict[str, Any]) -> float | int | Non
 
 def register_daily_metrics_callbacks(app: Dash) -> None:
     @app.callback(
+        Output({"page": "daily-metrics", "name": "metric-rows", "type": "form"}, "children"),
         Output("daily-metrics-specs", "data"),
+        Input({"page": "daily-metrics", "name": "date", "type": "date-input"}, "value"),
         Input("user-id", "data"),
     )
-    def load_daily_metric_specs(user_id):
-        if not user_id:
-            return {}
-        return metric_specs_by_key(get_daily_metrics_definitions(user_id))
-
-    @app.callback(
-        Output(
-            {"page": "daily-metrics", "name": ALL, "type": "input"},
-            "value"
-        ),
-        Input(
-            {"page": "daily-metrics", "name": "date", "type": "date-input"},
-            "value"
-        ),
-        Input(
-            {"page": "daily-metrics", "name": ALL, "type": "input"},
-            "value"
-        ),
-        Input("user-id", "data"),
-        Input("daily-metrics-specs", "data"),
-    )
-    def load_metrics_for_date(selected_date, component_values, uuid, metric_specs):
-
-        if not selected_date:
+    def load_metrics_for_date(selected_date, uuid):
+        # Page data: the user's metric definitions and the date's values, rendered as input rows
+        if not selected_date or not uuid:
             raise PreventUpdate
 
-        triggered = ctx.triggered_id
-        load_from_db = (
-                triggered is None or
-                (isinstance(triggered, dict) and triggered.get("type") == "date-input")
-                or (isinstance(triggered, str) and triggered == "user-id")
-        )
-
-        if load_from_db:
-            current = get_daily_metrics_for_date(selected_date,uuid) or {}
-        else:
-            # component_values is the list of values for ALL inputs, same order as inputs_list[1]
-            in_all_specs = ctx.inputs_list[1]
-            current = {
-                spec["id"]["name"]: component_values[idx]
-                for idx, spec in enumerate(in_all_specs)
-            }
-
-        # ---- 2) Validate/normalize into canonical numeric values ----
-        validated = {}
-        for key, raw in current.items():
-            validated[key] = _normalize_metric_value(raw, _spec_for(metric_specs, key))
+        metrics_list = get_daily_metrics_definitions(uuid)
+        metric_specs = metric_specs_by_key(metrics_list)
+        current = get_daily_metrics_for_date(selected_date, uuid) or {}
 
-        # ---- 3) Build output list once, in output order ----
-        out_specs = ctx.outputs_list # for single Output(ALL,...), this is the list
-        values = []
-        for spec in out_specs:
-            metric_key = spec["id"]["name"]
-            v = validated.get(metric_key)
+        values = {}
+        for metric_key in metric_specs:
             metric_spec = _spec_for(metric_specs, metric_key)
+            v = _normalize_metric_value(current.get(metric_key), metric_spec)
 
             if metric_spec.get("is_duration"):
-                values.append(minutes_to_hmm(v) if v is not None else None)
+                values[metric_key] = minutes_to_hmm(v) if v is not None else None
             else:
-                values.append(v)
+                values[metric_key] = v
 
-        return values
+        return render_daily_metric_rows(metrics_list, values), metric_specs
 
+    # Typed values are parsed and re-formatted clientside (assets/daily_metrics.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="daily_metrics", function_name="normalize"),
+        Output({"page": "daily-metrics", "name": ALL, "type": "input"}, "value"),
+        Input({"page": "daily-metrics", "name": ALL, "type": "input"}, "value"),
+        State("daily-metrics-specs", "data"),
+        prevent_initial_call=True,
+    )
 
     @app.callback(
         Output({"page": "daily-metrics", "name": "save-metrics", "type": "toast"}, "is_open"),
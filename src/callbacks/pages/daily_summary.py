@@ -1,9 +1,9 @@
-from datetime import date, timedelta
-
-from dash import Dash, Input, Output, State, ctx, html
+from dash import Dash, Input, Output, html
 from dash.exceptions import PreventUpdate
 
-from src.helpers.general import fmt_h_m
+from src.cache.figure_cache import cached_figure
+from src.callbacks.date_cycler import register_date_cycler
+from src.helpers.formatting import format_h_m
 from src.logic.pages.daily_summary import (
     df_to_daily_html_table,
     get_subcategory_df_for_date,
@@ -14,30 +14,7 @@ from src.logic.pages.daily_summary import (
 def register_daily_summary_callbacks(app: Dash) -> None:
     page = "daily-summary"
 
-    @app.callback(
-        Output({"page": page, "name": "date", "type": "date-input"}, "value"),
-        Input({"page": page, "name": "prev-day", "type": "button"}, "n_clicks"),
-        Input({"page": page, "name": "next-day", "type": "button"}, "n_clicks"),
-        State({"page": page, "name": "date", "type": "date-input"}, "value"),
-        prevent_initial_call=True,
-    )
-    def cycle_daily_summary_date(_prev_clicks, _next_clicks, selected_date):
-        triggered = ctx.triggered_id
-        if not isinstance(triggered, dict):
-            raise PreventUpdate
-
-        try:
-            base_date = date.fromisoformat(selected_date) if selected_date else date.today()
-        except (TypeError, ValueError):
-            base_date = date.today()
-
-        source_name = triggered.get("name")
-        if source_name == "prev-day":
-            return (base_date - timedelta(days=1)).isoformat()
-        if source_name == "next-day":
-            return (base_date + timedelta(days=1)).isoformat()
-
-        raise PreventUpdate
+    register_date_cycler(app, page, prev_name="prev-day", next_name="next-day", step_days=1)
 
     @app.callback(
         Output({"page": page, "name": "subcategory-graph", "type": "graph"}, "figure"),
@@ -45,13 +22,18 @@ def register_daily_summary_callbacks(app: Dash) -> None:
         Input({"page": page, "name": "date", "type": "date-input"}, "value"),
         Input("user-id", "data"),
         Input("last-update", "data"),
-        prevent_initial_call=True,
     )
     def update_daily_summary(selected_date, user_id, _last_update):
         if not user_id or not selected_date:
             raise PreventUpdate
 
         combined = get_subcategory_df_for_date(user_id, selected_date)
-        table = df_to_daily_html_table(combined, fmt_h_m)
-
-        return make_stacked_subcategory_fig(combined), (table if table is not None else html.Div())
+        table = df_to_daily_html_table(combined, format_h_m)
+        fig = cached_figure(
+            user_id,
+            "daily_subcategories",
+            lambda: make_stacked_subcategory_fig(combined),
+            params=(selected_date,),
+        )
+
+        return fig, (table if table is not None else html.Div())
@@ -9,12 +9,21 @@ from src.logic.pages.goals import get_goal_set_id_for_offset, ensure_goal_set_id
 
 
 def register_goals_callbacks(app: Dash) -> None:
+    @app.callback(
+        Output({"page": "goals", "name": "goal-theme", "type": "dropdown"}, "options"),
+        Input("user-id", "data"),
+    )
+    def load_goal_themes(user_id):
+        if not user_id:
+            return []
+        return get_goals_themes(user_id)
+
     @app.callback(
         Output({"page": "goals", "name": "add-theme-modal", "type": "modal"}, "is_open"),
         Output({"page": "goals", "name": "new-theme-name", "type": "input"}, "value"),
         Output({"page": "goals", "name": "new-theme-error", "type": "alert"}, "is_open"),
         Output({"page": "goals", "name": "new-theme-error", "type": "alert"}, "children"),
-        Output({"page": "goals", "name": "goal-theme", "type": "dropdown"}, "options"),
+        Output({"page": "goals", "name": "goal-theme", "type": "dropdown"}, "options", allow_duplicate=True),
         Output({"page": "goals", "name": "goal-theme", "type": "dropdown"}, "value"),
         Output({"page": "goals", "name": "goals", "type": "toast"}, "is_open"),
         Output({"page": "goals", "name": "goals", "type": "toast"}, "children"),
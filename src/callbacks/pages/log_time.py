@@ -1,30 +1,26 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from dash import Dash, Input, Output, State, ctx, no_update
+from dash import ClientsideFunction, Dash, Input, Output, State, ctx, no_update
 from dash.exceptions import PreventUpdate
 import pandas as pd
 
+from src.cache.suggestion_index import record_task_suggestions
+from src.callbacks.category_options import register_category_options
+from src.callbacks.task_form import register_task_form_validation, register_task_suggestions
 from src.data_access.db import insert_task
-from src.helpers.general import determine_missing_times, get_category_from_id, get_category_id_list, is_valid_date
+from src.helpers.general import get_category_from_id, get_category_id_list, is_valid_date
+from src.helpers.task_times import TaskTimeFields
 from src.helpers.update_events import build_update_event
 from src.layout.toasts import hide_toast, toast, update_toast
-from src.logic.pages.log_time import validate_task_fields
 
 def register_log_time_callbacks(app: Dash) -> None:
     page = "log-time"
     group = "task-input"
 
-    # ---------- Update subcategory suggestions ----------
-    @app.callback(
-        Output("subcategory-suggestions", "children"),
-        Input({"page": page, "name": "task-category", "type": "dropdown"}, "value"),
-    )
-    def update_subcategories(selected_category):
-        if not selected_category:
-            raise PreventUpdate
+    register_category_options(app, {"page": page, "group": group, "name": "task-category", "type": "dropdown"})
 
-        # Todo: Add subcategory filled text based on and db
-        return []
+    # ---------- Subcategory / activity suggestions ----------
+    register_task_suggestions(app, page, group)
 
 
     # ---------- Handle form submission: update toast + clear fields ----------
@@ -51,7 +47,7 @@ def register_log_time_callbacks(app: Dash) -> None:
         [
             Input({"page": page, "name": "save-task", "type": "button"}, "n_clicks"),
             Input({"page": page, "name": "clear-task", "type": "button"}, "n_clicks"),
-            Input({"page": page, "group": group, "name": "start-date", "type": "input"}, "value"),
+            State({"page": page, "group": group, "name": "start-date", "type": "input"}, "value"),
             State({"page": page, "group": group, "name": "start-time", "type": "input"}, "value"),
             State({"page": page, "group": group, "name": "end-date", "type": "input"}, "value"),
             State({"page": page, "group": group, "name": "end-time", "type": "input"}, "value"),
@@ -96,32 +92,6 @@ def register_log_time_callbacks(app: Dash) -> None:
         else:
             source_name = str(triggered)
 
-        if source_name == "start-date":
-            if not is_valid_date(start_date):
-                raise PreventUpdate
-
-            new_end_date = start_date
-            if start_time and end_time and start_time > end_time:
-                start_day = datetime.strptime(start_date, "%Y-%m-%d")
-                new_end_date = (start_day + timedelta(days=1)).strftime("%Y-%m-%d")
-
-            return (
-                no_update,
-                no_update,
-                no_update,
-                new_end_date,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-                no_update,
-            )
-
         if source_name not in {"save-task", "clear-task"}:
             raise PreventUpdate
 
@@ -132,18 +102,14 @@ def register_log_time_callbacks(app: Dash) -> None:
 
         if source_name == "save-task":
 
-            # --- 1. Run field-level validation ---
-            invalid_flags = validate_task_fields(
-                start_date, start_time, end_date, end_time, hours, minutes,include_placeholders=False
-            )
-            has_field_error = any(invalid_flags)
+            # --- 1. Run field-level validation (fields parsed once for both steps) ---
+            time_fields = TaskTimeFields(start_date, start_time, end_date, end_time, hours, minutes)
+            has_field_error = time_fields.any_invalid
 
             # --- 2. Time / inference checks (only if basic validation passed) ---
             has_time_error = False
             if not has_field_error:
-                duration_min, start_at, end_at = determine_missing_times(
-                    start_date, start_time, end_date, end_time, hours, minutes
-                )
+                duration_min, start_at, end_at = time_fields.inferred()
 
                 # Guard against None before numeric comparison
                 if (
@@ -199,6 +165,7 @@ def register_log_time_callbacks(app: Dash) -> None:
             }
 
             insert_task(row_dict)
+            record_task_suggestions(user_id, row_dict)
             update_event = build_update_event(
                 event_type="create",
                 entity="task",
@@ -230,34 +197,15 @@ def register_log_time_callbacks(app: Dash) -> None:
 
         return (*toast_return, *cleared_values, update_event)
 
-    # ---------- Validation callback ----------
-    @app.callback(
-        [
-            # invalid flags
-            Output({"page": page, "group": group, "name": "start-date", "type": "input"}, "invalid"),
-            Output({"page": page, "group": group, "name": "start-time", "type": "input"}, "invalid"),
-            Output({"page": page, "group": group, "name": "end-date", "type": "input"}, "invalid"),
-            Output({"page": page, "group": group, "name": "end-time", "type": "input"}, "invalid"),
-            Output({"page": page, "group": group, "name": "duration-hours", "type": "input"}, "invalid"),
-            Output({"page": page, "group": group, "name": "duration-minutes", "type": "input"}, "invalid"),
-
-            # purely cosmetic warning surfaces
-            Output({"page": page, "group": group, "name": "duration-hours", "type": "input"}, "className"),
-            Output({"page": page, "group": group, "name": "duration-minutes", "type": "input"}, "className"),
-            Output({"page": page, "name": "duration-warning", "type": "text"}, "children"),
-
-            Output({"page": page, "group": group, "name": "duration-hours", "type": "input"}, "placeholder"),
-            Output({"page": page, "group": group, "name": "duration-minutes", "type": "input"}, "placeholder"),
-        ],
-        [
-            Input({"page": page, "group": group, "name": "start-date", "type": "input"}, "value"),
-            Input({"page": page, "group": group, "name": "start-time", "type": "input"}, "value"),
-            Input({"page": page, "group": group, "name": "end-date", "type": "input"}, "value"),
-            Input({"page": page, "group": group, "name": "end-time", "type": "input"}, "value"),
-            Input({"page": page, "group": group, "name": "duration-hours", "type": "input"}, "value"),
-            Input({"page": page, "group": group, "name": "duration-minutes", "type": "input"}, "value"),
-        ],
+    # ---------- Start date -> end date (clientside) ----------
+    app.clientside_callback(
+        ClientsideFunction(namespace="task_form", function_name="sync_end_date"),
+        Output({"page": page, "group": group, "name": "end-date", "type": "input"}, "value", allow_duplicate=True),
+        Input({"page": page, "group": group, "name": "start-date", "type": "input"}, "value"),
+        State({"page": page, "group": group, "name": "start-time", "type": "input"}, "value"),
+        State({"page": page, "group": group, "name": "end-time", "type": "input"}, "value"),
+        prevent_initial_call=True,
     )
 
-    def check_valid_times(start_date, start_time, end_date, end_time, hours, minutes):
-        return validate_task_fields(start_date, start_time, end_date, end_time, hours, minutes, include_placeholders=True)
+    # ---------- Validation callback (clientside; re-checked on save) ----------
+    register_task_form_validation(app, page, group)
@@ -1,63 +1,77 @@
 #Todo: cleaning up placeholder structure to add zeros to hours/minutes when the other is filled and the other two colums are not filled
 #Todo
 # - Logic for the track goals graphs??
-from dash import Dash, Input, Output, State, ctx
-from src.logic.pages.patterns_trends import plot_cat_from_store
+import datetime as dt
+from typing import Any
+
+from dash import ClientsideFunction, Dash, Input, Output, State
+from dash.exceptions import PreventUpdate
+
+from src.cache.background_jobs import BACKGROUND_POLL_INTERVAL_MS
+from src.cache.figure_cache import cached_figure
+from src.data_access.db import load_category_id_to_name
+from src.logic.pages.patterns_trends import (
+    build_trends_ts_figure,
+    get_full_trends_ts_figure,
+    get_task_summary_data,
+)
+
+# Progress bars shown while a background job runs
+_PROGRESS_SHOWN = {"height": "0.25rem"}
+_PROGRESS_HIDDEN = {"display": "none"}
+
+
+def _relayout_x_range(relayout_data: dict[str, Any] | None) -> tuple[str, str] | None:
+    """
+    Visible x window from dcc.Graph relayoutData; None means full range (autorange).
+    Raises PreventUpdate for relayout events that don't change the x window.
+    """
+    if not relayout_data:
+        raise PreventUpdate
+    if relayout_data.get("xaxis.autorange"):
+        return None
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        return relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]
+    if "xaxis.range" in relayout_data:
+        start, end = relayout_data["xaxis.range"]
+        return start, end
+    raise PreventUpdate
 
 
 def register_trends_callbacks(app: Dash) -> None:
     @app.callback(
-        Output("productivity-graph", "figure"),
-        [
-            Input("btn-inf", "n_clicks"),
-            Input("btn-365", "n_clicks"),
-            Input("btn-28", "n_clicks"),
-            Input("btn-14", "n_clicks"),
-            Input("btn-7", "n_clicks"),
-            Input("btn-1", "n_clicks"),
-            Input("category-dropdown", "value"),
-            State("date-range-store", "data"),
-            State("task-summary-store", "data"),
-            State("trends-category-dict-store", "data"),
-        ]
+        Output("task-summary-store", "data"),
+        Output("trends-category-dict-store", "data"),
+        Output("category-dropdown", "options"),
+        Input("user-id", "data"),
+        Input("last-update", "data"),
+        background=True,
+        progress=[Output("trends-progress", "value"), Output("trends-progress", "label")],
+        running=[(Output("trends-progress", "style"), _PROGRESS_SHOWN, _PROGRESS_HIDDEN)],
+        cancel=[Input("url", "pathname")],
+        interval=BACKGROUND_POLL_INTERVAL_MS,
     )
-    def update_productivity_graph(
-        n_inf,
-        n_365,
-        n_28,
-        n_14,
-        n_7,
-        n_1,
-        category_id,
-        date_value,
-        task_summary_store,
-        category_dict,
-    ):
-
-
-        # Default day range (if nothing triggered)
-        default_days = 1
-        button_to_days = {
-            "btn-1": 1,
-            "btn-7": 7,
-            "btn-14": 14,
-            "btn-28": 28,
-            "btn-365": 365,
-            "btn-inf": -1,
-        }
-
-        triggered_id = ctx.triggered_id  # None on initial call
-
-        if triggered_id in (None, "category-dropdown"):
-            num_days = button_to_days.get(date_value, default_days)
-        else:
-            num_days = button_to_days.get(triggered_id, default_days)
-
-        return plot_cat_from_store(
-            task_summary_store, category_dict, str(num_days), category_id=category_id if category_id != "all" else None
-        )
+    def load_trends_data(set_progress, user_id, _last_update):
+        # Page data for the category bars; one categories query serves names and options.
+        # Runs as a background job: the all-time horizon can take a while on a cold cache.
+        if not user_id:
+            raise PreventUpdate
 
-    @app.callback(
+        set_progress((10, "Summarizing task history"))
+        task_summary, _ = get_task_summary_data(user_id)
+
+        set_progress((80, "Loading categories"))
+        category_dict = load_category_id_to_name(user_id)
+        options = [{"label": "All Categories", "value": "all"}]
+        options += [{"label": name, "value": category_id} for category_id, name in category_dict.items()]
+
+        # Dropdown values arrive as strings
+        return task_summary, {str(k): v for k, v in category_dict.items()}, options
+
+    # Range buttons, their highlight and the category bars run in the browser
+    # (assets/trends.js) on the summary payload in task-summary-store
+    app.clientside_callback(
+        ClientsideFunction(namespace="trends", function_name="update_range"),
         Output("date-range-store", "data"),
         Input("btn-1", "n_clicks"),
         Input("btn-7", "n_clicks"),
@@ -65,28 +79,81 @@ def register_trends_callbacks(app: Dash) -> None:
         Input("btn-28", "n_clicks"),
         Input("btn-365", "n_clicks"),
         Input("btn-inf", "n_clicks"),
-        prevent_initial_call=True
+        prevent_initial_call=True,
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="trends", function_name="highlight_buttons"),
+        Output("btn-1", "outline"),
+        Output("btn-7", "outline"),
+        Output("btn-14", "outline"),
+        Output("btn-28", "outline"),
+        Output("btn-365", "outline"),
+        Output("btn-inf", "outline"),
+        Input("date-range-store", "data"),
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="trends", function_name="render_category_bars"),
+        Output("productivity-graph", "figure"),
+        Input("date-range-store", "data"),
+        Input("category-dropdown", "value"),
+        Input("task-summary-store", "data"),
+        State("trends-category-dict-store", "data"),
+        State("trends-bar-layout-store", "data"),
+        State("trends-range-days-store", "data"),
     )
-    def update_range(n1, n7, n14, n28, n365, ninf):
-        return ctx.triggered_id
 
     @app.callback(
-        [
-            Output("btn-1", "outline"),
-            Output("btn-7", "outline"),
-            Output("btn-14", "outline"),
-            Output("btn-28", "outline"),
-            Output("btn-365", "outline"),
-            Output("btn-inf", "outline"),
+        Output("ts-graph", "figure"),
+        Input("ts-resolution", "value"),
+        State("ts-graph", "relayoutData"),
+        State("user-id", "data"),
+        background=True,
+        running=[
+            (Output("trends-ts-progress", "style"), _PROGRESS_SHOWN, _PROGRESS_HIDDEN),
+            (Output("ts-resolution", "disabled"), True, False),
         ],
-        Input("date-range-store", "data"),
+        cancel=[Input("url", "pathname")],
+        interval=BACKGROUND_POLL_INTERVAL_MS,
+    )
+    def load_ts_figure(resolution, relayout_data, user_id):
+        # Initial render or resolution change: full history (background job), or the
+        # zoomed window at the new resolution
+        if not user_id:
+            raise PreventUpdate
+
+        resolution = resolution or "auto"
+        try:
+            x_range = _relayout_x_range(relayout_data)
+        except PreventUpdate:
+            x_range = None
+
+        if x_range is None:
+            return get_full_trends_ts_figure(user_id, resolution)
+        return build_trends_ts_figure(user_id, resolution, x_range=x_range)
+
+    @app.callback(
+        Output("ts-graph", "figure", allow_duplicate=True),
+        Input("ts-graph", "relayoutData"),
+        State("ts-resolution", "value"),
+        State("user-id", "data"),
+        prevent_initial_call=True,
     )
-    def highlight_buttons(active_id):
-        return [
-            active_id != "btn-1",
-            active_id != "btn-7",
-            active_id != "btn-14",
-            active_id != "btn-28",
-            active_id != "btn-365",
-            active_id != "btn-inf",
-        ]
+    def update_ts_window(relayout_data, resolution, user_id):
+        # Zoom/pan: read the visible window at the matching level. Stays in the request:
+        # windows read rollups, and the full figure is cached by load_ts_figure.
+        if not user_id:
+            raise PreventUpdate
+
+        resolution = resolution or "auto"
+        x_range = _relayout_x_range(relayout_data)
+        if x_range is None:
+            return cached_figure(
+                user_id,
+                "trends_ts",
+                lambda: get_full_trends_ts_figure(user_id, resolution),
+                params=(dt.date.today().isoformat(), resolution),
+            )
+
+        return build_trends_ts_figure(user_id, resolution, x_range=x_range)
@@ -0,0 +1,72 @@
+from dash import Dash, Input, Output, Patch, State, ctx
+from dash.exceptions import PreventUpdate
+
+from src.callbacks.category_options import register_category_options
+from src.data_access.db import load_task_history_page
+from src.layout.pages.task_history import TASK_HISTORY_PAGE, task_history_status
+from src.layout.shared_components.tables import task_grid_records
+
+
+def register_task_history_callbacks(app: Dash) -> None:
+    page = TASK_HISTORY_PAGE
+
+    def filter_id(name: str) -> dict[str, str]:
+        return {"page": page, "name": name, "type": "filter"}
+
+    load_more_id = {"page": page, "name": "load-more", "type": "button"}
+    cursor_id = {"page": page, "name": "cursor", "type": "store"}
+
+    register_category_options(app, filter_id("category"), include_all_option=True)
+
+    @app.callback(
+        Output({"page": page, "name": "task-grid", "type": "task-grid"}, "data"),
+        Output(cursor_id, "data"),
+        Output(load_more_id, "disabled"),
+        Output({"page": page, "name": "status", "type": "text"}, "children"),
+        Input(filter_id("start-date"), "value"),
+        Input(filter_id("end-date"), "value"),
+        Input(filter_id("category"), "value"),
+        Input(filter_id("subcategory"), "value"),
+        Input(filter_id("activity"), "value"),
+        Input(load_more_id, "n_clicks"),
+        Input("last-update", "data"),
+        State(cursor_id, "data"),
+        State("user-id", "data"),
+    )
+    def update_task_history(
+        start_date, end_date, category_id, subcategory, activity, _load_more, _last_update, cursor_state, user_id
+    ):
+        if not user_id:
+            raise PreventUpdate
+
+        load_more = ctx.triggered_id == load_more_id
+        after = (cursor_state or {}).get("after") if load_more else None
+        if load_more and after is None:
+            raise PreventUpdate
+
+        task_rows, next_cursor = load_task_history_page(
+            user_id,
+            after=after,
+            start_date=start_date,
+            end_date=end_date,
+            category_id=None if category_id in (None, "", "all") else int(category_id),
+            subcategory=(subcategory or "").strip() or None,
+            activity=(activity or "").strip() or None,
+        )
+        records = task_grid_records(task_rows, with_date=True)
+
+        if load_more:
+            # Append in place; earlier pages never leave the browser
+            data = Patch()
+            data.extend(records)
+            loaded = (cursor_state or {}).get("loaded", 0) + len(records)
+        else:
+            data = records
+            loaded = len(records)
+
+        return (
+            data,
+            {"after": next_cursor, "loaded": loaded},
+            next_cursor is None,
+            task_history_status(loaded, next_cursor is not None),
+        )
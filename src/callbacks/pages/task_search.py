@@ -0,0 +1,64 @@
+from dash import Dash, Input, Output, Patch, State, ctx
+from dash.exceptions import PreventUpdate
+
+from src.data_access.db import search_tasks
+from src.layout.pages.task_search import TASK_SEARCH_PAGE, task_search_status
+from src.layout.shared_components.tables import task_grid_records
+
+
+def register_task_search_callbacks(app: Dash) -> None:
+    page = TASK_SEARCH_PAGE
+
+    def filter_id(name: str) -> dict[str, str]:
+        return {"page": page, "name": name, "type": "filter"}
+
+    load_more_id = {"page": page, "name": "load-more", "type": "button"}
+    cursor_id = {"page": page, "name": "cursor", "type": "store"}
+
+    @app.callback(
+        Output({"page": page, "name": "task-grid", "type": "task-grid"}, "data"),
+        Output(cursor_id, "data"),
+        Output(load_more_id, "disabled"),
+        Output({"page": page, "name": "status", "type": "text"}, "children"),
+        Input(filter_id("query"), "value"),
+        Input(filter_id("start-date"), "value"),
+        Input(filter_id("end-date"), "value"),
+        Input(load_more_id, "n_clicks"),
+        Input("last-update", "data"),
+        State(cursor_id, "data"),
+        State("user-id", "data"),
+        prevent_initial_call=True,
+    )
+    def update_task_search(query, start_date, end_date, _load_more, _last_update, cursor_state, user_id):
+        if not user_id:
+            raise PreventUpdate
+
+        query = (query or "").strip()
+        if not query:
+            return [], {"offset": 0}, True, task_search_status(None, 0, False)
+
+        load_more = ctx.triggered_id == load_more_id
+        offset = (cursor_state or {}).get("offset", 0) if load_more else 0
+
+        task_rows, has_more = search_tasks(
+            user_id,
+            query,
+            offset=offset,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        records = task_grid_records(task_rows, with_date=True, highlighted=True)
+
+        if load_more:
+            data = Patch()
+            data.extend(records)
+        else:
+            data = records
+        loaded = offset + len(records)
+
+        return (
+            data,
+            {"offset": loaded},
+            not has_more,
+            task_search_status(query, loaded, has_more),
+        )
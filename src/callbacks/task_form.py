@@ -0,0 +1,61 @@
+from dash import ClientsideFunction, Dash, Input, Output, State
+
+from src.logic.pages.log_time import suggestion_options
+
+
+def register_task_form_validation(app: Dash, page: str, group: str) -> None:
+    """
+    Clientside validation for a task form built by create_task_inputs(page, ...).
+
+    Runs assets/task_form.js (same rules as TaskTimeFields) so typing in
+    the six time inputs never reaches the server; saves are re-validated there.
+    """
+
+    def field(name: str) -> dict[str, str]:
+        return {"page": page, "group": group, "name": name, "type": "input"}
+
+    time_fields = ("start-date", "start-time", "end-date", "end-time", "duration-hours", "duration-minutes")
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="task_form", function_name="validate"),
+        # invalid flags
+        *[Output(field(name), "invalid") for name in time_fields],
+        # purely cosmetic warning surfaces
+        Output(field("duration-hours"), "className"),
+        Output(field("duration-minutes"), "className"),
+        Output({"page": page, "name": "duration-warning", "type": "text"}, "children"),
+        Output(field("duration-hours"), "placeholder"),
+        Output(field("duration-minutes"), "placeholder"),
+        *[Input(field(name), "value") for name in time_fields],
+    )
+
+
+def register_task_suggestions(app: Dash, page: str, group: str) -> None:
+    """
+    Subcategory/activity datalists for a task form built by create_task_inputs(page, ...).
+
+    Typing is debounced in the browser (assets/task_form.js) into
+    {page}-suggestion-query; the lookup then runs against the in-memory
+    suggestion index for the selected category and the typed prefixes.
+    """
+
+    def field(name: str) -> dict[str, str]:
+        return {"page": page, "group": group, "name": name, "type": "input"}
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="task_form", function_name="suggestion_query"),
+        Output(f"{page}-suggestion-query", "data"),
+        Input(field("task-subcategory"), "value"),
+        Input(field("task-activity"), "value"),
+    )
+
+    @app.callback(
+        Output(f"{page}-subcategory-suggestions", "children"),
+        Output(f"{page}-activity-suggestions", "children"),
+        Input({"page": page, "group": group, "name": "task-category", "type": "dropdown"}, "value"),
+        Input(f"{page}-suggestion-query", "data"),
+        State("user-id", "data"),
+    )
+    def update_suggestions(selected_category, query, user_id):
+        # Served from the in-memory suggestion index: no query per keystroke or category change
+        return suggestion_options(user_id, selected_category, query)
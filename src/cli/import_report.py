@@ -0,0 +1,99 @@
+import argparse
+from collections import defaultdict
+import os
+import re
+import subprocess
+import sys
+
+# Import-time report: where a cold worker spends its startup.
+#
+# Imports the target module in a fresh interpreter under `python -X importtime`
+# and summarizes the trace: total time against a bare Dash baseline, time per
+# top-level package, and the slowest modules. Importing the app runs no
+# queries, so this works without a database. The app's own self time includes
+# the cache invalidation listener, whose first connect starts during import.
+#
+#   python -m src.cli.import_report            # the app (app.py)
+#   python -m src.cli.import_report src.logic.pages.patterns_trends --top 15
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+DEFAULT_BASELINE = ("dash", "dash_bootstrap_components")
+
+
+def trace_imports(modules: list[str]) -> list[tuple[str, int, int, int]]:
+    """(module, self_us, cumulative_us, depth) per import, from a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))}
+    code = "".join(f"import {module}\n" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {', '.join(modules)} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def total_us(rows: list[tuple[str, int, int, int]]) -> int:
+    return sum(self_us for _, self_us, _, _ in rows)
+
+
+def by_package(rows: list[tuple[str, int, int, int]]) -> dict[str, int]:
+    totals: dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def _ms(us: int) -> str:
+    return f"{us / 1000:8.1f} ms"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Report where importing a module spends its time.")
+    parser.add_argument("module", nargs="?", default="app", help="module to import (default: app)")
+    parser.add_argument("--top", type=int, default=20, help="rows per section (default: 20)")
+    parser.add_argument(
+        "--baseline",
+        default=",".join(DEFAULT_BASELINE),
+        help="comma-separated modules imported first and reported as the baseline (default: dash)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = [m for m in args.baseline.split(",") if m]
+    baseline_rows = trace_imports(baseline) if baseline else []
+    rows = trace_imports([*baseline, args.module])
+
+    # Modules already loaded by the baseline are not re-imported, so the
+    # remainder of the trace is what the target adds
+    added = rows[len(baseline_rows):]
+
+    print(f"Import of {args.module}")
+    print(f"  total       {_ms(total_us(rows))}")
+    if baseline:
+        print(f"  baseline    {_ms(total_us(baseline_rows))}  ({', '.join(baseline)})")
+        print(f"  added       {_ms(total_us(added))}")
+
+    print(f"\nBy top-level package (self time, added by {args.module})")
+    for package, us in list(by_package(added).items())[: args.top]:
+        print(f"  {_ms(us)}  {package}")
+
+    print(f"\nSlowest imports (cumulative, added by {args.module})")
+    slowest = sorted(added, key=lambda row: row[2], reverse=True)[: args.top]
+    for name, self_us, cumulative_us, depth in slowest:
+        print(f"  {_ms(cumulative_us)}  (self {_ms(self_us).strip()})  {name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+import logging
+import os
+import time
+from typing import Any
+
+from src.cache.result_cache import result_cache_backend_kind
+from src.data_access.db import get_users
+from src.data_access.rollups import refresh_time_rollups
+from src.logic.pages.patterns_trends import get_full_trends_ts_figure, get_task_summary_data
+from src.logic.pages.weekly_summary import get_weekly_summary_frames
+
+# Nightly cache warming: precompute what the first page loads of the day would
+# otherwise pay for cold, for every active user, into the shared result cache.
+#
+#   python -m src.cli.warm_caches                      # all users, half the cores
+#   python -m src.cli.warm_caches --cpu-budget 0.25
+#   python -m src.cli.warm_caches --user <user_id>
+#
+# Schedule it after midnight (e.g. cron `30 3 * * *`): trend entries are keyed
+# by today's date. Users run in parallel in a process pool sized from the CPU
+# budget, at lowered priority so a live app on the same host keeps precedence.
+# Each process caches into the configured backend, so warming is only useful
+# with a shared one (disk or redis).
+
+DEFAULT_CPU_BUDGET = 0.5
+_NICE_INCREMENT = 10
+
+logger = logging.getLogger(__name__)
+
+
+def warm_user_caches(user_id: str, today: date | None = None) -> dict[str, float]:
+    """
+    Warm one user's caches; returns seconds per step. Steps mirror the pages' defaults:
+    rollups caught up, the trends store and full-history series, and the weekly
+    pivots for the default week and the one before it.
+    """
+    today = today or date.today()
+    week_start = today - timedelta(days=7)  # weekly summary page default
+
+    steps: list[tuple[str, Callable[[], Any]]] = [
+        ("rollups", lambda: refresh_time_rollups(user_id)),
+        ("trend_summary", lambda: get_task_summary_data(user_id)),
+        ("trend_series", lambda: get_full_trends_ts_figure(user_id, "auto")),
+        ("weekly_current", lambda: get_weekly_summary_frames(user_id, week_start)),
+        ("weekly_previous", lambda: get_weekly_summary_frames(user_id, week_start - timedelta(days=7))),
+    ]
+
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def _warm_user(user_id: str) -> tuple[str, dict[str, float] | None]:
+    # Pool task: never raises, so one user's failure does not stop the others
+    try:
+        return user_id, warm_user_caches(user_id)
+    except Exception:
+        logger.exception("Warming failed for user %s", user_id)
+        return user_id, None
+
+
+def _lower_priority() -> None:
+    try:
+        os.nice(_NICE_INCREMENT)
+    except OSError:
+        pass
+
+
+def pool_size(cpu_budget: float, n_users: int) -> int:
+    """Worker processes for a fraction of the host's cores (at least one, at most one per user)."""
+    cores = os.cpu_count() or 1
+    return max(1, min(n_users, int(cores * cpu_budget)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute page caches for active users.")
+    parser.add_argument(
+        "--cpu-budget",
+        type=float,
+        default=DEFAULT_CPU_BUDGET,
+        help=f"fraction of CPU cores to use (default: {DEFAULT_CPU_BUDGET})",
+    )
+    parser.add_argument("--user", action="append", dest="users", help="warm only this user id (repeatable)")
+    args = parser.parse_args(argv)
+
+    if not 0 < args.cpu_budget <= 1:
+        parser.error("--cpu-budget must be in (0, 1]")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Checked without opening the backend: the pool workers must each open
+    # their own connection rather than inherit one from this process
+    if result_cache_backend_kind() == "memory":
+        logger.warning("RESULT_CACHE_BACKEND=memory: warmed entries die with this job")
+
+    user_ids = args.users or list(get_users())
+    if not user_ids:
+        logger.info("No active users")
+        return 0
+
+    workers = pool_size(args.cpu_budget, len(user_ids))
+    logger.info("Warming %d users with %d workers", len(user_ids), workers)
+
+    started = time.perf_counter()
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_lower_priority) as pool:
+        futures = [pool.submit(_warm_user, user_id) for user_id in user_ids]
+        for future in as_completed(futures):
+            user_id, timings = future.result()
+            if timings is None:
+                failed.append(user_id)
+                continue
+            steps = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+            logger.info("User %s warmed in %.2fs (%s)", user_id, sum(timings.values()), steps)
+
+    logger.info(
+        "Warmed %d/%d users in %.1fs",
+        len(user_ids) - len(failed), len(user_ids), time.perf_counter() - started,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
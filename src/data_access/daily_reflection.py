@@ -1,7 +1,7 @@
 
 
 from sqlalchemy import text
-from src.data_access.db import load_sql_engine
+from src.data_access.db import load_sql_engine, record_changes
 
 
 def upsert_daily_reflection(
@@ -61,6 +61,13 @@ def upsert_daily_reflection(
 
     with engine.begin() as conn:
         conn.execute(sql, params)
+        record_changes(conn, [{
+            "user_id": user_id,
+            "entity": "daily_reflection",
+            "entity_key": reflection_date,
+            "affected_date": reflection_date,
+            "operation": "update",
+        }])
 
 
 def load_daily_reflection(user_id: str, reflection_date: str) -> dict | None:
@@ -1,11 +1,13 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from functools import lru_cache
 import os
 from typing import Any
 
 from dotenv import load_dotenv
 import pandas as pd
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import Connection, Engine, create_engine, text
+
+from src.cache.local_cache import evict_local_cache
 
 load_dotenv()
 
@@ -27,6 +29,102 @@ def load_sql_engine()->Engine:
     return engine
 
 
+def _dispose_inherited_pool() -> None:
+    # A forked child (background callback job) must not reuse the parent's
+    # pooled connections; drop them without closing the parent's sockets
+    if load_sql_engine.cache_info().currsize:
+        load_sql_engine().dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_dispose_inherited_pool)
+
+
+# Change log
+# Writes append one row per affected (entity, key, date) inside the same
+# transaction as the write. Consumers keep the last seq_id they processed and
+# ask for everything after it (incremental exports, rollup catch-up, cache
+# invalidation across workers) instead of rescanning the source tables.
+
+_CHANGE_LOG_INSERT = text("""
+    INSERT INTO change_log (user_id, entity, entity_key, affected_date, operation)
+    VALUES (:user_id, :entity, :entity_key, :affected_date, :operation)
+""")
+
+
+def record_changes(conn: Connection, changes: list[dict[str, Any]]) -> None:
+    """
+    Append change_log rows using the caller's connection (same transaction).
+
+    changes: list[dict] with keys:
+      - user_id
+      - entity          e.g. "task", "daily_metrics", "user_categories"
+      - entity_key      primary key of the changed row (stored as text), or None
+      - affected_date   date the change affects, or None if not date-scoped
+      - operation       "create" | "update" | "delete"
+    """
+    rows = [
+        {
+            "user_id": str(c["user_id"]),
+            "entity": c["entity"],
+            "entity_key": None if c.get("entity_key") is None else str(c["entity_key"]),
+            "affected_date": c.get("affected_date"),
+            "operation": c["operation"],
+        }
+        for c in changes
+        if c.get("user_id") is not None
+    ]
+    if not rows:
+        return
+    conn.execute(_CHANGE_LOG_INSERT, rows)
+
+    # Drop this worker's cached state for the changes right away. Other workers,
+    # and this one again once the transaction commits, follow via the NOTIFY listener.
+    for user_id, entity, affected_date in {(r["user_id"], r["entity"], r["affected_date"]) for r in rows}:
+        evict_local_cache(user_id=user_id, entity=entity, date=affected_date)
+
+
+def load_changes_since(
+    after_seq: int,
+    user_id: str | None = None,
+    limit: int = 1000,
+) -> list[dict[str, Any]]:
+    """
+    Return change_log rows with seq_id > after_seq in seq_id order (at most `limit`).
+    Pass user_id to restrict to a single user.
+
+    Note: seq_id comes from a sequence, so a transaction that commits late can
+    land below a seq_id a consumer has already seen. Consumers that need
+    strict completeness should re-read a small window behind their cursor.
+    """
+    engine = load_sql_engine()
+    sql = text("""
+        SELECT seq_id, user_id, entity, entity_key, affected_date, operation, occurred_at
+        FROM change_log
+        WHERE seq_id > :after_seq
+          AND (CAST(:user_id AS UUID) IS NULL OR user_id = CAST(:user_id AS UUID))
+        ORDER BY seq_id
+        LIMIT :limit
+    """)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sql,
+            {"after_seq": int(after_seq), "user_id": user_id, "limit": int(limit)},
+        ).mappings().all()
+
+    return [{**dict(r), "user_id": str(r["user_id"])} for r in rows]
+
+
+def get_latest_change_seq(user_id: str | None = None) -> int:
+    """Return the highest seq_id (for the user, if given), or 0 if the log is empty."""
+    engine = load_sql_engine()
+    sql = text("""
+        SELECT COALESCE(MAX(seq_id), 0)
+        FROM change_log
+        WHERE CAST(:user_id AS UUID) IS NULL OR user_id = CAST(:user_id AS UUID)
+    """)
+    with engine.connect() as conn:
+        return int(conn.execute(sql, {"user_id": user_id}).scalar_one())
+
 
 def fetch_user_categories_rows(user_id: str) -> list[dict[str, Any]]: #Main source of truth
     engine = load_sql_engine()
@@ -251,10 +349,279 @@ def load_tasks_for_day(user_id: str, selected_date: date | str) -> pd.DataFrame:
     )
 
 
+TASK_HISTORY_PAGE_SIZE = 200
+
+
+def _like_contains(value: str) -> str:
+    """ILIKE pattern matching `value` anywhere, with LIKE wildcards escaped."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def load_task_history_page(
+    user_id: str,
+    *,
+    after: dict[str, Any] | None = None,
+    limit: int = TASK_HISTORY_PAGE_SIZE,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    category_id: int | None = None,
+    subcategory: str | None = None,
+    activity: str | None = None,
+) -> tuple[pd.DataFrame, dict[str, Any] | None]:
+    """
+    One page of task history, newest first: (start_at DESC, task_id DESC), with
+    tasks that have no start time after all timed tasks (by task_id DESC).
+
+    Keyset pagination: `after` is the cursor returned with the previous page
+    ({"start_at": iso | None, "task_id": int}); each page seeks straight to it
+    through idx_task_data_user_start_desc, so cost doesn't grow with depth.
+    Filters: date range on td.date (inclusive), exact category, and
+    case-insensitive substring match on subcategory/activity.
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    engine = load_sql_engine()
+    params: dict[str, Any] = {
+        "user_id": user_id,
+        "start_date": start_date or None,
+        "end_date": end_date or None,
+        "category_id": int(category_id) if category_id is not None else None,
+        "subcategory": _like_contains(subcategory) if subcategory else None,
+        "activity": _like_contains(activity) if activity else None,
+    }
+    select = """
+        SELECT
+            td.task_id,
+            td.date,
+            td.start_at,
+            td.end_at,
+            td.duration_min,
+            uc.category_name AS category,
+            td.subcategory,
+            td.activity,
+            td.notes
+        FROM task_data td
+        LEFT JOIN user_categories uc
+          ON uc.user_id = td.user_id
+         AND uc.category_id = td.category_id
+        WHERE td.user_id = :user_id
+          AND (CAST(:start_date AS DATE) IS NULL OR td.date >= CAST(:start_date AS DATE))
+          AND (CAST(:end_date AS DATE) IS NULL OR td.date <= CAST(:end_date AS DATE))
+          AND (CAST(:category_id AS BIGINT) IS NULL OR td.category_id = CAST(:category_id AS BIGINT))
+          AND (CAST(:subcategory AS TEXT) IS NULL OR td.subcategory ILIKE CAST(:subcategory AS TEXT))
+          AND (CAST(:activity AS TEXT) IS NULL OR td.activity ILIKE CAST(:activity AS TEXT))
+    """
+    timed_sql = text(select + """
+          AND td.start_at IS NOT NULL
+          AND (
+            CAST(:after_start AS TIMESTAMP) IS NULL
+            OR (td.start_at, td.task_id) < (CAST(:after_start AS TIMESTAMP), CAST(:after_id AS BIGINT))
+          )
+        ORDER BY td.start_at DESC, td.task_id DESC
+        LIMIT :limit
+    """)
+    untimed_sql = text(select + """
+          AND td.start_at IS NULL
+          AND (CAST(:after_id AS BIGINT) IS NULL OR td.task_id < CAST(:after_id AS BIGINT))
+        ORDER BY td.task_id DESC
+        LIMIT :limit
+    """)
+
+    after_start = (after or {}).get("start_at")
+    after_id = (after or {}).get("task_id")
+    frames = []
+    remaining = int(limit)
+
+    # Timed tasks first, unless the cursor is already in the untimed tail
+    if after is None or after_start is not None:
+        timed = pd.read_sql(
+            timed_sql,
+            engine,
+            params={**params, "after_start": after_start, "after_id": after_id, "limit": remaining},
+        )
+        frames.append(timed)
+        remaining -= len(timed)
+        after_id = None  # the untimed tail starts from its beginning
+
+    if remaining > 0:
+        untimed = pd.read_sql(
+            untimed_sql,
+            engine,
+            params={**params, "after_id": after_id, "limit": remaining},
+        )
+        frames.append(untimed)
+        remaining -= len(untimed)
+
+    rows = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if remaining > 0 or rows.empty:
+        return rows, None
+
+    last = rows.iloc[-1]
+    next_cursor = {
+        "start_at": None if pd.isna(last["start_at"]) else pd.Timestamp(last["start_at"]).isoformat(),
+        "task_id": int(last["task_id"]),
+    }
+    return rows, next_cursor
+
+
+# Private-use characters wrapped around matched terms in search results;
+# the caller turns them into whatever markup it renders
+SEARCH_HIGHLIGHT_START = "\ue000"
+SEARCH_HIGHLIGHT_STOP = "\ue001"
+SEARCH_PAGE_SIZE = 50
+
+_HEADLINE_ALL = f'StartSel="{SEARCH_HIGHLIGHT_START}", StopSel="{SEARCH_HIGHLIGHT_STOP}", HighlightAll=true'
+_HEADLINE_SNIPPET = (
+    f'StartSel="{SEARCH_HIGHLIGHT_START}", StopSel="{SEARCH_HIGHLIGHT_STOP}", '
+    'MaxWords=18, MinWords=6, MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def search_tasks(
+    user_id: str,
+    query: str,
+    *,
+    offset: int = 0,
+    limit: int = SEARCH_PAGE_SIZE,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+) -> tuple[pd.DataFrame, bool]:
+    """
+    Ranked search over activity, subcategory and notes.
+
+    Matches whole words (stemmed full-text on task_data.search_tsv), partial
+    words (ILIKE) and near-misses (trigram word similarity) on
+    task_data.search_text; both columns are GIN-indexed. Ranked by text rank
+    (activity > subcategory > notes) plus word similarity, newest first on
+    ties. Matched terms in subcategory/activity/notes are wrapped in
+    SEARCH_HIGHLIGHT_START/STOP; notes are cut down to snippets around the
+    matches.
+
+    Returns (rows, has_more).
+    """
+    query = (query or "").strip()
+    if not query:
+        return pd.DataFrame(), False
+
+    sql = text(
+        """
+        WITH q AS (
+            SELECT websearch_to_tsquery('english', :query) AS tsq
+        ),
+        hits AS (
+            SELECT
+                td.task_id,
+                ts_rank_cd(td.search_tsv, q.tsq) + word_similarity(:query, td.search_text) AS rank
+            FROM task_data td
+            CROSS JOIN q
+            WHERE td.user_id = :user_id
+              AND (CAST(:start_date AS DATE) IS NULL OR td.date >= CAST(:start_date AS DATE))
+              AND (CAST(:end_date AS DATE) IS NULL OR td.date <= CAST(:end_date AS DATE))
+              AND (
+                td.search_tsv @@ q.tsq
+                OR td.search_text ILIKE :like
+                OR :query <% td.search_text
+              )
+            ORDER BY rank DESC, td.start_at DESC NULLS LAST, td.task_id DESC
+            LIMIT :limit OFFSET :offset
+        )
+        SELECT
+            td.task_id,
+            td.date,
+            td.start_at,
+            td.end_at,
+            td.duration_min,
+            uc.category_name AS category,
+            ts_headline('english', COALESCE(td.subcategory, ''), q.tsq, :headline_all) AS subcategory,
+            ts_headline('english', COALESCE(td.activity, ''), q.tsq, :headline_all) AS activity,
+            ts_headline('english', COALESCE(td.notes, ''), q.tsq, :headline_snippet) AS notes,
+            h.rank
+        FROM hits h
+        JOIN task_data td ON td.task_id = h.task_id
+        CROSS JOIN q
+        LEFT JOIN user_categories uc
+          ON uc.user_id = td.user_id
+         AND uc.category_id = td.category_id
+        ORDER BY h.rank DESC, td.start_at DESC NULLS LAST, td.task_id DESC
+        """
+    )
+
+    # Headlines are only computed for the page; one extra row tells us whether
+    # there is another page
+    rows = pd.read_sql(
+        sql,
+        load_sql_engine(),
+        params={
+            "user_id": user_id,
+            "query": query,
+            "like": _like_contains(query),
+            "start_date": start_date or None,
+            "end_date": end_date or None,
+            "limit": int(limit) + 1,
+            "offset": int(offset),
+            "headline_all": _HEADLINE_ALL,
+            "headline_snippet": _HEADLINE_SNIPPET,
+        },
+    )
+    has_more = len(rows) > limit
+    return rows.iloc[:limit], has_more
+
+
+def load_suggestion_scores(user_id: str, epoch: datetime, half_life_days: float) -> pd.DataFrame:
+    """
+    Frecency of every subcategory/activity value a user has logged, per category.
+
+    score = sum over uses of 2 ** ((used_at - epoch) / half_life), so each use
+    counts once and halves in weight every half_life_days; values compare
+    the same way at any later time. Values are trimmed and grouped
+    case-insensitively; `value` is the most recently used spelling.
+
+    Returns columns: category_id, field ("subcategory" | "activity"), value, score.
+    """
+    engine = load_sql_engine()
+    sql = text("""
+        WITH uses AS (
+            SELECT
+                td.category_id,
+                f.field,
+                f.value,
+                COALESCE(td.start_at, td.date::timestamp, td.created_at::timestamp) AS used_at
+            FROM task_data td
+            CROSS JOIN LATERAL (
+                VALUES ('subcategory', btrim(td.subcategory)), ('activity', btrim(td.activity))
+            ) AS f(field, value)
+            WHERE td.user_id = :user_id
+              AND f.value <> ''
+        )
+        SELECT
+            category_id,
+            field,
+            (ARRAY_AGG(value ORDER BY used_at DESC))[1] AS value,
+            SUM(
+                POWER(
+                    CAST(2 AS DOUBLE PRECISION),
+                    -- clamp so very old uses round to ~0 instead of underflowing
+                    GREATEST(
+                        EXTRACT(EPOCH FROM (used_at - CAST(:epoch AS TIMESTAMP))) / :half_life_seconds,
+                        -1000
+                    )
+                )
+            ) AS score
+        FROM uses
+        GROUP BY category_id, field, lower(value)
+    """)
+    return pd.read_sql(
+        sql,
+        engine,
+        params={"user_id": user_id, "epoch": epoch, "half_life_seconds": float(half_life_days) * 86400.0},
+    )
+
+
 def insert_task(row_dict: dict[str, Any]) -> None:
     engine = load_sql_engine()
     with engine.begin() as conn:
-        conn.execute(
+        task_id = conn.execute(
             text("""
                 INSERT INTO task_data (
                     date, subcategory, activity,
@@ -264,15 +631,29 @@ def insert_task(row_dict: dict[str, Any]) -> None:
                     :date, :subcategory, :activity,
                     :start_at, :end_at, :duration_min, :notes, :user_id, :category_id
                 )
+                RETURNING task_id
             """),
             row_dict,
-        )
+        ).scalar_one()
+        record_changes(conn, [{
+            "user_id": row_dict["user_id"],
+            "entity": "task",
+            "entity_key": task_id,
+            "affected_date": row_dict["date"],
+            "operation": "create",
+        }])
 
 def update_task(task_id: int, row_dict: dict[str, Any], user_id: str) -> None:
     engine = load_sql_engine()
     with engine.begin() as conn:
-        conn.execute(
+        # prev reads the pre-update snapshot, so a moved task logs both dates
+        row = conn.execute(
             text("""
+                WITH prev AS (
+                    SELECT date AS prev_date
+                    FROM task_data
+                    WHERE task_id = :task_id
+                )
                 UPDATE task_data
                 SET
                     date = :date,
@@ -285,12 +666,28 @@ def update_task(task_id: int, row_dict: dict[str, Any], user_id: str) -> None:
                     notes = :notes,
                     updated_at = NOW()
                 WHERE task_id = :task_id
+                RETURNING user_id, date, (SELECT prev_date FROM prev) AS prev_date
             """),
             {
                 **row_dict,
                 "task_id": task_id,
             },
-        )
+        ).mappings().first()
+
+        if row is not None:
+            affected_dates = [row["date"]]
+            if row["prev_date"] != row["date"]:
+                affected_dates.append(row["prev_date"])
+            record_changes(conn, [
+                {
+                    "user_id": row["user_id"],
+                    "entity": "task",
+                    "entity_key": task_id,
+                    "affected_date": d,
+                    "operation": "update",
+                }
+                for d in affected_dates
+            ])
 
 def load_task_db(task_id: int) -> dict:
     engine = load_sql_engine()
@@ -339,6 +736,16 @@ def update_daily_metrics(records: list[dict[str, Any]]) -> None:
 
     with engine.begin() as conn:
         conn.execute(text(UPSERT_SQL), records)
+        record_changes(conn, [
+            {
+                "user_id": r["user_id"],
+                "entity": "daily_metrics",
+                "entity_key": r["metric_key"],
+                "affected_date": r["date"],
+                "operation": "update",
+            }
+            for r in records
+        ])
 
 
 def delete_daily_metrics_for_keys(
@@ -355,13 +762,14 @@ def delete_daily_metrics_for_keys(
 
     engine = load_sql_engine()
     with engine.begin() as conn:
-        conn.execute(
+        deleted_keys = conn.execute(
             text(
                 """
                 DELETE FROM daily_metric_values
                 WHERE user_id = :user_id
                   AND date = :metric_date
                   AND metric_key = ANY(:metric_keys)
+                RETURNING metric_key
                 """
             ),
             {
@@ -369,7 +777,17 @@ def delete_daily_metrics_for_keys(
                 "metric_date": metric_date,
                 "metric_keys": keys,
             },
-        )
+        ).scalars().all()
+        record_changes(conn, [
+            {
+                "user_id": user_id,
+                "entity": "daily_metrics",
+                "entity_key": k,
+                "affected_date": metric_date,
+                "operation": "delete",
+            }
+            for k in deleted_keys
+        ])
 
 def get_daily_metrics_definitions(user_id: str) -> list[dict[str, Any]]:
     sql = """
@@ -418,10 +836,18 @@ def get_daily_metrics_for_date(metric_date: date | str, user_id: str) -> dict[st
 def delete_task_sql(task_id: int) -> None:
     engine = load_sql_engine()
     with engine.begin() as conn:
-        conn.execute(
-            text("DELETE FROM task_data WHERE task_id = :task_id"),
+        row = conn.execute(
+            text("DELETE FROM task_data WHERE task_id = :task_id RETURNING user_id, date"),
             {"task_id": task_id},
-        )
+        ).mappings().first()
+        if row is not None:
+            record_changes(conn, [{
+                "user_id": row["user_id"],
+                "entity": "task",
+                "entity_key": task_id,
+                "affected_date": row["date"],
+                "operation": "delete",
+            }])
 
 def get_user_id(username: str) -> str:
     engine = load_sql_engine()
@@ -456,11 +882,6 @@ def get_users() -> dict[str, str]:
 
     return {str(row["user_id"]): row["display_name"] for row in rows}
 
-def get_first_user_id() -> str | None:
-    users = get_users()
-    return next(iter(users), None)
-
-
 def load_today_summary_minutes(user_id: str, selected_date: date | str) -> pd.DataFrame:
     engine = load_sql_engine()
     sql = text("""
@@ -101,6 +101,33 @@ def create_task_data_table(engine: Engine) -> None:
             CREATE INDEX IF NOT EXISTS idx_task_data_user_category_date
             ON task_data (user_id, category_id, date);
         """,
+        # Search: ranked full-text (activity > subcategory > notes) plus
+        # trigram matching for partial words and typos
+        """CREATE EXTENSION IF NOT EXISTS pg_trgm;""",
+        """
+            ALTER TABLE task_data
+            ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', COALESCE(activity, '')), 'A')
+                || setweight(to_tsvector('english', COALESCE(subcategory, '')), 'B')
+                || setweight(to_tsvector('english', COALESCE(notes, '')), 'C')
+            ) STORED;
+        """,
+        """
+            ALTER TABLE task_data
+            ADD COLUMN IF NOT EXISTS search_text TEXT
+            GENERATED ALWAYS AS (
+                COALESCE(activity, '') || ' ' || COALESCE(subcategory, '') || ' ' || COALESCE(notes, '')
+            ) STORED;
+        """,
+        """
+            CREATE INDEX IF NOT EXISTS idx_task_data_search_tsv
+            ON task_data USING GIN (search_tsv);
+        """,
+        """
+            CREATE INDEX IF NOT EXISTS idx_task_data_search_trgm
+            ON task_data USING GIN (search_text gin_trgm_ops);
+        """,
     ]
 
     with engine.begin() as conn:
@@ -323,6 +350,99 @@ def create_daily_reflections_table(engine: Engine) -> None:
             conn.execute(text(stmt))
 
 
+# *************** CHANGE LOG ***************
+
+# ----- change_log -----
+def create_change_log_table(engine: Engine) -> None:
+    stmts = [
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq_id        BIGSERIAL PRIMARY KEY,
+
+            user_id       UUID NOT NULL REFERENCES users(user_id),
+            entity        TEXT NOT NULL,
+            entity_key    TEXT NULL,
+            affected_date DATE NULL,
+            operation     TEXT NOT NULL,
+
+            occurred_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+            CONSTRAINT ck_change_log_operation
+                CHECK (operation IN ('create', 'update', 'delete'))
+        );
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_change_log_user_seq
+        ON change_log (user_id, seq_id);
+        """,
+        # Broadcast each change to per-worker cache listeners (delivered on commit;
+        # identical payloads within one transaction are collapsed by Postgres)
+        """
+        CREATE OR REPLACE FUNCTION notify_data_change() RETURNS trigger AS $$
+        BEGIN
+          PERFORM pg_notify(
+            'data_changes',
+            json_build_object(
+              'user_id', NEW.user_id,
+              'entity', NEW.entity,
+              'date', NEW.affected_date
+            )::text
+          );
+          RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+        """
+        DROP TRIGGER IF EXISTS trg_change_log_notify ON change_log;
+        """,
+        """
+        CREATE TRIGGER trg_change_log_notify
+        AFTER INSERT ON change_log
+        FOR EACH ROW EXECUTE FUNCTION notify_data_change();
+        """,
+    ]
+
+    with engine.begin() as conn:
+        for stmt in stmts:
+            conn.execute(text(stmt))
+
+
+# *************** ROLLUPS ***************
+
+# ----- time_rollups (day -> ISO week -> month -> quarter -> year) -----
+def create_time_rollups_tables(engine: Engine) -> None:
+    stmts = [
+        """
+        CREATE TABLE IF NOT EXISTS time_rollups (
+            user_id       UUID NOT NULL REFERENCES users(user_id),
+            grain         TEXT NOT NULL,
+            period_start  DATE NOT NULL,
+            category_id   BIGINT NOT NULL,
+            subcategory   TEXT NOT NULL DEFAULT '',   -- '' stands for NULL subcategory
+            total_minutes DOUBLE PRECISION NOT NULL,
+
+            CONSTRAINT time_rollups_pkey
+                PRIMARY KEY (user_id, grain, period_start, category_id, subcategory),
+
+            CONSTRAINT ck_time_rollups_grain
+                CHECK (grain IN ('day', 'week', 'month', 'quarter', 'year'))
+        );
+        """,
+        # Incremental maintenance cursor: last change_log seq_id folded into the rollups
+        """
+        CREATE TABLE IF NOT EXISTS time_rollup_state (
+            user_id      UUID PRIMARY KEY REFERENCES users(user_id),
+            last_seq     BIGINT NOT NULL DEFAULT 0,
+            refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        """,
+    ]
+
+    with engine.begin() as conn:
+        for stmt in stmts:
+            conn.execute(text(stmt))
+
+
 def init_db() -> None:
     engine = load_sql_engine()
 
@@ -344,3 +464,9 @@ def init_db() -> None:
 
     # Daily reflections
     create_daily_reflections_table(engine)
+
+    # Change log
+    create_change_log_table(engine)
+
+    # Rollups
+    create_time_rollups_tables(engine)
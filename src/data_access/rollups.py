@@ -0,0 +1,203 @@
+from datetime import date
+from typing import Any, Literal
+
+import pandas as pd
+from sqlalchemy import Connection, text
+
+from src.data_access.db import load_changes_since, load_sql_engine
+
+# Pre-aggregated time per (period, category, subcategory) at five grains.
+# Day rows are derived from task_data + duration metrics (same sources as the
+# trends view); coarser grains are derived from day rows. Maintenance is
+# incremental: change_log entries after the user's cursor name the affected
+# dates, and only those days and their enclosing periods are rebuilt.
+
+RollupGrain = Literal["day", "week", "month", "quarter", "year"]
+
+ROLLUP_GRAINS: tuple[RollupGrain, ...] = ("day", "week", "month", "quarter", "year")
+
+# Entities whose changes are not date-scoped and force a full rebuild
+_FULL_REBUILD_ENTITIES = {"metric_definitions"}
+_DATE_SCOPED_ENTITIES = {"task", "daily_metrics"}
+
+# Re-read this many seq_ids behind the cursor: a transaction can commit after a
+# higher seq_id was already processed. Reprocessing a date is idempotent.
+_SEQ_OVERLAP = 100
+_CHANGES_PAGE_SIZE = 5000
+
+
+def _rebuild_rollups(conn: Connection, user_id: str, dates: list[date] | None) -> None:
+    """Rebuild day rows for `dates` (None = all) and every coarser period containing them."""
+    params = {"user_id": user_id, "all_dates": dates is None, "dates": dates or []}
+
+    conn.execute(
+        text("""
+            DELETE FROM time_rollups
+            WHERE user_id = :user_id
+              AND grain = 'day'
+              AND (:all_dates OR period_start = ANY(CAST(:dates AS DATE[])))
+        """),
+        params,
+    )
+    conn.execute(
+        text("""
+            INSERT INTO time_rollups (user_id, grain, period_start, category_id, subcategory, total_minutes)
+            SELECT :user_id, 'day', src.date, src.category_id, COALESCE(src.subcategory, ''), SUM(src.minutes)
+            FROM (
+                SELECT td.date, td.category_id, td.subcategory, td.duration_min AS minutes
+                FROM task_data td
+                WHERE td.user_id = :user_id
+                  AND td.category_id IS NOT NULL
+                  AND td.date IS NOT NULL
+                  AND (:all_dates OR td.date = ANY(CAST(:dates AS DATE[])))
+                UNION ALL
+                SELECT dmv.date, md.category_id, md.subcategory, dmv.value_num * md.to_minutes_factor
+                FROM daily_metric_values dmv
+                JOIN metric_definitions md
+                  ON md.metric_key = dmv.metric_key
+                 AND md.user_id = dmv.user_id
+                WHERE dmv.user_id = :user_id
+                  AND md.category_id IS NOT NULL
+                  AND md.to_minutes_factor IS NOT NULL
+                  AND dmv.value_num IS NOT NULL
+                  AND (:all_dates OR dmv.date = ANY(CAST(:dates AS DATE[])))
+            ) src
+            GROUP BY src.date, src.category_id, COALESCE(src.subcategory, '')
+        """),
+        params,
+    )
+
+    for grain in ROLLUP_GRAINS[1:]:
+        grain_params = {**params, "grain": grain}
+        conn.execute(
+            text("""
+                DELETE FROM time_rollups
+                WHERE user_id = :user_id
+                  AND grain = :grain
+                  AND (
+                    :all_dates
+                    OR period_start IN (
+                        SELECT CAST(date_trunc(:grain, d) AS DATE)
+                        FROM unnest(CAST(:dates AS DATE[])) AS d
+                    )
+                  )
+            """),
+            grain_params,
+        )
+        conn.execute(
+            text("""
+                INSERT INTO time_rollups (user_id, grain, period_start, category_id, subcategory, total_minutes)
+                SELECT
+                    user_id,
+                    :grain,
+                    CAST(date_trunc(:grain, period_start) AS DATE),
+                    category_id,
+                    subcategory,
+                    SUM(total_minutes)
+                FROM time_rollups
+                WHERE user_id = :user_id
+                  AND grain = 'day'
+                  AND (
+                    :all_dates
+                    OR CAST(date_trunc(:grain, period_start) AS DATE) IN (
+                        SELECT CAST(date_trunc(:grain, d) AS DATE)
+                        FROM unnest(CAST(:dates AS DATE[])) AS d
+                    )
+                  )
+                GROUP BY user_id, CAST(date_trunc(:grain, period_start) AS DATE), category_id, subcategory
+            """),
+            grain_params,
+        )
+
+
+def refresh_time_rollups(user_id: str) -> int:
+    """
+    Bring the user's rollups up to date with change_log.
+    First call (no cursor) does a full build. Returns the new cursor seq_id.
+    """
+    engine = load_sql_engine()
+    with engine.begin() as conn:
+        # Serialize refreshes per user across workers
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:user_id))"), {"user_id": user_id})
+
+        last_seq = conn.execute(
+            text("SELECT last_seq FROM time_rollup_state WHERE user_id = :user_id"),
+            {"user_id": user_id},
+        ).scalar()
+
+        full_rebuild = last_seq is None
+        cursor = max(0, int(last_seq or 0) - _SEQ_OVERLAP)
+        new_seq = int(last_seq or 0)
+        affected_dates: set[date] = set()
+
+        while not full_rebuild:
+            changes = load_changes_since(cursor, user_id=user_id, limit=_CHANGES_PAGE_SIZE)
+            if not changes:
+                break
+            for change in changes:
+                if change["entity"] in _FULL_REBUILD_ENTITIES:
+                    full_rebuild = True
+                elif change["entity"] in _DATE_SCOPED_ENTITIES and change["affected_date"] is not None:
+                    affected_dates.add(change["affected_date"])
+            cursor = int(changes[-1]["seq_id"])
+            new_seq = max(new_seq, cursor)
+
+        if full_rebuild:
+            new_seq = int(conn.execute(
+                text("SELECT COALESCE(MAX(seq_id), 0) FROM change_log WHERE user_id = :user_id"),
+                {"user_id": user_id},
+            ).scalar_one())
+            _rebuild_rollups(conn, user_id, None)
+        elif affected_dates:
+            _rebuild_rollups(conn, user_id, sorted(affected_dates))
+
+        conn.execute(
+            text("""
+                INSERT INTO time_rollup_state (user_id, last_seq, refreshed_at)
+                VALUES (:user_id, :last_seq, now())
+                ON CONFLICT (user_id) DO UPDATE
+                SET last_seq = EXCLUDED.last_seq,
+                    refreshed_at = EXCLUDED.refreshed_at
+            """),
+            {"user_id": user_id, "last_seq": new_seq},
+        )
+
+    return new_seq
+
+
+def load_time_rollups(
+    user_id: str,
+    grain: RollupGrain,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    by_subcategory: bool = False,
+) -> pd.DataFrame:
+    """
+    Rollup rows for one grain, optionally limited to periods starting in [start_date, end_date].
+
+    Columns: period_start, category_id, [subcategory (None for NULL)], total_minutes
+    """
+    engine = load_sql_engine()
+    sub_col = "NULLIF(subcategory, '') AS subcategory," if by_subcategory else ""
+    group_by = "period_start, category_id, subcategory" if by_subcategory else "period_start, category_id"
+    sql = text(f"""
+        SELECT
+            period_start,
+            category_id,
+            {sub_col}
+            SUM(total_minutes) AS total_minutes
+        FROM time_rollups
+        WHERE user_id = :user_id
+          AND grain = :grain
+          AND (CAST(:start_date AS DATE) IS NULL OR period_start >= :start_date)
+          AND (CAST(:end_date AS DATE) IS NULL OR period_start <= :end_date)
+        GROUP BY {group_by}
+        ORDER BY {group_by}
+    """)
+    params: dict[str, Any] = {
+        "user_id": user_id,
+        "grain": grain,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    return pd.read_sql(sql, engine, params=params)
@@ -2,7 +2,7 @@ import re
 from typing import Any
 
 from sqlalchemy import text
-from src.data_access.db import load_sql_engine
+from src.data_access.db import load_sql_engine, record_changes
 
 
 def fetch_user_categories_sort_order_rows(user_id: str) -> list[dict[str, Any]]: #Main source of truth
@@ -132,6 +132,8 @@ def persist_category_settings_changes(
     category_edits = category_edits or {}
     category_drafts = category_drafts or []
 
+    changes: list[dict[str, Any]] = []
+
     engine = load_sql_engine()
     with engine.begin() as conn:
         for category_id_str, row in category_edits.items():
@@ -158,6 +160,12 @@ def persist_category_settings_changes(
                     "is_active": bool(row.get("is_active", True)),
                 },
             )
+            changes.append({
+                "user_id": user_id,
+                "entity": "user_categories",
+                "entity_key": int(category_id_str),
+                "operation": "update",
+            })
 
         for row in category_drafts:
             if not row.get("is_staged"):
@@ -165,7 +173,7 @@ def persist_category_settings_changes(
             category_name = (row.get("category_name") or "").strip()
             if not category_name:
                 continue
-            conn.execute(
+            category_id = conn.execute(
                 text(
                     """
                     INSERT INTO user_categories (user_id, category_name, is_active, sort_order)
@@ -182,6 +190,7 @@ def persist_category_settings_changes(
                     DO UPDATE
                     SET is_active = EXCLUDED.is_active,
                         updated_at = now()
+                    RETURNING category_id
                     """
                 ),
                 {
@@ -189,7 +198,15 @@ def persist_category_settings_changes(
                     "category_name": category_name,
                     "is_active": bool(row.get("is_active", True)),
                 },
-            )
+            ).scalar_one()
+            changes.append({
+                "user_id": user_id,
+                "entity": "user_categories",
+                "entity_key": category_id,
+                "operation": "create",
+            })
+
+        record_changes(conn, changes)
 
 
 def persist_metric_settings_changes(
@@ -222,6 +239,15 @@ def persist_metric_settings_changes(
         ordered_existing = [k for k in metric_order if k in current_metric_keys]
         ordered_existing.extend([k for k in current_metric_keys if k not in ordered_existing])
 
+        changes: list[dict[str, Any]] = []
+        if ordered_existing != current_metric_keys:
+            changes.append({
+                "user_id": user_id,
+                "entity": "metric_definitions",
+                "entity_key": None,
+                "operation": "update",
+            })
+
         for idx, metric_key in enumerate(ordered_existing):
             conn.execute(
                 text(
@@ -276,6 +302,12 @@ def persist_metric_settings_changes(
                     "to_minutes_factor": _normalize_to_minutes_factor(row.get("to_minutes_factor")),
                 },
             )
+            changes.append({
+                "user_id": user_id,
+                "entity": "metric_definitions",
+                "entity_key": metric_key,
+                "operation": "update",
+            })
 
         next_sort = len(ordered_existing)
         for row in metric_drafts:
@@ -340,8 +372,16 @@ def persist_metric_settings_changes(
                     "to_minutes_factor": _normalize_to_minutes_factor(row.get("to_minutes_factor")),
                 },
             )
+            changes.append({
+                "user_id": user_id,
+                "entity": "metric_definitions",
+                "entity_key": metric_key,
+                "operation": "create",
+            })
             next_sort += 1
 
+        record_changes(conn, changes)
+
 
 def persist_settings_changes(
     *,
@@ -0,0 +1,23 @@
+from typing import Any
+
+import plotly.io as pio
+
+# Plain-dict figure specs for hot-path charts.
+#
+# Building go.Figure / go.Bar / update_layout runs Plotly's property validators
+# on every call (milliseconds per trace). Charts that are rebuilt per request
+# emit {"data": [...], "layout": {...}} dicts instead; dcc.Graph accepts them
+# as-is. The plotly_white template is serialized once here and shared by
+# reference, so treat it as read-only.
+
+PLOTLY_WHITE_TEMPLATE: dict[str, Any] = pio.templates["plotly_white"].to_plotly_json()
+
+
+def figure_spec(data: list[dict[str, Any]], layout: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Figure dict with the shared plotly_white template under the given layout."""
+    return {"data": data, "layout": {"template": PLOTLY_WHITE_TEMPLATE, **(layout or {})}}
+
+
+def blank_figure_spec() -> dict[str, Any]:
+    """Empty figure without axes, shown by page skeletons until the data callback fills the graph."""
+    return figure_spec([], {"xaxis": {"visible": False}, "yaxis": {"visible": False}})
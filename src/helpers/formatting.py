@@ -0,0 +1,112 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Column-at-a-time display formatting for tables.
+#
+# Each formatter takes a whole column (list, Series, ndarray, or a 2D block)
+# and returns a same-shaped array of strings, computed with NumPy string ops
+# instead of one Python call per cell. Missing/unparseable values format as ""
+# unless noted.
+
+
+def _to_float(values: Any) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(float)
+    flat = pd.to_numeric(pd.Series(arr.ravel(), dtype=object), errors="coerce").to_numpy(dtype=float)
+    return flat.reshape(arr.shape)
+
+
+def _int_str(values: np.ndarray) -> np.ndarray:
+    return values.astype(np.int64).astype(str)
+
+
+def _zfill(values: np.ndarray, width: int) -> np.ndarray:
+    # np.strings.zfill can't size its output for an empty array
+    return np.strings.zfill(values, width) if values.size else values
+
+
+def format_h_m(values: Any) -> np.ndarray:
+    """Minutes -> "1h 25m" (or "45m" under an hour); rounds to whole minutes."""
+    v = _to_float(values)
+    valid = np.isfinite(v)
+    mins = np.where(valid, np.rint(v), 0).astype(np.int64)
+
+    with_hours = np.strings.add(
+        np.strings.add(_int_str(mins // 60), "h "),
+        np.strings.add(_int_str(mins % 60), "m"),
+    )
+    out = np.where(mins >= 60, with_hours, np.strings.add(_int_str(mins), "m"))
+    return np.where(valid, out, "")
+
+
+def format_hh_mm(values: Any) -> np.ndarray:
+    """Minutes -> "1:25"; rounds to whole minutes."""
+    v = _to_float(values)
+    valid = np.isfinite(v)
+    mins = np.where(valid, np.rint(v), 0).astype(np.int64)
+
+    out = np.strings.add(
+        np.strings.add(_int_str(mins // 60), ":"),
+        _zfill(_int_str(mins % 60), 2),
+    )
+    return np.where(valid, out, "")
+
+
+def format_duration(values: Any) -> np.ndarray:
+    """Minutes -> "1h 05m" (or "45m" under an hour); truncates to whole minutes."""
+    v = _to_float(values)
+    valid = np.isfinite(v)
+    mins = np.where(valid, np.trunc(v), 0).astype(np.int64)
+    hours = mins // 60
+
+    with_hours = np.strings.add(
+        np.strings.add(_int_str(hours), "h "),
+        np.strings.add(_zfill(_int_str(mins % 60), 2), "m"),
+    )
+    out = np.where(hours > 0, with_hours, np.strings.add(_int_str(mins % 60), "m"))
+    return np.where(valid, out, "")
+
+
+def format_int(values: Any) -> np.ndarray:
+    """Numbers -> rounded integers with thousands separators ("12,346"); missing -> "0"."""
+    v = _to_float(values)
+    n = np.where(np.isfinite(v), np.rint(v), 0).astype(np.int64)
+    a = np.abs(n)
+
+    # Build groups of three digits from the right; a group is zero-padded
+    # only when a higher group precedes it
+    out = _int_str(a % 1000)
+    out = np.where(a >= 1000, _zfill(out, 3), out)
+    scale = 1000
+    while a.size and scale <= a.max():
+        group = _int_str((a // scale) % 1000)
+        group = np.where(a // scale >= 1000, _zfill(group, 3), group)
+        out = np.where(a >= scale, np.strings.add(np.strings.add(group, ","), out), out)
+        scale *= 1000
+
+    return np.where(n < 0, np.strings.add("-", out), out)
+
+
+def format_clock(values: Any, zero_pad_hour: bool = False) -> np.ndarray:
+    """Timestamps -> 12-hour clock times ("9:05 AM", or "09:05 AM" with zero_pad_hour)."""
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values):
+        shape, ts = values.shape, values.reset_index(drop=True)
+    else:
+        arr = np.asarray(values, dtype=object)
+        shape, ts = arr.shape, pd.to_datetime(pd.Series(arr.ravel()), errors="coerce")
+    valid = ts.notna().to_numpy()
+    hour = ts.dt.hour.fillna(0).to_numpy(dtype=np.int64)
+    minute = ts.dt.minute.fillna(0).to_numpy(dtype=np.int64)
+
+    hour_12 = _int_str(np.where(hour % 12 == 0, 12, hour % 12))
+    if zero_pad_hour:
+        hour_12 = _zfill(hour_12, 2)
+
+    out = np.strings.add(
+        np.strings.add(hour_12, ":"),
+        np.strings.add(_zfill(_int_str(minute), 2), np.where(hour < 12, " AM", " PM")),
+    )
+    return np.where(valid, out, "").reshape(shape)
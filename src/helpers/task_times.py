@@ -0,0 +1,197 @@
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+# Task time-field validation core.
+#
+# The task forms have six time inputs (start date/time, end date/time,
+# duration hours/minutes). TaskTimeFields parses each of them exactly once and
+# derives what the save path needs from the parsed values: invalid flags,
+# inferred start/end and duration, and the DB-ready time fields
+# (validate_tasks.py, callbacks/pages/log_time.py). The live form feedback runs
+# in the browser: assets/task_form.js mirrors these rules.
+
+TIME_FIELD_NAMES = ("start_date", "start_time", "end_date", "end_time", "hours", "minutes")
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def parse_date(value: Any) -> date | None:
+    """YYYY-MM-DD -> date, or None if blank/invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def parse_time(value: Any) -> time | None:
+    """HH:MM -> time, or None if blank/invalid."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except ValueError:
+        return None
+
+
+def _parse_int(value: Any) -> int | None:
+    if _is_blank(value):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TaskTimeFields:
+    """
+    The six task time inputs, parsed once.
+
+    start_dt / end_dt: datetimes when both parts are valid, else None.
+    hours / minutes:   entered integers (None if blank or not an integer).
+    invalid_*:         per-field flags, as shown on the form. Blank fields are
+                       never invalid; end <= start flags all four date/time
+                       fields; an entered duration must match start -> end.
+    """
+
+    __slots__ = (
+        "start_dt",
+        "end_dt",
+        "hours",
+        "minutes",
+        "invalid_start_date",
+        "invalid_start_time",
+        "invalid_end_date",
+        "invalid_end_time",
+        "invalid_hours",
+        "invalid_minutes",
+    )
+
+    def __init__(
+        self,
+        start_date: Any,
+        start_time: Any,
+        end_date: Any,
+        end_time: Any,
+        hours: Any,
+        minutes: Any,
+    ) -> None:
+        start_d, start_t = parse_date(start_date), parse_time(start_time)
+        end_d, end_t = parse_date(end_date), parse_time(end_time)
+        self.start_dt = datetime.combine(start_d, start_t) if start_d and start_t else None
+        self.end_dt = datetime.combine(end_d, end_t) if end_d and end_t else None
+        self.hours = _parse_int(hours)
+        self.minutes = _parse_int(minutes)
+
+        # --- per-field validation (only non-empty values can be invalid) ---
+        self.invalid_start_date = not _is_blank(start_date) and start_d is None
+        self.invalid_start_time = not _is_blank(start_time) and start_t is None
+        self.invalid_end_date = not _is_blank(end_date) and end_d is None
+        self.invalid_end_time = not _is_blank(end_time) and end_t is None
+        self.invalid_hours = not _is_blank(hours) and (self.hours is None or self.hours < 0)
+        self.invalid_minutes = not _is_blank(minutes) and (self.minutes is None or not 0 <= self.minutes <= 59)
+
+        # --- cross-field checks ---
+        span = self.span_min
+        if span is not None and span <= 0:
+            self.invalid_start_date = self.invalid_start_time = True
+            self.invalid_end_date = self.invalid_end_time = True
+        elif (
+            span is not None
+            and (not _is_blank(hours) or not _is_blank(minutes))
+            and not self.invalid_hours
+            and not self.invalid_minutes
+        ):
+            if self.hours is not None and self.hours != span // 60:
+                self.invalid_hours = True
+            if self.minutes is not None and self.minutes != span % 60:
+                self.invalid_minutes = True
+
+    @classmethod
+    def from_form(cls, form_values: dict[str, Any]) -> "TaskTimeFields":
+        return cls(*(form_values.get(name, "") for name in TIME_FIELD_NAMES))
+
+    # ---------- flags ----------
+    @property
+    def invalid(self) -> tuple[bool, bool, bool, bool, bool, bool]:
+        """Flags in form order: start date, start time, end date, end time, hours, minutes."""
+        return (
+            self.invalid_start_date,
+            self.invalid_start_time,
+            self.invalid_end_date,
+            self.invalid_end_time,
+            self.invalid_hours,
+            self.invalid_minutes,
+        )
+
+    @property
+    def invalid_dict(self) -> dict[str, bool]:
+        return dict(zip(TIME_FIELD_NAMES, self.invalid))
+
+    @property
+    def any_invalid(self) -> bool:
+        return any(self.invalid)
+
+    # ---------- durations ----------
+    @property
+    def span_min(self) -> int | None:
+        """Minutes from start to end (may be <= 0), or None unless both are set."""
+        if self.start_dt is None or self.end_dt is None:
+            return None
+        return int((self.end_dt - self.start_dt).total_seconds() // 60)
+
+    @property
+    def entered_min(self) -> int | None:
+        """Duration typed into hours/minutes, or None if neither is an integer."""
+        if self.hours is None and self.minutes is None:
+            return None
+        return (self.hours or 0) * 60 + (self.minutes or 0)
+
+    # ---------- inferred times ----------
+    def inferred(self) -> tuple[int | None, datetime | None, datetime | None]:
+        """
+        (duration_min, start_dt, end_dt), filling in a missing end/start from
+        the other one plus the entered duration. Lenient: uses whatever parsed.
+        """
+        start_dt, end_dt = self.start_dt, self.end_dt
+        span = self.span_min
+        if span is not None and span > 0:
+            duration = span
+        else:
+            duration = self.entered_min
+
+        if duration is not None:
+            if start_dt is not None and end_dt is None:
+                end_dt = start_dt + timedelta(minutes=duration)
+            elif end_dt is not None and start_dt is None:
+                start_dt = end_dt - timedelta(minutes=duration)
+        return duration, start_dt, end_dt
+
+    def time_output(self) -> dict[str, Any]:
+        """
+        DB-ready start_at / end_at / duration_min / date, all None unless the
+        fields are valid and pin down a positive interval.
+        """
+        start_at = end_at = duration_min = None
+        if not self.any_invalid:
+            span = self.span_min
+            entered = self.entered_min
+            if span is not None and span > 0:
+                start_at, end_at, duration_min = self.start_dt, self.end_dt, span
+            elif entered is not None and entered > 0:
+                if self.start_dt is not None and self.end_dt is None:
+                    start_at, duration_min = self.start_dt, entered
+                    end_at = self.start_dt + timedelta(minutes=entered)
+                elif self.end_dt is not None and self.start_dt is None:
+                    end_at, duration_min = self.end_dt, entered
+                    start_at = self.end_dt - timedelta(minutes=entered)
+
+        return {
+            "start_at": start_at,
+            "end_at": end_at,
+            "duration_min": duration_min,
+            "date": start_at.date() if start_at else None,
+        }
@@ -2,7 +2,8 @@ from typing import Any
 
 from dash import html
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+
+from src.helpers.figure_specs import figure_spec
 
 def create_toast(
     page: str,
@@ -85,18 +86,18 @@ def labeled_control_row(
         width=col_width,
     )
 
-def empty_fig(message: str = "No productive time logged today.") -> go.Figure:
-    fig = go.Figure()
-    fig.add_annotation(
-        text=message,
-        x=0.0, y=0.98,
-        xref="paper", yref="paper",
-        showarrow=False,
-    )
-    fig.update_xaxes(visible=False)
-    fig.update_yaxes(visible=False)
-    fig.update_layout(
-        template="plotly_white",
-        margin=dict(l=0, r=0, t=0, b=0),
+def empty_fig(message: str = "No productive time logged today.") -> dict[str, Any]:
+    return figure_spec(
+        [],
+        {
+            "annotations": [{
+                "text": message,
+                "x": 0.0, "y": 0.98,
+                "xref": "paper", "yref": "paper",
+                "showarrow": False,
+            }],
+            "xaxis": {"visible": False},
+            "yaxis": {"visible": False},
+            "margin": {"l": 0, "r": 0, "t": 0, "b": 0},
+        },
     )
-    return fig
@@ -1,7 +1,6 @@
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from src.data_access.db import get_first_user_id
 from src.layout.navigation import create_left_navigation, create_right_sidebar
 from src.layout.overlays import generate_delete_modal, generate_edit_task_offcanvas, generate_edit_settings_offcanvas
 
@@ -9,10 +8,10 @@ from src.layout.overlays import generate_delete_modal, generate_edit_task_offcan
 def create_layout() -> dbc.Container:
     return dbc.Container(
         [
-            dcc.Store(id="edit-task-inputs", data={}),
             dcc.Store(id="log-task-inputs", data={}),
             dcc.Store(id="date-range-store", data="btn-1"),  # TODO: ensure consistent naming
             dcc.Store(id="task-nav-update-store", data={}),
+            dcc.Store(id="task-grid-action", data=None),  # {"action": "edit"|"delete", "task_id", "ts"}
 
 
             dcc.Store(id="last-update", data={}), # Master updater
@@ -22,9 +21,8 @@ def create_layout() -> dbc.Container:
             dcc.Store(id="last-update-daily-metrics", data={}),
             dcc.Store(id="daily-metrics-specs", data={}),
 
-            # NOTE: This triggers a DB call at layout creation time.
-            # Consider setting this via a callback on first load.
-            dcc.Store(id="user-id", data=get_first_user_id()),
+            # Set from the nav user dropdown, which load_users fills on first load
+            dcc.Store(id="user-id", data=None),
 
             generate_delete_modal(),
             generate_edit_task_offcanvas(),
@@ -4,7 +4,7 @@ from dash import dcc, html
 import dash_bootstrap_components as dbc
 
 from src.data_access.db import get_users
-from src.helpers.general import fmt_h_m
+from src.helpers.formatting import format_h_m
 from src.layout.common_components import create_toast
 
 
@@ -60,6 +60,18 @@ def create_left_navigation() -> html.Div:
                                 active="exact",
                                 className="py-2",
                             ),
+                            dbc.NavLink(
+                                [html.I(className="bi bi-clock-history me-2"), "Task History"],
+                                href="/task_history",
+                                active="exact",
+                                className="py-2",
+                            ),
+                            dbc.NavLink(
+                                [html.I(className="bi bi-search me-2"), "Search Tasks"],
+                                href="/task_search",
+                                active="exact",
+                                className="py-2",
+                            ),
                         ],
                         vertical=True,
                         className="flex-column",
@@ -97,9 +109,9 @@ def create_left_navigation() -> html.Div:
                 [
                     dcc.Dropdown(
                         id={"page": "nav", "name": "users", "type": "dropdown"},
-                        options=get_dcc_options(),
+                        options=[],  # options and value set by load_users on first load
                         placeholder="Select user...",
-                        value=None,  # set via callback on first load
+                        value=None,
                         className="mb-2 sidebar-dropup",
                     ),
                     dbc.NavLink(
@@ -188,12 +200,16 @@ def render_today_summary_table(payload: dict[str, Any] | None) -> dbc.Table | ht
     total = payload.get("total", 0)
     screen_minutes = payload.get("screen_minutes")
 
+    # One formatting pass: category rows, then total, then screen time
+    minutes = [r["minutes"] for r in rows] + [total, screen_minutes]
+    *row_times, total_time, screen_time = format_h_m(minutes).tolist()
+
     body_rows = [
-        html.Tr([html.Td(r["category"]), html.Td(fmt_h_m(r["minutes"]))]) for r in rows
+        html.Tr([html.Td(r["category"]), html.Td(row_time)]) for r, row_time in zip(rows, row_times)
     ]
     body_rows.append(
         html.Tr(
-            [html.Td(html.Strong("Total")), html.Td(html.Strong(fmt_h_m(total)))],
+            [html.Td(html.Strong("Total")), html.Td(html.Strong(total_time))],
             style={"borderTop": "1px solid #ddd"},
         )
     )
@@ -209,7 +225,7 @@ def render_today_summary_table(payload: dict[str, Any] | None) -> dbc.Table | ht
             html.Tr(
                 [
                     html.Td(html.Strong("Screen"), style={"color": "#b00020"}),
-                    html.Td(html.Strong(fmt_h_m(screen_minutes)), style={"color": "#b00020"}),
+                    html.Td(html.Strong(screen_time), style={"color": "#b00020"}),
                 ],
                 style={"borderTop": "1px solid #ddd"},
             )
@@ -1,47 +1,52 @@
 from datetime import date
+from typing import Any
 
 from dash import html
 import dash_bootstrap_components as dbc
 
-from src.data_access.db import get_daily_metrics_definitions
 from src.layout.common_components import create_toast, labeled_control_row
 from src.logic.pages.daily_metric import metric_placeholder, normalize_metric_definitions
 
+DAILY_METRICS_PAGE = "daily-metrics"
 
-def create_daily_metrics(user_id: str) -> dbc.Form:
-    # - determine whether layout should be different for different users (probably yes)
 
-    page = "daily-metrics"
+def _metric_input(name: str, placeholder: str, value: Any = None, width: str = "8.75rem") -> dbc.Input:
+    return dbc.Input(
+        id={"page": DAILY_METRICS_PAGE, "name": name, "type": "input"},
+        type="text",
+        value=value,
+        placeholder=placeholder,
+        style={"width": width, "textAlign": "right"},
+        autoComplete="off",
+        debounce=True,
+    )
 
-    def input_(name: str, placeholder: str, width: str = "8.75rem") -> dbc.Input:
-        return dbc.Input(
-            id={"page": page, "name": name, "type": "input"},
-            type="text",
-            placeholder=placeholder,
-            style={"width": width, "textAlign": "right"},
-            autoComplete="off",
-            debounce=True,
-        )
 
-    metrics_list = get_daily_metrics_definitions(user_id)
+def render_daily_metric_rows(metrics_list: list[dict[str, Any]], values: dict[str, Any]) -> list[Any] | html.Small:
+    """One labeled input per active metric, pre-filled with the display values for the selected date."""
     norm_metric_list = normalize_metric_definitions(metrics_list)
+    if len(norm_metric_list) == 0:
+        return html.Small("No active metrics.", className="text-muted")
 
-    rows = [
-        (
+    return [
+        labeled_control_row(
             m["display_name"],
-            input_(m["metric_key"], metric_placeholder(m["is_duration"])),
+            _metric_input(m["metric_key"], metric_placeholder(m["is_duration"]), values.get(m["metric_key"])),
+            col_width=12,
+            label_width="8.75rem",
+            className="mb-3",
         )
         for m in norm_metric_list
     ]
 
+
+def create_daily_metrics(user_id: str) -> dbc.Form:
+    # - determine whether layout should be different for different users (probably yes)
+
+    page = DAILY_METRICS_PAGE
+
     # Label width (8.75rem) + input width (8.75rem) + gap (0.5rem)
     date_input_width = "18rem"
-    if len(rows) == 0:
-        return dbc.Form(
-            [
-                dbc.Row(dbc.Col(html.H5("Daily Metrics"))),
-                dbc.Row(dbc.Col(html.Small("No active metrics.", className="text-muted"))),
-            ])
 
     return dbc.Form(
         [
@@ -65,16 +70,9 @@ def create_daily_metrics(user_id: str) -> dbc.Form:
                 className="mb-4",
             ),
 
-            *[
-                labeled_control_row(
-                    label,
-                    control,
-                    col_width=12,
-                    label_width="8.75rem",
-                    className="mb-3",
-                )
-                for label, control in rows
-            ],
+            # Metric rows depend on the user's definitions: rendered with the
+            # date's values by load_metrics_for_date once the page renders
+            html.Div(id={"page": page, "name": "metric-rows", "type": "form"}),
             dbc.Row(
                 dbc.Col(
                     dbc.Button(
@@ -3,20 +3,14 @@ from datetime import date
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from src.helpers.general import fmt_h_m
+from src.helpers.figure_specs import blank_figure_spec
 from src.layout.shared_components.components import date_cycler_row
-from src.logic.pages.daily_summary import (
-    df_to_daily_html_table,
-    get_subcategory_df_for_date,
-    make_stacked_subcategory_fig,
-)
 
 
 def create_daily_summary_page(user_id: str) -> dbc.Container:
     """Create the daily summary page for a given user."""
     page = "daily-summary"
     selected_date = date.today().isoformat()
-    combined = get_subcategory_df_for_date(user_id, selected_date)
 
     return dbc.Container(
         [
@@ -32,8 +26,9 @@ def create_daily_summary_page(user_id: str) -> dbc.Container:
             dbc.Row(
                 [
                     dbc.Col(
+                        # Graph and table are filled by update_daily_summary once the page renders
                         dcc.Graph(
-                            figure=make_stacked_subcategory_fig(combined),
+                            figure=blank_figure_spec(),
                             style={"height": "20.625rem"},
                             config={"displayModeBar": False},
                             id={"page": page, "name": "subcategory-graph", "type": "graph"},
@@ -42,7 +37,6 @@ def create_daily_summary_page(user_id: str) -> dbc.Container:
                     ),
                     dbc.Col(
                         html.Div(
-                            df_to_daily_html_table(combined, fmt_h_m),
                             className="d-flex flex-column",
                             style={"width": "20rem", "height": "20.625rem"},
                             id={"page": page, "name": "subcategory-table", "type": "table"},
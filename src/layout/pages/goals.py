@@ -1,7 +1,6 @@
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from src.data_access.goals import get_goals_themes
 from src.layout.common_components import create_toast, labeled_control_row
 
 
@@ -18,7 +17,7 @@ def create_goals(user_id: str) -> dbc.Container:
                         "Theme",
                         dcc.Dropdown(
                             id={"page": page, "name": "goal-theme", "type": "dropdown"},
-                            options=get_goals_themes(user_id),
+                            options=[],  # filled by load_goal_themes once the page renders
                             placeholder="Select goal theme...",
                         ),
                         col_width=4,
@@ -42,9 +42,14 @@ def create_task_inputs(
     user_id: str,
     store_data: dict[str, Any] | None = None,
     values: dict[str, Any] | None = None,
+    category_options: list[dict[str, Any]] | None = None,
 ) -> list[Any]:
+    # category_options=None loads the user's categories here; pages that fill
+    # them from a callback pass [] so building the layout runs no query
     group = "task-input"
     values = normalize_task_values(values)
+    if category_options is None:
+        category_options = get_category_layout(user_id, include_all_option=False)
 
     return [
         # ---------------------- Start/End Time ----------------------
@@ -164,7 +169,7 @@ def create_task_inputs(
                     "Category",
                     dcc.Dropdown(
                         id={"page": page, "group": group, "name": "task-category", "type": "dropdown"},
-                        options=get_category_layout(user_id, include_all_option=False),
+                        options=category_options,
                         placeholder="Select category...",
                         value=values["category_id"],
                     ),
@@ -182,15 +187,17 @@ def create_task_inputs(
                             id={"page": page, "group": group, "name": "task-subcategory", "type": "input"},
                             type="text",
                             placeholder="Enter subcategory...",
-                            list="subcategory-suggestions",  # must be a string for HTML datalist
+                            list=f"{page}-subcategory-suggestions",  # must be a string for HTML datalist
                             value=values["subcategory"],
                         ),
                         # NOTE: datalist needs a plain string id so the 'list' attribute works correctly
-                        # Todo: Update datalist based on db
+                        # Filled per category and typed prefix, most frecent first (register_task_suggestions)
                         html.Datalist(
-                            id="subcategory-suggestions",
+                            id=f"{page}-subcategory-suggestions",
                             children=[],
                         ),
+                        # Debounced {field: typed text} that drives the suggestion lookups
+                        dcc.Store(id=f"{page}-suggestion-query", data={}),
                     ],
                     col_width=6,
                     label_width="6.875rem",
@@ -203,12 +210,19 @@ def create_task_inputs(
             [
                 labeled_control_row(
                     "Activity",
-                    dbc.Input(
-                        id={"page": page, "group": group, "name": "task-activity", "type": "input"},
-                        type="text",
-                        placeholder="Enter activity...",
-                        value=values["activity"],
-                    ),
+                    [
+                        dbc.Input(
+                            id={"page": page, "group": group, "name": "task-activity", "type": "input"},
+                            type="text",
+                            placeholder="Enter activity...",
+                            list=f"{page}-activity-suggestions",
+                            value=values["activity"],
+                        ),
+                        html.Datalist(
+                            id=f"{page}-activity-suggestions",
+                            children=[],
+                        ),
+                    ],
                     col_width=6,
                     label_width="6.875rem",
                 ),
@@ -249,7 +263,7 @@ def create_task_form(user_id: str) -> dbc.Container:
                             dbc.Row(
                                 dbc.Col(
                                     [
-                                        *create_task_inputs(page, user_id),
+                                        *create_task_inputs(page, user_id, category_options=[]),
                                     ],
                                     width=8,
                                 ),
@@ -1,26 +1,23 @@
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from src.data_access.db import load_category_id_to_name
-from src.helpers.general import get_category_layout
-from src.logic.pages.patterns_trends import get_task_summary_data, plot_cat_from_store, plot_ts
+from src.helpers.figure_specs import blank_figure_spec
+from src.logic.pages.patterns_trends import BUTTON_TO_DAYS, category_bars_layout
 
 
 def create_trends_page(user_id: str) -> dbc.Container:
-    # NOTE: These data fetches/figures are computed at layout creation time.
-    # If load time becomes an issue, move into callbacks and/or cache results.
-    category_dict = load_category_id_to_name(user_id)
-    task_summary_agg, category_ts = get_task_summary_data(user_id)
-
-    fig_ts = plot_ts(category_ts, category_dict)
-
-    day_nums = 1  # TODO: wire this as a preset and then as an option
-    fig_cat = plot_cat_from_store(task_summary_agg, category_dict, day_nums)
-
+    # Skeleton only: load_trends_data fills the stores and category options,
+    # load_ts_figure the time series, once the page renders (both background
+    # jobs; the progress bars show while they run)
     return dbc.Container(
         [
-            dcc.Store(id="task-summary-store", data=task_summary_agg),
-            dcc.Store(id="trends-category-dict-store", data=category_dict),
+            # The category bars are drawn clientside (assets/trends.js) from
+            # these: per-horizon totals, category names, the base layout and
+            # the range button -> horizon days map
+            dcc.Store(id="task-summary-store"),
+            dcc.Store(id="trends-category-dict-store"),
+            dcc.Store(id="trends-bar-layout-store", data=category_bars_layout()),
+            dcc.Store(id="trends-range-days-store", data=BUTTON_TO_DAYS),
             dbc.Row(dbc.Col(html.H5("Patterns & Trends"))),
 
             dbc.Row(
@@ -49,7 +46,7 @@ def create_trends_page(user_id: str) -> dbc.Container:
                                 dbc.Label("Category", className="mb-0"),
                                 dbc.Select(
                                     id="category-dropdown",
-                                    options=get_category_layout(user_id, include_all_option=True),
+                                    options=[{"label": "All Categories", "value": "all"}],
                                     value="all",
                                 ),
                             ],
@@ -61,12 +58,14 @@ def create_trends_page(user_id: str) -> dbc.Container:
                 className="mb-3 align-items-center",
             ),
 
+            dbc.Progress(id="trends-progress", value=0, striped=True, animated=True, style={"display": "none"}),
+
             dbc.Row(
                 [
                     dbc.Col(
                         dcc.Graph(
                             id="productivity-graph",
-                            figure=fig_cat,
+                            figure=blank_figure_spec(),
                             style={"height": "20.625rem"},
                             config={"staticPlot": True},
                         ),
@@ -77,12 +76,44 @@ def create_trends_page(user_id: str) -> dbc.Container:
 
             dbc.Row([dbc.Col(html.Hr(), width=12)]),
 
+            dbc.Row(
+                dbc.Col(
+                    html.Div(
+                        [
+                            dbc.Label("Resolution", className="mb-0"),
+                            dbc.Select(
+                                id="ts-resolution",
+                                options=[
+                                    {"label": "Auto", "value": "auto"},
+                                    {"label": "Daily", "value": "day"},
+                                    {"label": "Weekly", "value": "week"},
+                                    {"label": "Monthly", "value": "month"},
+                                ],
+                                value="auto",
+                            ),
+                        ],
+                        className="d-flex align-items-center gap-2",
+                    ),
+                    width={"size": 4, "offset": 8},
+                ),
+                className="mb-2",
+            ),
+
+            dbc.Progress(
+                id="trends-ts-progress",
+                value=100,
+                label="Building history",
+                striped=True,
+                animated=True,
+                style={"display": "none"},
+            ),
+
             dbc.Row(
                 [
                     dbc.Col(
                         dcc.Graph(
                             id="ts-graph",
-                            figure=fig_ts,
+                            figure=blank_figure_spec(),
                             style={"height": "20.625rem"},
                         ),
                         width=12,
@@ -0,0 +1,136 @@
+from typing import Any
+
+from dash import dash_table, dcc, html
+import dash_bootstrap_components as dbc
+import pandas as pd
+
+from src.layout.shared_components.components import labeled_fixed_width_control_row
+from src.layout.shared_components.tables import task_grid
+
+TASK_HISTORY_PAGE = "task-history"
+
+
+def task_history_status(n_loaded: int, has_more: bool) -> str:
+    if n_loaded == 0:
+        return "No tasks match these filters."
+    suffix = "" if has_more else " (all matching tasks)"
+    return f"Showing {n_loaded:,} task{'s' if n_loaded != 1 else ''}{suffix}"
+
+
+def render_task_history_grid(task_rows: pd.DataFrame) -> dash_table.DataTable:
+    # Always virtualized: "Load more" grows the grid in place
+    return task_grid(
+        TASK_HISTORY_PAGE,
+        task_rows,
+        height="calc(100vh - 18rem)",
+        with_date=True,
+        virtualized=True,
+    )
+
+
+def _filter_input(name: str, placeholder: str) -> dbc.Input:
+    return dbc.Input(
+        id={"page": TASK_HISTORY_PAGE, "name": name, "type": "filter"},
+        type="text",
+        placeholder=placeholder,
+        debounce=True,
+    )
+
+
+def create_task_history_page(user_id: str) -> dbc.Container:
+    page = TASK_HISTORY_PAGE
+    # Skeleton only: update_task_history loads the first page once the page renders
+    empty = pd.DataFrame(
+        columns=["task_id", "date", "start_at", "end_at", "duration_min", "category", "subcategory", "activity", "notes"]
+    )
+
+    filters: list[Any] = [
+        labeled_fixed_width_control_row(
+            "From",
+            dbc.Input(id={"page": page, "name": "start-date", "type": "filter"}, type="date"),
+            control_width="10rem",
+            label_width="3rem",
+            className="mb-2",
+        ),
+        labeled_fixed_width_control_row(
+            "To",
+            dbc.Input(id={"page": page, "name": "end-date", "type": "filter"}, type="date"),
+            control_width="10rem",
+            label_width="2rem",
+            className="mb-2",
+        ),
+        labeled_fixed_width_control_row(
+            "Category",
+            dbc.Select(
+                id={"page": page, "name": "category", "type": "filter"},
+                options=[{"label": "All Categories", "value": "all"}],
+                value="all",
+            ),
+            control_width="12rem",
+            label_width="4.5rem",
+            className="mb-2",
+        ),
+        labeled_fixed_width_control_row(
+            "Subcategory",
+            _filter_input("subcategory", "Contains..."),
+            control_width="10rem",
+            label_width="6rem",
+            className="mb-2",
+        ),
+        labeled_fixed_width_control_row(
+            "Activity",
+            _filter_input("activity", "Contains..."),
+            control_width="10rem",
+            label_width="4rem",
+            className="mb-2",
+        ),
+    ]
+
+    return dbc.Container(
+        [
+            dbc.Row(dbc.Col(html.H5("Task History")), className="mb-2"),
+            dbc.Row(filters, className="g-3 mb-2"),
+            dbc.Row(
+                dbc.Col(
+                    html.Div(
+                        render_task_history_grid(empty),
+                        id={"page": page, "name": "task-table", "type": "table"},
+                        style={"minHeight": "28rem"},
+                    ),
+                    width=12,
+                ),
+                className="mb-2",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.Small(
+                            id={"page": page, "name": "status", "type": "text"},
+                            className="text-muted",
+                        ),
+                        className="d-flex align-items-center",
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            "Load more",
+                            id={"page": page, "name": "load-more", "type": "button"},
+                            color="light",
+                            size="sm",
+                            disabled=True,
+                            n_clicks=0,
+                        ),
+                        width="auto",
+                    ),
+                ],
+                className="mb-3",
+            ),
+            # Keyset cursor for the next page + rows loaded so far (the grid's
+            # data stays in the browser; "Load more" only appends)
+            dcc.Store(
+                id={"page": page, "name": "cursor", "type": "store"},
+                data={"after": None, "loaded": 0},
+            ),
+        ],
+        fluid=True,
+        className="p-0",
+    )
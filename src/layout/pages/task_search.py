@@ -0,0 +1,116 @@
+from dash import dash_table, dcc, html
+import dash_bootstrap_components as dbc
+import pandas as pd
+
+from src.layout.shared_components.components import labeled_fixed_width_control_row
+from src.layout.shared_components.tables import task_grid
+
+TASK_SEARCH_PAGE = "task-search"
+
+
+def task_search_status(query: str | None, n_loaded: int, has_more: bool) -> str:
+    if not query:
+        return "Search activities, subcategories and notes."
+    if n_loaded == 0:
+        return "No matching tasks."
+    suffix = "" if has_more else " (all matches)"
+    return f"Showing {n_loaded:,} match{'es' if n_loaded != 1 else ''}{suffix}"
+
+
+def render_task_search_grid(task_rows: pd.DataFrame) -> dash_table.DataTable:
+    return task_grid(
+        TASK_SEARCH_PAGE,
+        task_rows,
+        height="calc(100vh - 18rem)",
+        with_date=True,
+        highlighted=True,
+        virtualized=True,
+    )
+
+
+def create_task_search_page(user_id: str) -> dbc.Container:
+    page = TASK_SEARCH_PAGE
+    empty = pd.DataFrame(
+        columns=["task_id", "date", "start_at", "end_at", "duration_min", "category", "subcategory", "activity", "notes"]
+    )
+
+    return dbc.Container(
+        [
+            dbc.Row(dbc.Col(html.H5("Search Tasks")), className="mb-2"),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.InputGroup(
+                            [
+                                dbc.InputGroupText(html.I(className="bi bi-search")),
+                                dbc.Input(
+                                    id={"page": page, "name": "query", "type": "filter"},
+                                    type="search",
+                                    placeholder='e.g. parser refactor, "code review", -meeting',
+                                    debounce=True,
+                                    autoFocus=True,
+                                ),
+                            ],
+                        ),
+                        width=12,
+                        lg=5,
+                        className="mb-2",
+                    ),
+                    labeled_fixed_width_control_row(
+                        "From",
+                        dbc.Input(id={"page": page, "name": "start-date", "type": "filter"}, type="date"),
+                        control_width="10rem",
+                        label_width="3rem",
+                        className="mb-2",
+                    ),
+                    labeled_fixed_width_control_row(
+                        "To",
+                        dbc.Input(id={"page": page, "name": "end-date", "type": "filter"}, type="date"),
+                        control_width="10rem",
+                        label_width="2rem",
+                        className="mb-2",
+                    ),
+                ],
+                className="g-3 mb-2",
+            ),
+            dbc.Row(
+                dbc.Col(
+                    html.Div(
+                        render_task_search_grid(empty),
+                        id={"page": page, "name": "task-table", "type": "table"},
+                        style={"minHeight": "28rem"},
+                    ),
+                    width=12,
+                ),
+                className="mb-2",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        html.Small(
+                            task_search_status(None, 0, False),
+                            id={"page": page, "name": "status", "type": "text"},
+                            className="text-muted",
+                        ),
+                        className="d-flex align-items-center",
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            "Load more",
+                            id={"page": page, "name": "load-more", "type": "button"},
+                            color="light",
+                            size="sm",
+                            disabled=True,
+                            n_clicks=0,
+                        ),
+                        width="auto",
+                    ),
+                ],
+                className="mb-3",
+            ),
+            # Offset of the next page of ranked results
+            dcc.Store(id={"page": page, "name": "cursor", "type": "store"}, data={"offset": 0}),
+        ],
+        fluid=True,
+        className="p-0",
+    )
@@ -0,0 +1,232 @@
+from collections.abc import Sequence
+from typing import Any
+
+from dash import dash_table
+import pandas as pd
+
+from src.data_access.db import SEARCH_HIGHLIGHT_START, SEARCH_HIGHLIGHT_STOP
+from src.helpers.formatting import format_clock, format_duration
+
+# Compact table rendering.
+#
+# One DataTable per table instead of one html.Td component per cell: cells are
+# sent as plain records keyed by short column ids, and styling is expressed as
+# per-column / per-row rules rather than repeated on every cell. Large tables
+# can be virtualized so the browser only renders the visible rows.
+
+TABLE_STYLE_CELL = {
+    "fontFamily": "inherit",
+    "fontSize": "0.85rem",
+    "padding": "0.25rem 0.5rem",
+    "border": "none",
+    "borderBottom": "1px solid #f1f3f5",
+    "backgroundColor": "transparent",
+    "whiteSpace": "nowrap",
+    "overflow": "hidden",
+    "textOverflow": "ellipsis",
+}
+
+TABLE_STYLE_HEADER = {
+    "fontWeight": "400",
+    "backgroundColor": "transparent",
+    "borderBottom": "1px solid #dee2e6",
+}
+
+# Neutralize DataTable's active/selected cell highlight (cells are not editable)
+_QUIET_SELECTION = [
+    {"if": {"state": "active"}, "backgroundColor": "transparent", "border": "none"},
+    {"if": {"state": "selected"}, "backgroundColor": "transparent", "border": "none"},
+]
+
+# Action columns (e.g. edit/delete glyphs) act as buttons via active_cell
+_ACTION_STYLE = {"cursor": "pointer", "color": "#6c757d", "textAlign": "center"}
+
+
+def row_rule(row_indices: Sequence[int], style: dict[str, Any], column_ids: Sequence[str] | None = None) -> dict[str, Any]:
+    """Conditional style rule for the given source row indices (optionally limited to columns)."""
+    condition: dict[str, Any] = {"row_index": list(row_indices)}
+    if column_ids is not None:
+        condition["column_id"] = list(column_ids)
+    return {"if": condition, **style}
+
+
+def column_records(data: dict[str, Sequence[Any]], row_ids: Sequence[Any] | None = None) -> list[dict[str, Any]]:
+    """DataTable records from column arrays (row ids, if given, go under "id")."""
+    keys = list(data)
+    records = [dict(zip(keys, row)) for row in zip(*data.values())]
+    if row_ids is not None:
+        for record, row_id in zip(records, row_ids):
+            record["id"] = row_id
+    return records
+
+
+def compact_table(
+    table_id: str | dict[str, str],
+    columns: Sequence[dict[str, Any]],
+    data: dict[str, Sequence[Any]],
+    *,
+    row_ids: Sequence[Any] | None = None,
+    style_data_conditional: Sequence[dict[str, Any]] | None = None,
+    style_header_conditional: Sequence[dict[str, Any]] | None = None,
+    virtualized: bool = False,
+    height: str | None = None,
+) -> dash_table.DataTable:
+    """
+    Read-only DataTable from column arrays.
+
+    columns: [{"id": "c0", "name": "Mon Oct 05", "align": "right", "width": "88px",
+               "bold": False, "muted": False, "action": False, "markdown": False}, ...]
+             Only "id" and "name" are required.
+    data: column id -> values; all columns the same length.
+    row_ids: optional per-row ids, reported as active_cell["row_id"].
+    virtualized: render only visible rows (needs a fixed `height`).
+    """
+    records = column_records(data, row_ids)
+
+    style_cell_conditional = []
+    has_actions = False
+    for col in columns:
+        style: dict[str, Any] = {}
+        if col.get("align"):
+            style["textAlign"] = col["align"]
+        if col.get("width"):
+            style.update(width=col["width"], minWidth=col["width"], maxWidth=col["width"])
+        if col.get("bold"):
+            style["fontWeight"] = "600"
+        if col.get("muted"):
+            style["color"] = "#6c757d"
+        if col.get("action"):
+            style.update(_ACTION_STYLE)
+            has_actions = True
+        if style:
+            style_cell_conditional.append({"if": {"column_id": col["id"]}, **style})
+
+    style_table: dict[str, Any] = {"overflowX": "auto"}
+    if height:
+        style_table.update(height=height, overflowY="auto")
+
+    extra: dict[str, Any] = {}
+    if virtualized:
+        extra.update(virtualization=True, fixed_rows={"headers": True})
+
+    return dash_table.DataTable(
+        id=table_id,
+        columns=[
+            {"id": col["id"], "name": col["name"], **({"presentation": "markdown"} if col.get("markdown") else {})}
+            for col in columns
+        ],
+        data=records,
+        style_cell=TABLE_STYLE_CELL,
+        style_header=TABLE_STYLE_HEADER,
+        style_cell_conditional=style_cell_conditional,
+        style_data_conditional=[*_QUIET_SELECTION, *(style_data_conditional or [])],
+        style_header_conditional=list(style_header_conditional or []),
+        style_table=style_table,
+        style_as_list_view=True,
+        cell_selectable=has_actions,
+        page_action="none",
+        **extra,
+    )
+
+
+# Task lists: rows are tasks, the trailing glyph columns dispatch edit/delete
+# through the "task-grid-action" store (see callbacks/navigation.py)
+TASK_GRID_VIRTUALIZE_MIN_ROWS = 100
+
+TASK_GRID_COLUMNS = [
+    {"id": "start", "name": "Start", "width": "88px", "muted": True},
+    {"id": "end", "name": "End", "width": "88px", "muted": True},
+    {"id": "duration", "name": "Duration", "width": "88px", "align": "right"},
+    {"id": "category", "name": "Category"},
+    {"id": "subcategory", "name": "Subcategory"},
+    {"id": "activity", "name": "Activity"},
+    {"id": "notes", "name": "Notes", "muted": True, "width": "16rem"},
+    {"id": "edit", "name": "", "width": "36px", "action": True},
+    {"id": "delete", "name": "", "width": "36px", "action": True},
+]
+
+
+TASK_GRID_DATE_COLUMN = {"id": "date", "name": "Date", "width": "104px", "muted": True}
+TASK_GRID_TEXT_COLUMNS = ("subcategory", "activity", "notes")
+
+_MARKDOWN_SPECIAL = r"([\\`*_{}\[\]()#+\-.!|<>~])"
+
+
+def highlight_markdown(values: pd.Series) -> list[str]:
+    """Search headlines -> markdown: user text escaped, highlighted terms in bold."""
+    text = values.fillna("").astype(str).str.replace(_MARKDOWN_SPECIAL, r"\\\1", regex=True)
+    text = text.str.replace(SEARCH_HIGHLIGHT_START, "**", regex=False)
+    return text.str.replace(SEARCH_HIGHLIGHT_STOP, "**", regex=False).tolist()
+
+
+def _text_column(rows: pd.DataFrame, name: str) -> list[str]:
+    if name not in rows:
+        return [""] * len(rows)
+    return rows[name].fillna("").astype(str).tolist()
+
+
+def _task_grid_data(task_rows: pd.DataFrame, with_date: bool, highlighted: bool = False) -> dict[str, list[str]]:
+    n = len(task_rows)
+    data: dict[str, list[str]] = {}
+    if with_date:
+        data["date"] = pd.to_datetime(task_rows["date"]).dt.strftime("%a %b %d, %Y").fillna("").tolist()
+    data.update(
+        start=format_clock(task_rows["start_at"]).tolist(),
+        end=format_clock(task_rows["end_at"]).tolist(),
+        duration=format_duration(task_rows["duration_min"]).tolist(),
+        category=_text_column(task_rows, "category"),
+        subcategory=_text_column(task_rows, "subcategory"),
+        activity=_text_column(task_rows, "activity"),
+        notes=_text_column(task_rows, "notes"),
+        edit=["✎"] * n,
+        delete=["🗑"] * n,
+    )
+    if highlighted:
+        for name in TASK_GRID_TEXT_COLUMNS:
+            data[name] = highlight_markdown(pd.Series(data[name]))
+    return data
+
+
+def task_grid_records(
+    task_rows: pd.DataFrame,
+    *,
+    with_date: bool = False,
+    highlighted: bool = False,
+) -> list[dict[str, Any]]:
+    """Records for appending rows to an existing task_grid (e.g. via Patch().extend)."""
+    return column_records(
+        _task_grid_data(task_rows, with_date, highlighted),
+        task_rows["task_id"].astype(int).tolist(),
+    )
+
+
+def task_grid(
+    page: str,
+    task_rows: pd.DataFrame,
+    *,
+    height: str | None = None,
+    with_date: bool = False,
+    highlighted: bool = False,
+    virtualized: bool | None = None,
+) -> dash_table.DataTable:
+    """
+    Task list as a compact DataTable (expects load_tasks_for_day columns, plus
+    "date" when with_date is set).
+    highlighted: text columns carry search highlights (see search_tasks) and
+    render as markdown.
+    Virtualized above TASK_GRID_VIRTUALIZE_MIN_ROWS rows when a height is given,
+    unless `virtualized` says otherwise (e.g. for grids that grow in place).
+    """
+    if virtualized is None:
+        virtualized = height is not None and len(task_rows) >= TASK_GRID_VIRTUALIZE_MIN_ROWS
+    columns = [TASK_GRID_DATE_COLUMN, *TASK_GRID_COLUMNS] if with_date else TASK_GRID_COLUMNS
+    if highlighted:
+        columns = [{**col, "markdown": True} if col["id"] in TASK_GRID_TEXT_COLUMNS else col for col in columns]
+    return compact_table(
+        {"page": page, "name": "task-grid", "type": "task-grid"},
+        columns,
+        _task_grid_data(task_rows, with_date, highlighted),
+        row_ids=task_rows["task_id"].astype(int).tolist(),
+        virtualized=virtualized,
+        height=height,
+    )
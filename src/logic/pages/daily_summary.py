@@ -5,20 +5,22 @@ from dash import html
 import dash_bootstrap_components as dbc
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 
+from src.cache.result_cache import cached_result
 from src.data_access.db import (
     load_category_id_to_name,
     load_metrics_base_for_daily_summary,
     load_task_base_for_daily_summary,
 )
-from src.helpers.general import fmt_h_m
+from src.helpers.figure_encoding import typed_array
+from src.helpers.figure_specs import figure_spec
+from src.helpers.formatting import format_h_m
 from src.layout.common_components import empty_fig
 
 
 def df_to_daily_html_table(
     df: pd.DataFrame | None,
-    fmt_minutes_fn: Callable[[float], str],
+    fmt_minutes_fn: Callable[[Any], np.ndarray],
     highlight_rows: dict[Any, dict[str, Any]] | None = None,
 ) -> dbc.Table | None:
     """
@@ -37,8 +39,8 @@ def df_to_daily_html_table(
     df
         Pandas DataFrame with columns [category, subcategory, total_minutes].
     fmt_minutes_fn
-        Function that formats a minutes value into a display string.
-        Example: fmt_h_m(85) -> "1h 25m"
+        Column formatter (see helpers/formatting.py) from minutes to display strings.
+        Example: format_h_m([85]) -> ["1h 25m"]
     highlight_rows
         Optional dict mapping a row key to a CSS style dict. You can target:
           1) Category:                {"Screen": {"color":"#b00020","fontWeight":"600"}}
@@ -78,9 +80,8 @@ def df_to_daily_html_table(
     )
 
     body_rows = []
-    for _, r in df.iterrows():
-        cat = r["category"]
-        sub = r["subcategory"]
+    time_cells = fmt_minutes_fn(df["total_minutes"].to_numpy()).tolist()
+    for cat, sub, time_cell in zip(df["category"].tolist(), df["subcategory"].tolist(), time_cells):
         style = _row_style(cat, sub)
 
         body_rows.append(
@@ -88,7 +89,7 @@ def df_to_daily_html_table(
                 [
                     html.Td(cat, style=style),
                     html.Td(sub, style=style),
-                    html.Td(fmt_minutes_fn(r["total_minutes"]), className="text-end", style=style),
+                    html.Td(time_cell, className="text-end", style=style),
                 ]
             )
         )
@@ -104,6 +105,16 @@ def df_to_daily_html_table(
 
 
 def get_subcategory_df_for_date(user_id: str, summary_date: str | date) -> pd.DataFrame:
+    summary_date = summary_date.isoformat() if isinstance(summary_date, date) else summary_date
+    return cached_result(
+        user_id,
+        "subcategory_df_for_date",
+        lambda: _compute_subcategory_df_for_date(user_id, summary_date),
+        params=(summary_date,),
+    )
+
+
+def _compute_subcategory_df_for_date(user_id: str, summary_date: str | date) -> pd.DataFrame:
     task_summary = load_task_base_for_daily_summary(user_id, summary_date=summary_date)
     daily_summary = load_metrics_base_for_daily_summary(user_id, summary_date=summary_date)
 
@@ -142,7 +153,22 @@ def get_today_subcategory_df(user_id: str) -> pd.DataFrame:
     return get_subcategory_df_for_date(user_id, date.today())
 
 
-def make_stacked_subcategory_fig(df: pd.DataFrame | None) -> go.Figure:
+# Same fill for every subcategory segment, separated by thin white lines
+# (use "#dee2e6" for the separators if the background is not white)
+_STACKED_MARKER = {"color": "skyblue", "line": {"color": "#ffffff", "width": 1}}
+
+_STACKED_LAYOUT = {
+    "barmode": "overlay",  # segments carry explicit base offsets
+    "margin": {"l": 0, "r": 0, "t": 0, "b": 0},
+    "hoverlabel": {
+        "bordercolor": "#adb5bd",  # grey border
+        "font": {"color": "#212529"},  # dark text (Bootstrap body text)
+    },
+    "yaxis": {"title": {"text": ""}, "ticklabelstandoff": 3},
+}
+
+
+def make_stacked_subcategory_fig(df: pd.DataFrame | None) -> dict[str, Any]:
     """
     Horizontal stacked bar chart:
       - y = category
@@ -150,86 +176,62 @@ def make_stacked_subcategory_fig(df: pd.DataFrame | None) -> go.Figure:
       - subcategories stacked within each category
       - all segments same color, separated by thin lines
 
+    Rendered as a single bar trace: each (category, subcategory) segment is
+    placed with an explicit `base` offset, so the trace count and payload
+    don't grow with the number of distinct subcategories.
+
     Expected columns: category, subcategory, total_minutes
     Assumes df is already cleaned/filtered/aggregated upstream.
     """
     if df is None or df.empty:
         return empty_fig("No productive time logged today.")
 
-    d = df.copy()
-
-    # Category order: largest total on top
-    cat_order = (
-        d.groupby("category")["total_minutes"].sum()
-         .sort_values(ascending=True)  # ascending so largest ends up at top in horizontal bar
-         .index.tolist()
+    # One segment per (category, subcategory); no zero cells from a pivot
+    seg = (
+        df.groupby(["category", "subcategory"], as_index=False, sort=False)["total_minutes"].sum()
     )
+    seg = seg[seg["total_minutes"] > 0]
+    if seg.empty:
+        return empty_fig("No productive time logged today.")
 
-    # Build a wide table: rows=category, cols=subcategory
-    wide = (
-        d.pivot_table(
-            index="category",
-            columns="subcategory",
-            values="total_minutes",
-            aggfunc="sum",
-            fill_value=0,
-        )
-        .reindex(cat_order)
-    )
-
-    subcat_order = wide.sum(axis=0).sort_values(ascending=False).index
-    wide = wide[subcat_order]
-
-    fig = go.Figure()
-
-    # Same fill for every subcategory segment
-    fill_color = "skyblue"      # bootstrap-ish gray; change if you want
-    sep_color = "#ffffff"       # white separators; use "#dee2e6" if your background is not white
-
-
-    for subcat in wide.columns:
-        x = wide[subcat]
-        x_fmt = [fmt_h_m(v) for v in x]
-
-        fig.add_trace(
-            go.Bar(
-                y=wide.index,
-                x=x,
-                orientation="h",
-                name=str(subcat),          # name doesn't matter since we hide legend
-                showlegend=False,
-                marker=dict(
-                    color=fill_color,
-                    line=dict(color=sep_color, width=1),  # the separators
-                ),
-                customdata=x_fmt,
-                hovertemplate=(
-                    f"{subcat}<br>"
-                    "%{customdata}<extra></extra>"
-                ),
-            )
-        )
-
-    fig.update_layout(
-        barmode="stack",
-        margin=dict(l=0, r=0, t=0, b=0),
-        template="plotly_white",
-        hoverlabel=dict(
-            bordercolor="#adb5bd",  # grey border
-            font=dict(color="#212529"),  # dark text (Bootstrap body text)
-        )
-    )
-    fig.update_yaxes(title_text="",
-                     ticklabelstandoff=3,)
-
-    max_minutes = float(wide.to_numpy().sum(axis=1).max())
+    # Category order: largest total on top (ascending, since y runs bottom-up)
+    cat_totals = seg.groupby("category")["total_minutes"].sum().sort_values(ascending=True)
+
+    # Within a category, segments run from the largest subcategory (by day total) outward
+    seg["subcat_total"] = seg.groupby("subcategory")["total_minutes"].transform("sum")
+    seg = seg.sort_values("subcat_total", ascending=False, kind="stable")
+    minutes = seg["total_minutes"].to_numpy(dtype=float)
+    base = seg.groupby("category")["total_minutes"].cumsum().to_numpy(dtype=float) - minutes
+
+    data = [{
+        "type": "bar",
+        "orientation": "h",
+        "y": seg["category"].tolist(),
+        "x": typed_array(minutes),
+        "base": typed_array(base),
+        "showlegend": False,
+        "marker": _STACKED_MARKER,
+        "customdata": np.column_stack([seg["subcategory"].astype(str), format_h_m(minutes)]).tolist(),
+        "hovertemplate": "%{customdata[0]}<br>%{customdata[1]}<extra></extra>",
+    }]
+
+    max_minutes = float(cat_totals.max())
     tick_hours = np.arange(0, max_minutes / 60 + 0.5, 0.5)
 
-    fig.update_xaxes(
-        title_text="Hours",
-        tickmode="array",
-        tickvals=(tick_hours * 60).tolist(),
-        ticktext=[f"{h:g}" for h in tick_hours],
+    return figure_spec(
+        data,
+        {
+            **_STACKED_LAYOUT,
+            "yaxis": {
+                **_STACKED_LAYOUT["yaxis"],
+                "categoryorder": "array",
+                "categoryarray": cat_totals.index.tolist(),
+            },
+            "xaxis": {
+                "title": {"text": "Hours"},
+                "tickmode": "array",
+                "tickvals": (tick_hours * 60).tolist(),
+                "ticktext": [f"{h:g}" for h in tick_hours],
+            },
+        },
     )
-
-    return fig
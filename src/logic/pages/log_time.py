@@ -1,75 +1,23 @@
-from datetime import datetime
-from typing import Any
-
-from src.helpers.general import validate_time_inputs
-
-TWO_HOURS_MIN = 120
-
-
-def validate_task_fields(
-    start_date: str | None,
-    start_time: str | None,
-    end_date: str | None,
-    end_time: str | None,
-    hours: str | None,
-    minutes: str | None,
-    include_placeholders: bool = True,
-) -> tuple[Any, ...]:
-    inv_start_date, inv_start_time, inv_end_date, inv_end_time, inv_hours, inv_minutes = validate_time_inputs(
-        start_date, start_time, end_date, end_time, hours, minutes
+from collections.abc import Mapping
+
+from dash import html
+
+from src.cache.suggestion_index import SUGGESTION_FIELDS, suggest
+
+
+def suggestion_options(
+    user_id: str | None,
+    category_id: int | str | None,
+    prefixes: Mapping[str, str] | None = None,
+) -> tuple[list[html.Option], ...]:
+    """
+    Datalist options per SUGGESTION_FIELDS for a category, most frecent first.
+    prefixes: text typed so far per field; only values starting with it are offered.
+    """
+    if not user_id or not category_id:
+        return tuple([] for _ in SUGGESTION_FIELDS)
+    prefixes = prefixes or {}
+    return tuple(
+        [html.Option(value=value) for value in suggest(user_id, category_id, field, prefixes.get(field) or "")]
+        for field in SUGGESTION_FIELDS
     )
-
-    def parse_dt(d: str | None, t: str | None) -> datetime | None:
-        if not d or not t:
-            return None
-        try:
-            return datetime.strptime(f"{d} {t}", "%Y-%m-%d %H:%M")
-        except (TypeError, ValueError):
-            return None
-
-    def to_int(v: Any) -> int | None:
-        if v in (None, "", "None"):
-            return None
-        try:
-            return int(v)
-        except (TypeError, ValueError):
-            return None
-
-    start_dt = parse_dt(start_date, start_time)
-    end_dt = parse_dt(end_date, end_time)
-    h = to_int(hours)
-    m = to_int(minutes)
-
-    # Compute duration if possible
-    duration_min = None
-    if (h is not None) or (m is not None):
-        total = (h or 0) * 60 + (m or 0)
-        if total > 0:
-            duration_min = total
-    elif start_dt and end_dt:
-        diff_min = (end_dt - start_dt).total_seconds() / 60
-        if diff_min > 0:
-            duration_min = int(diff_min)
-
-    any_invalid = any([inv_start_date, inv_start_time, inv_end_date, inv_end_time, inv_hours, inv_minutes])
-
-    # Cosmetic warning
-    warn = (duration_min is not None) and (duration_min > TWO_HOURS_MIN) and (not any_invalid)
-    warn_class = "warning" if warn else ""
-    warn_text = "Warning: entry exceeds 2 hours." if warn else ""
-
-    if include_placeholders:
-        ph = ""
-        pm = ""
-        if start_dt and end_dt:
-            diff_min = (end_dt - start_dt).total_seconds() / 60
-            if diff_min > 0:
-                ph = str(int(diff_min // 60))
-                pm = f"{int(diff_min % 60):02d}"
-
-        return (
-            inv_start_date, inv_start_time, inv_end_date, inv_end_time, inv_hours, inv_minutes,
-            warn_class, warn_class, warn_text, ph, pm,
-        )
-
-    return inv_start_date, inv_start_time, inv_end_date, inv_end_time, inv_hours, inv_minutes
@@ -1,16 +1,51 @@
 import datetime as dt
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from scipy.ndimage import gaussian_filter1d
-
-from src.data_access.db import load_daily_metrics_base_for_view_trend, load_tasks_base_for_view_trend
+from src.cache.result_cache import cached_result
+from src.data_access.db import (
+    load_category_id_to_name,
+    load_daily_metrics_base_for_view_trend,
+    load_tasks_base_for_view_trend,
+)
+from src.data_access.rollups import (
+    ROLLUP_GRAINS,
+    RollupGrain,
+    load_time_rollups,
+    refresh_time_rollups,
+)
+from src.helpers.figure_encoding import DAY_MS, epoch_ms, typed_array
+from src.helpers.figure_specs import figure_spec
 
 # -- HELPERS --
 
+# Level of detail for the time-series chart: points per trace sent to the
+# browser, and the total point count above which traces switch to WebGL.
+TS_POINTS_PER_TRACE = 800
+TS_WEBGL_POINT_THRESHOLD = 5000
+
+# Time-series resolution options; "auto" picks the rollup grain from the visible range
+TS_RESOLUTIONS = ("auto", "day", "week", "month")
+
+# Approximate days per period, for sizing a range at each grain
+_GRAIN_DAYS = {"day": 1.0, "week": 7.0, "month": 30.44, "quarter": 91.31, "year": 365.25}
+
+# pandas period frequencies matching Postgres date_trunc (weeks are ISO: Monday start)
+_GRAIN_PERIOD_FREQ = {"week": "W-SUN", "month": "M", "quarter": "Q", "year": "Y"}
+
+# Shared layouts for the figure specs, built once
+_TS_LAYOUT: dict[str, Any] = {
+    "xaxis": {"title": {"text": "Date"}, "type": "date"},  # x is epoch milliseconds
+    "yaxis": {"title": {"text": "Average Daily Time (hours)"}, "rangemode": "tozero"},
+    "hovermode": "x",
+    "margin": {"l": 40, "r": 20, "t": 40, "b": 40},
+    "uirevision": "ts-graph",  # keep zoom state when the detail callback swaps data
+}
+
 BUTTON_TO_DAYS = {
     "btn-1": 1,
     "btn-7": 7,
@@ -20,6 +55,31 @@ BUTTON_TO_DAYS = {
     "btn-inf": -1,
 }
 
+
+@lru_cache(maxsize=1)
+def category_bars_layout() -> dict[str, Any]:
+    """
+    Base layout of the category bar charts; assets/trends.js fills in the bars,
+    subplot titles and y ranges from the task summary store.
+
+    Axis domains and title annotations come from a 1x2 make_subplots grid,
+    built on first use rather than at import (it validates a whole go.Figure).
+    Shared by reference, so treat it as read-only.
+    """
+    subplots = make_subplots(rows=1, cols=2, subplot_titles=[" ", " "]).layout.to_plotly_json()
+    return figure_spec(
+        [],
+        {
+            "xaxis": {**subplots["xaxis"], "tickangle": -45},
+            "xaxis2": {**subplots["xaxis2"], "tickangle": -45},
+            "yaxis": {**subplots["yaxis"], "title": {"text": "Total Time (hours)"}},
+            "yaxis2": {**subplots["yaxis2"], "title": {"text": "Avg Time per Week (hours)"}},
+            "annotations": subplots["annotations"],
+            "showlegend": False,
+            "margin": {"l": 20, "r": 20, "t": 20, "b": 20},
+        },
+    )["layout"]
+
 # -- DATA PROCESSING --
 
 def combine_task_metrics_subcat_agg(user_id: str) -> pd.DataFrame:
@@ -40,6 +100,19 @@ def combine_task_metrics_subcat_agg(user_id: str) -> pd.DataFrame:
 
 
 def get_task_summary_data(user_id: str) -> tuple[dict[str, Any], pd.DataFrame]:
+    """
+    Cached wrapper around `_compute_task_summary_data` (see there for the return contract).
+    Horizons are relative to today, so the cache key includes today's date.
+    """
+    return cached_result(
+        user_id,
+        "task_summary_data",
+        lambda: _compute_task_summary_data(user_id),
+        params=(dt.date.today().isoformat(),),
+    )
+
+
+def _compute_task_summary_data(user_id: str) -> tuple[dict[str, Any], pd.DataFrame]:
     """
     Returns:
       - data_store_return: dict keyed by horizon_days (int) with:
@@ -102,7 +175,8 @@ def get_task_summary_data(user_id: str) -> tuple[dict[str, Any], pd.DataFrame]:
                   .to_dict()
             if not df_cat.empty else {}
         )
-        by_category_hours = {k: float(v) for k, v in by_category_hours.items()}
+        # string keys: same shape the payload has after a JSON round-trip
+        by_category_hours = {str(k): float(v) for k, v in by_category_hours.items()}
 
         # ---- subcategory totals (hours), per category ----
         df_sub = _filter_horizon(base_df, days)
@@ -119,7 +193,7 @@ def get_task_summary_data(user_id: str) -> tuple[dict[str, Any], pd.DataFrame]:
             # build per-category dict with top 8 + Other
             for cat in sub_sums.index.get_level_values(0).unique():
                 s = sub_sums.loc[cat]
-                by_subcategory_hours[cat] = _top_n_plus_other(s, n=8, other_label="Other (grouped)")
+                by_subcategory_hours[str(cat)] = _top_n_plus_other(s, n=8, other_label="Other (grouped)")
 
         data_store_return[str(days)] = {
             "horizon_days": int(days),
@@ -142,222 +216,323 @@ def get_task_summary_data(user_id: str) -> tuple[dict[str, Any], pd.DataFrame]:
     return data_store_return, category_pivot
 
 
-def plot_ts(
+def prepare_category_ts(
     ts: pd.DataFrame,
-    category_dict: dict[str, str],
+    category_dict: dict[Any, str],
     do_smoothing: bool = True,
     roll_period: int = 7,
     smoothing_sigma: float = 1.5,
-) -> go.Figure:
+) -> pd.DataFrame:
     """
-    Plot a time series with optional rolling average and Gaussian smoothing.
+    Time-series preparation stage for `plot_ts`.
+
+    - Drops today (partial day).
+    - Reindexes onto a dense daily calendar with explicit zero-fill, so a
+      `roll_period`-day window always spans `roll_period` calendar days.
+    - Converts minutes to hours and applies the trailing rolling mean and the
+      Gaussian filter to the whole date x category array in one vectorized pass.
 
     Args:
-        ts (pd.DataFrame): Time series data with dates as the index and one or more columns to plot.
-        do_smoothing (bool): Whether to apply Gaussian smoothing after the rolling average.
-        roll_period (int): Number of days for the rolling average window.
-        smoothing_sigma (float): Sigma parameter for the Gaussian filter.
+        ts (pd.DataFrame): Wide frame with a `date` column and one minutes column per category id.
+        category_dict (dict): Category id -> display name (columns are renamed with it).
 
     Returns:
-        fig (plotly.graph_objects.Figure): A Plotly figure containing the smoothed time series plot.
-
-    Notes:
-        - Each column in `ts` is plotted as a separate line.
-        - Gaussian smoothing is applied using `scipy.ndimage.gaussian_filter1d`.
+        pd.DataFrame indexed by day (DatetimeIndex), one column of average daily hours per category.
     """
-    # Compute rolling average
     ts = ts[ts["date"] != dt.date.today()]
+    if ts.empty:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="date"))
+
+    ts = ts.set_index(pd.to_datetime(ts["date"])).drop(columns="date")
+    ts.index.name = "date"
+    ts.columns = ts.columns.map(lambda i: category_dict.get(i, category_dict.get(str(i), i)))
+
+    calendar = pd.date_range(ts.index.min(), ts.index.max(), freq="D", name="date")
+    ts = ts.reindex(calendar, fill_value=0)
 
-    ts = ts.set_index('date')
-    ts.columns = ts.columns.map(lambda i: category_dict.get(i, i))
-    ts = (ts/60).round(1)
+    hours = np.round(ts.to_numpy(dtype=float) / 60.0, 1)
 
-    ts_roll = ts.rolling(window=roll_period, min_periods=1).mean()
+    # Trailing mean over the window (min_periods=1) from cumulative sums
+    n_days = hours.shape[0]
+    csum = np.vstack([np.zeros((1, hours.shape[1])), np.cumsum(hours, axis=0)])
+    ends = np.arange(1, n_days + 1)
+    starts = np.maximum(ends - roll_period, 0)
+    rolled = (csum[ends] - csum[starts]) / (ends - starts)[:, None]
 
-    # Apply Gaussian smoothing (if enabled)
     if do_smoothing:
-        for col in ts_roll.columns:
-            ts_roll[col] = gaussian_filter1d(ts_roll[col], sigma=smoothing_sigma)
-
-    # Create Plotly figure
-    fig = go.Figure()
-    for col in ts_roll.columns:
-        fig.add_trace(go.Scatter(
-            x=ts_roll.index,
-            y=ts_roll[col],
-            mode="lines",
-            name=col
-        ))
-
-    # Customize layout
-    fig.update_layout(
-        title=None,
-        xaxis_title="Date",
-        yaxis_title="Average Daily Time (hours)",
-        template="plotly_white",
-        hovermode="x",
-        margin=dict(l=40, r=20, t=40, b=40)
-    )
+        # Imported here: scipy.ndimage is the slowest import in the app and only
+        # smoothed trend series need it
+        from scipy.ndimage import gaussian_filter1d
 
-    fig.update_yaxes(rangemode="tozero")
+        rolled = gaussian_filter1d(rolled, sigma=smoothing_sigma, axis=0)
 
-    return fig
+    return pd.DataFrame(rolled, index=calendar, columns=ts.columns)
 
 
-def plot_cat_from_store(
-    store_data: dict[str, Any],
-    category_dict: dict[str, str],
-    day_nums: str | int,
-    category_id: str | None = None,
-) -> go.Figure:
+def get_smoothed_category_ts(
+    user_id: str,
+    do_smoothing: bool = True,
+    roll_period: int = 7,
+    smoothing_sigma: float = 1.5,
+) -> pd.DataFrame:
+    """`prepare_category_ts` for the user's full history, cached per user and data version."""
+    def compute() -> pd.DataFrame:
+        _, category_ts = get_task_summary_data(user_id)
+        category_dict = load_category_id_to_name(user_id)
+        return prepare_category_ts(category_ts, category_dict, do_smoothing, roll_period, smoothing_sigma)
+
+    return cached_result(
+        user_id,
+        "smoothed_category_ts",
+        compute,
+        params=(dt.date.today().isoformat(), do_smoothing, roll_period, smoothing_sigma),
+    )
+
+
+def choose_rollup_grain(
+    start: dt.date,
+    end: dt.date,
+    resolution: str = "auto",
+    max_points: int = TS_POINTS_PER_TRACE,
+) -> RollupGrain:
     """
-    Plot total time and average weekly time from pre-aggregated datastore JSON.
-
-    This function operates entirely on precomputed aggregates stored in a dcc.Store.
-    No filtering, top-N logic, or aggregation is performed here.
-
-    Datastore contract
-    ------------------
-    store_data is expected to be keyed by `horizon_days`, including `-1` for "all time".
-
-    Each horizon entry must have the form:
-
-        store_data[days] = {
-            "horizon_days": int,
-            "days_present": int,
-            "by_category_hours": {
-                <category>: <total_hours>,
-                ...
-            },
-            "by_subcategory_hours": {
-                <category>: {
-                    <subcategory>: <total_hours>,
-                    ...
-                },
-                ...
-            }
-        }
+    Rollup level to read for a chart over [start, end].
 
-    Semantics
-    ---------
-    - Values are interpreted as *total hours* over the horizon.
-    - Average weekly time is computed as:
-          total_hours / days_present * 7
-    - Ordering is preserved as provided by the datastore.
-    - The label "Other (grouped)" is treated as a normal category/subcategory.
+    An explicit resolution is used as-is. For "auto", returns the finest grain
+    whose period count over the range fits in max_points, so long ranges read a
+    coarse level instead of downsampling daily rows.
+    """
+    if resolution != "auto":
+        return resolution  # type: ignore[return-value]
 
-    Args:
-        store_data (dict):
-            Pre-aggregated time summaries from dcc.Store.
-        day_nums (int):
-            Horizon key (e.g., 1, 7, 28, -1). `-1` denotes "all time".
-        category_id (str | None):
-            If None, plot category totals.
-            If provided, plot subcategory totals within this category.
+    span_days = max((end - start).days + 1, 1)
+    for grain in ROLLUP_GRAINS:
+        if span_days / _GRAIN_DAYS[grain] <= max_points:
+            return grain
+    return ROLLUP_GRAINS[-1]
+
+
+def get_rollup_ts(user_id: str, grain: RollupGrain) -> pd.DataFrame:
+    """
+    Average daily hours per category per period at `grain`, read from the rollup pyramid.
+
+    Rollups are caught up from change_log on a cache miss, i.e. once per data version.
+    Today (partial day) is excluded, as in `prepare_category_ts`.
 
     Returns:
-        plotly.graph_objects.Figure
+        pd.DataFrame indexed by period start (DatetimeIndex), one column per category name.
     """
-    horizon = store_data.get(str(day_nums))
-    if not horizon:
-        return go.Figure().update_layout(
-            title="No data available for the selected time window.",
-            template="plotly_white"
-        )
+    def compute() -> pd.DataFrame:
+        refresh_time_rollups(user_id)
+        today = dt.date.today()
+        category_dict = load_category_id_to_name(user_id)
+
+        df = load_time_rollups(user_id, grain)
+        df_today = load_time_rollups(user_id, "day", start_date=today, end_date=today)
+        if not df_today.empty:
+            # Back today's minutes out of the period that contains it
+            period_start = (
+                pd.Period(today, freq=_GRAIN_PERIOD_FREQ[grain]).start_time.date()
+                if grain != "day" else today
+            )
+            df_today = df_today.assign(period_start=period_start, total_minutes=-df_today["total_minutes"])
+            df = pd.concat([df, df_today], ignore_index=True)
 
-    days_present = int(horizon.get("days_present", 0) or 0)
-    if days_present <= 0:
-        return go.Figure().update_layout(
-            title="No data available in the selected time window.",
-            template="plotly_white"
-        )
+        if df.empty:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name="period_start"))
 
-    if category_id is None:
-        totals_raw = horizon.get("by_category_hours") or {}  # {"19": 0.7, "20": 2.8, ...}
+        df["period_start"] = pd.to_datetime(df["period_start"])
+        wide = df.pivot_table(
+            index="period_start",
+            columns="category_id",
+            values="total_minutes",
+            fill_value=0,
+            aggfunc="sum",
+        )
+        wide = wide[wide.index <= pd.Timestamp(today - dt.timedelta(days=1))]
+
+        # Days covered per period; the current period only counts days through yesterday
+        if grain == "day":
+            period_days = np.ones(len(wide.index))
+        else:
+            period_end = wide.index.to_period(_GRAIN_PERIOD_FREQ[grain]).end_time.normalize()
+            period_end = period_end.where(period_end < pd.Timestamp(today), pd.Timestamp(today - dt.timedelta(days=1)))
+            period_days = (period_end - wide.index).days.to_numpy() + 1
+
+        hours = wide.to_numpy(dtype=float) / 60.0 / period_days[:, None]
+        columns = wide.columns.map(lambda i: category_dict.get(i, category_dict.get(str(i), i)))
+        return pd.DataFrame(np.round(hours, 2), index=wide.index, columns=columns)
+
+    return cached_result(user_id, "rollup_ts", compute, params=(grain, dt.date.today().isoformat()))
+
+
+def build_rollup_ts_figure(
+    rollup_ts: pd.DataFrame,
+    grain: RollupGrain,
+    x_range: tuple[Any, Any] | None = None,
+) -> dict[str, Any]:
+    """Line figure spec for a `get_rollup_ts` frame (one point per period, no smoothing)."""
+    if x_range is not None:
+        start, end = pd.to_datetime(x_range[0]), pd.to_datetime(x_range[1])
+        margin = pd.Timedelta(days=_GRAIN_DAYS[grain])
+        rollup_ts = rollup_ts.loc[start - margin: end + margin]
+
+    dates = typed_array(epoch_ms(rollup_ts.index.to_numpy()), "float64")
+    data = [
+        {
+            "type": "scatter",
+            "mode": "lines+markers",
+            "name": str(col),
+            "x": dates,
+            "y": typed_array(rollup_ts[col].to_numpy()),
+        }
+        for col in rollup_ts.columns
+    ]
 
-        # 2) map to names
-        cat_map = {str(k): v for k, v in category_dict.items()}
+    xaxis = {**_TS_LAYOUT["xaxis"], "title": {"text": f"{grain.capitalize()} starting"}}
+    if x_range is not None:
+        xaxis["range"] = list(x_range)
+    return figure_spec(data, {**_TS_LAYOUT, "xaxis": xaxis})
 
-        totals_name = {cat_map.get(str(cid), None): val for cid, val in totals_raw.items()}
-        totals_name = {k: v for k, v in totals_name.items() if k is not None}
 
-        # 3) order by value desc
-        totals = dict(sorted(totals_name.items(), key=lambda kv: kv[1], reverse=True))
+def build_trends_ts_figure(
+    user_id: str,
+    resolution: str = "auto",
+    x_range: tuple[Any, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Time-series figure at the requested resolution over the visible window.
 
-        title_left = "Total time by category"
-        title_right = f"Average time per week by category (over {days_present} days)"
+    Daily resolution uses the smoothed daily series (`get_smoothed_category_ts`);
+    coarser resolutions read the matching rollup level directly.
+    """
+    if resolution == "auto":
+        if x_range is not None:
+            start = pd.to_datetime(x_range[0]).date()
+            end = pd.to_datetime(x_range[1]).date()
+        else:
+            history = get_rollup_ts(user_id, "year")
+            end = dt.date.today()
+            start = history.index.min().date() if not history.empty else end
+        grain = choose_rollup_grain(start, end)
     else:
-        totals = (
-            horizon
-            .get("by_subcategory_hours", {})
-            .get(category_id, {})
-        ) or {}
-
-        name = category_dict.get(category_id)
-        name = name.strip() if isinstance(name, str) else None
-        category_suffix = f" ({name})" if name else ""
-
-        title_left = f"Total time by subcategory{category_suffix}"
-        title_right = f"Average time per week by subcategory{category_suffix} (over {days_present} days)"
-
-    if not totals:
-        return go.Figure().update_layout(
-            title="No data available for the selected selection.",
-            template="plotly_white"
-        )
+        grain = choose_rollup_grain(dt.date.today(), dt.date.today(), resolution)
 
-    x = list(totals.keys())
-    y_total = [float(totals[k]) for k in x]
-    y_avg = [v / days_present * 7.0 for v in y_total]
+    if grain == "day":
+        return build_ts_figure(get_smoothed_category_ts(user_id), x_range=x_range)
+    return build_rollup_ts_figure(get_rollup_ts(user_id, grain), grain, x_range=x_range)
 
-    fig = make_subplots(
-        rows=1,
-        cols=2,
-        subplot_titles=[title_left, title_right]
-    )
 
-    fig.add_trace(
-        go.Bar(
-            x=x,
-            y=y_total,
-            text=[round(v, 1) for v in y_total],
-            textposition="outside",
-            name="Total Time",
-            marker_color="skyblue",
-        ),
-        row=1,
-        col=1
+def get_full_trends_ts_figure(user_id: str, resolution: str = "auto") -> dict[str, Any]:
+    """
+    `build_trends_ts_figure` over the full history, in the shared result cache so
+    a figure built by a background job serves every worker.
+    """
+    return cached_result(
+        user_id,
+        "trends_ts_figure",
+        lambda: build_trends_ts_figure(user_id, resolution),
+        params=(dt.date.today().isoformat(), resolution),
     )
 
-    fig.add_trace(
-        go.Bar(
-            x=x,
-            y=y_avg,
-            text=[round(v, 2) for v in y_avg],
-            textposition="outside",
-            name="Average Time",
-            marker_color="lightgreen",
-        ),
-        row=1,
-        col=2
-    )
 
-    if max(y_total) > 0:
-        fig.update_yaxes(range=[0, max(y_total) * 1.1], row=1, col=1)
-    if max(y_avg) > 0:
-        fig.update_yaxes(range=[0, max(y_avg) * 1.1], row=1, col=2)
-
-    fig.update_layout(
-        showlegend=False,
-        template="plotly_white",
-        margin=dict(l=20, r=20, t=20, b=20),
-        xaxis_tickangle=-45,
-        xaxis2_tickangle=-45,
-        title_text=None
-    )
+def plot_ts(
+    ts: pd.DataFrame,
+    category_dict: dict[str, str],
+    do_smoothing: bool = True,
+    roll_period: int = 7,
+    smoothing_sigma: float = 1.5,
+) -> dict[str, Any]:
+    """
+    Plot a time series with optional rolling average and Gaussian smoothing.
+
+    Args:
+        ts (pd.DataFrame): Time series data with a `date` column and one or more columns to plot.
+        do_smoothing (bool): Whether to apply Gaussian smoothing after the rolling average.
+        roll_period (int): Number of days for the rolling average window.
+        smoothing_sigma (float): Sigma parameter for the Gaussian filter.
+
+    Returns:
+        fig (dict): A Plotly figure spec containing the smoothed time series plot.
+
+    Notes:
+        - Preparation (dense calendar, rolling mean, smoothing) is done by `prepare_category_ts`.
+        - Each column in `ts` is plotted as a separate line.
+    """
+    ts_roll = prepare_category_ts(ts, category_dict, do_smoothing, roll_period, smoothing_sigma)
+    return build_ts_figure(ts_roll)
+
 
-    fig.update_xaxes(title=None)
-    fig.update_yaxes(title_text="Total Time (hours)", row=1, col=1)
-    fig.update_yaxes(title_text="Avg Time per Week (hours)", row=1, col=2)
+def minmax_downsample_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Min/max bucketing for a 2D (time x series) array.
+
+    Splits the time axis into max_points // 2 equal buckets and keeps the row of
+    each bucket's minimum and maximum per series (plus the first and last rows),
+    so peaks and troughs survive at a fixed point budget.
 
-    return fig
+    Returns:
+        (m, n_series) int array of row indices, ascending per column.
+    """
+    n_rows, n_series = values.shape
+    if n_rows <= max_points:
+        return np.repeat(np.arange(n_rows)[:, None], n_series, axis=1)
+
+    n_buckets = max(1, (max_points - 2) // 2)
+    size = -(-n_rows // n_buckets)  # ceil
+    padded = np.pad(values, ((0, n_buckets * size - n_rows), (0, 0)), mode="edge")
+    buckets = padded.reshape(n_buckets, size, n_series)
+
+    offsets = (np.arange(n_buckets) * size)[:, None]
+    lo = np.minimum(offsets + buckets.argmin(axis=1), n_rows - 1)
+    hi = np.minimum(offsets + buckets.argmax(axis=1), n_rows - 1)
+    picked = np.sort(np.stack([lo, hi], axis=1), axis=1).reshape(2 * n_buckets, n_series)
+
+    first = np.zeros((1, n_series), dtype=picked.dtype)
+    last = np.full((1, n_series), n_rows - 1, dtype=picked.dtype)
+    return np.vstack([first, picked, last])
+
+
+def build_ts_figure(
+    ts_roll: pd.DataFrame,
+    x_range: tuple[Any, Any] | None = None,
+    max_points: int = TS_POINTS_PER_TRACE,
+) -> dict[str, Any]:
+    """
+    Line figure spec for a prepared (see `prepare_category_ts`) time-series frame.
+
+    Each trace is downsampled to `max_points` (min/max bucketing) over the
+    visible window: the full history, or `x_range` when zoomed in. Traces
+    switch to WebGL above TS_WEBGL_POINT_THRESHOLD total points.
+    """
+    if x_range is not None:
+        start, end = pd.to_datetime(x_range[0]), pd.to_datetime(x_range[1])
+        # one day of margin so lines run to the window edges
+        ts_roll = ts_roll.loc[start - pd.Timedelta(days=1): end + pd.Timedelta(days=1)]
+
+    values = ts_roll.to_numpy(dtype=float)
+    idx = minmax_downsample_indices(values, max_points)
+    dates = epoch_ms(ts_roll.index.to_numpy())
+
+    trace_type = "scattergl" if idx.size > TS_WEBGL_POINT_THRESHOLD else "scatter"
+    # Not downsampled: rows are consecutive days, so x is just a start and a step
+    dense = len(dates) > 0 and idx.shape[0] == len(dates)
+
+    data = []
+    for j, col in enumerate(ts_roll.columns):
+        trace = {
+            "type": trace_type,
+            "mode": "lines",
+            "name": str(col),
+            "y": typed_array(values[idx[:, j], j]),
+        }
+        if dense:
+            trace.update(x0=float(dates[0]), dx=DAY_MS)
+        else:
+            trace["x"] = typed_array(dates[idx[:, j]], "float64")
+        data.append(trace)
+
+    layout = _TS_LAYOUT
+    if x_range is not None:
+        layout = {**_TS_LAYOUT, "xaxis": {**_TS_LAYOUT["xaxis"], "range": list(x_range)}}
+    return figure_spec(data, layout)
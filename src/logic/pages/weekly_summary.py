@@ -1,25 +1,92 @@
-from typing import Callable
+from datetime import date
+from typing import Any, Callable
 
-from dash import html
-import dash_bootstrap_components as dbc
+from dash import dash_table, html
+import numpy as np
 import pandas as pd
 
-def df_to_weekly_html_table(
+from src.cache.result_cache import cached_result
+from src.data_access.db import (
+    load_weekly_summary_minutes_by_day,
+    load_weekly_summary_table_dailies,
+)
+from src.layout.shared_components.tables import compact_table, row_rule
+
+
+def _normalize_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Ensure pivoted columns are `datetime.date` objects (not strings/Timestamps)."""
+    out = df.copy()
+    out.columns = pd.to_datetime(out.columns).date
+    return out
+
+
+def get_weekly_summary_frames(user_id: str, selected_start_date: date) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Cached weekly pivots for the 7 days starting at selected_start_date.
+
+    Returns:
+      - task_summary: minutes pivot (index=category_name, columns=dates)
+      - daily_summary: non-duration metrics pivot (index=display_name, columns=dates)
+    Both share the same sorted date columns.
+    """
+    return cached_result(
+        user_id,
+        "weekly_summary_frames",
+        lambda: _compute_weekly_summary_frames(user_id, selected_start_date),
+        params=(selected_start_date.isoformat(),),
+    )
+
+
+def _compute_weekly_summary_frames(user_id: str, selected_start_date: date) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # --- Tasks ---
+    task_query = load_weekly_summary_minutes_by_day(user_id, selected_start_date=selected_start_date)
+    task_summary = task_query.pivot_table(
+        index="category_name",
+        columns="date",
+        values="total_minutes",
+        aggfunc="sum",
+        fill_value=0,
+    )
+    task_summary = _normalize_date_columns(task_summary)
+
+    # --- Daily metrics ---
+    daily_query = load_weekly_summary_table_dailies(user_id, selected_start_date=selected_start_date)
+    daily_summary = daily_query.pivot_table(
+        index="display_name",
+        columns="date",
+        values="value_num",
+        aggfunc="sum",
+        fill_value=0,
+    )
+    daily_summary = _normalize_date_columns(daily_summary)
+
+    # --- Align date columns across both tables (union + sorted) ---
+    all_dates = sorted(set(task_summary.columns).union(daily_summary.columns))
+    task_summary = task_summary.reindex(columns=all_dates, fill_value=0)
+    daily_summary = daily_summary.reindex(columns=all_dates, fill_value=0)
+    return task_summary, daily_summary
+
+
+def df_to_weekly_table(
     df: pd.DataFrame,
     daily_metrics: pd.DataFrame,
-    fmt_minutes_fn: Callable[[float], str],          # e.g. fmt_h_m (minutes -> "1h 26m")
-    fmt_metric_fn: Callable[[float], str],           # e.g. fmt_int_display or lambda x: f"{to_int(x):,}"
+    fmt_minutes_fn: Callable[[Any], np.ndarray],     # e.g. format_hh_mm (minutes column -> "1:26")
+    fmt_metric_fn: Callable[[Any], np.ndarray],      # e.g. format_int (column -> "12,345")
     title: str | None = None,
     show_row_averages: bool = True,     # last column is "Average" (per row)
     show_bottom_totals: bool = True,    # bottom row is "Total" per day (sum across rows)
     highlight_rows: dict[str, dict] | None = None,  # e.g. {"Screen": {"color":"#b00020","fontWeight":"600"}}
     excluded_rows: list[str] | None = None,         # e.g. ["Screen", "Sleep"]
-) -> dbc.Table | html.Div | html.Small:
+    table_id: str = "weekly-summary-grid",
+) -> dash_table.DataTable | html.Div | html.Small:
     """
     df: pivoted minutes df (index=category/metric, columns=dates, values=minutes)
     daily_metrics: pivoted metrics df (index=metric_key, columns=dates, values=numeric), same date columns ideal
-    fmt_minutes_fn: formatter for minutes values in df
-    fmt_metric_fn: formatter for non-minute daily_metrics (e.g., steps)
+    fmt_minutes_fn: column formatter (see helpers/formatting.py) for minutes values in df
+    fmt_metric_fn: column formatter for non-minute daily_metrics (e.g., steps)
+
+    Rendered as one compact DataTable: each date column is a formatted array,
+    and totals/spacers/highlights are row style rules, not per-cell components.
     """
     if df is None or df.empty:
         return html.Small("No data available.", className="text-muted")
@@ -34,8 +101,6 @@ def df_to_weekly_html_table(
 
     # Daily metrics block (safe)
     df_metrics = daily_metrics.copy() if daily_metrics is not None else pd.DataFrame()
-    if df_metrics is None:
-        df_metrics = pd.DataFrame()
 
     # --- Align columns (dates) across all blocks, preserve df_top column order ---
     date_cols = list(df_top.columns)
@@ -56,118 +121,84 @@ def df_to_weekly_html_table(
         except Exception:
             col_labels.append(str(c))
 
-    # --- Header (only "Average" bold; everything else normal) ---
-    header_cells = [html.Th("", className="fw-normal")]
-    header_cells += [html.Th(lbl, className="text-end fw-normal") for lbl in col_labels]
-    if show_row_averages:
-        header_cells.append(html.Th("Average", className="text-end fw-bold"))
-    thead = html.Thead(html.Tr(header_cells))
-
-    # --- Totals/averages (TOP only) ---
-    top_row_avgs = df_top.mean(axis=1) if show_row_averages else None
-
-    # Bottom row = TOTAL per day (sum across top rows)
-    top_day_totals = df_top.sum(axis=0) if show_bottom_totals else None
-
-    # Bottom-right cell (under "Average" column) = average daily total (mean of day totals)
-    # If you'd prefer weekly total instead, use top_day_totals.sum()
-    bottom_right = float(top_day_totals.mean()) if (show_bottom_totals and show_row_averages) else None
-
-    # Bottom/context averages (not included in totals)
-    bottom_row_avgs = df_bottom.mean(axis=1) if (show_row_averages and not df_bottom.empty) else None
-
-    metrics_row_avgs = df_metrics.mean(axis=1) if (show_row_averages and not df_metrics.empty) else None
-
-    body_rows: list = []
-
-    def _row_style(name: str) -> dict:
-        style = {}
-        if highlight_rows and name in highlight_rows:
-            style.update(highlight_rows[name])
-        return style
-
-    # --- TOP rows ---
-    for idx, row in df_top.iterrows():
-        row_name = str(idx)
-        style = _row_style(row_name)
-
-        tds = [html.Td(row_name, style=style)]
-        for v in row.values:
-            tds.append(html.Td(fmt_minutes_fn(v), className="text-end", style=style))
-
-        if show_row_averages:
-            tds.append(html.Td(fmt_minutes_fn(top_row_avgs.loc[idx]), className="text-end fw-bold", style=style))
-
-        body_rows.append(html.Tr(tds))
+    n_dates = len(date_cols)
+    day_ids = [f"d{i}" for i in range(n_dates)]
+
+    # --- Assemble blocks as (labels, formatted day cells, formatted averages) ---
+    labels: list[str] = []
+    blocks: list[np.ndarray] = []
+    averages: list[np.ndarray] = []
+    spacer_rows: list[int] = []
+    total_row: int | None = None
+
+    def _append(block_labels: list[str], cells: np.ndarray, avgs: np.ndarray) -> list[int]:
+        start = len(labels)
+        labels.extend(block_labels)
+        blocks.append(cells.reshape(len(block_labels), n_dates))
+        averages.append(avgs)
+        return list(range(start, len(labels)))
+
+    def _spacer() -> None:
+        spacer_rows.extend(_append([""], np.full((1, n_dates), ""), np.array([""])))
+
+    top_rows = _append(
+        [str(i) for i in df_top.index],
+        fmt_minutes_fn(df_top.to_numpy()),
+        fmt_minutes_fn(df_top.mean(axis=1).to_numpy()),
+    )
 
-    # --- Bottom TOTAL row (per day) ---
+    # Bottom row = TOTAL per day (sum across top rows); its average is the mean daily total
     if show_bottom_totals:
-        total_cells = [html.Td("Total")]
-        total_cells += [html.Td(fmt_minutes_fn(v), className="text-end fw-bold") for v in top_day_totals.values]
-
-        if show_row_averages:
-            total_cells.append(html.Td(fmt_minutes_fn(bottom_right), className="text-end fw-bold"))
-
-        body_rows.append(
-            html.Tr(
-                total_cells,
-                style={"borderTop": "1px solid #ddd"},
-            )
-        )
-
-    # --- Spacer + Bottom/context rows (Screen/Sleep) ---
+        day_totals = df_top.sum(axis=0)
+        total_row = _append(
+            ["Total"],
+            fmt_minutes_fn(day_totals.to_numpy()),
+            fmt_minutes_fn([day_totals.mean()]),
+        )[0]
+
+    # Bottom/context rows (Screen/Sleep) and metrics (e.g., Steps) are not in the totals
     if not df_bottom.empty:
-        # Spacer row (keeps alignment)
-        spacer_tds = [html.Td("")]
-        spacer_tds += [html.Td("") for _ in date_cols]
-        if show_row_averages:
-            spacer_tds.append(html.Td(""))
-        body_rows.append(html.Tr(spacer_tds, style={"height": "2rem"}))
-
-        for idx, row in df_bottom.iterrows():
-            row_name = str(idx)
-            style = _row_style(row_name)
-
-            tds = [html.Td(row_name, style=style)]
-            for v in row.values:
-                tds.append(html.Td(fmt_minutes_fn(v), className="text-end", style=style))
-
-            if show_row_averages:
-                tds.append(html.Td(fmt_minutes_fn(bottom_row_avgs.loc[idx]), className="text-end", style=style))
-
-            body_rows.append(html.Tr(tds))
+        _spacer()
+        _append(
+            [str(i) for i in df_bottom.index],
+            fmt_minutes_fn(df_bottom.to_numpy()),
+            fmt_minutes_fn(df_bottom.mean(axis=1).to_numpy()),
+        )
 
-    # --- Spacer + Metrics block (e.g., Steps) ---
     if not df_metrics.empty:
-        spacer_tds = [html.Td("")]
-        spacer_tds += [html.Td("") for _ in date_cols]
-        if show_row_averages:
-            spacer_tds.append(html.Td(""))
-        body_rows.append(html.Tr(spacer_tds, style={"height": "2rem"}))
-
-        for idx, row in df_metrics.iterrows():
-            row_name = str(idx)
-            style = _row_style(row_name)
-
-            tds = [html.Td(row_name, style=style)]
-            for v in row.values:
-                tds.append(html.Td(fmt_metric_fn(v), className="text-end", style=style))
-
-            if show_row_averages:
-                tds.append(html.Td(fmt_metric_fn(metrics_row_avgs.loc[idx]), className="text-end", style=style))
-
-            body_rows.append(html.Tr(tds))
-
-    tbody = html.Tbody(body_rows)
+        _spacer()
+        _append(
+            [str(i) for i in df_metrics.index],
+            fmt_metric_fn(df_metrics.to_numpy()),
+            fmt_metric_fn(df_metrics.mean(axis=1).to_numpy()),
+        )
 
-    table = dbc.Table(
-        [thead, tbody],
-        bordered=False,
-        hover=True,
-        size="sm",
-        className="mb-0 weekly-summary-table",
-        responsive=True,
+    cells = np.vstack(blocks)
+    data = {"label": labels, **{day_id: cells[:, i].tolist() for i, day_id in enumerate(day_ids)}}
+    columns = [{"id": "label", "name": ""}]
+    columns += [{"id": day_id, "name": lbl, "align": "right"} for day_id, lbl in zip(day_ids, col_labels)]
+    if show_row_averages:
+        data["avg"] = np.concatenate(averages).tolist()
+        columns.append({"id": "avg", "name": "Average", "align": "right"})
 
+    value_ids = day_ids + (["avg"] if show_row_averages else [])
+    rules = [row_rule(spacer_rows, {"height": "2rem", "borderBottom": "none"})]
+    if show_row_averages:
+        rules.append(row_rule(top_rows, {"fontWeight": "600"}, column_ids=["avg"]))
+    if total_row is not None:
+        rules.append(row_rule([total_row], {"borderTop": "1px solid #ddd"}))
+        rules.append(row_rule([total_row], {"fontWeight": "600"}, column_ids=value_ids))
+    for name, style in (highlight_rows or {}).items():
+        rows = [i for i, label in enumerate(labels) if label == name]
+        if rows:
+            rules.append(row_rule(rows, style))
+
+    table = compact_table(
+        table_id,
+        columns,
+        data,
+        style_data_conditional=rules,
+        style_header_conditional=[{"if": {"column_id": "avg"}, "fontWeight": "600"}],
     )
 
     if title: